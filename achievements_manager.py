@@ -3,6 +3,8 @@ from tkinter import ttk
 import xml.etree.ElementTree as ET
 from typing import Dict, Optional
 from ui_components import LabeledInput
+from task_scheduler import populate_treeview
+from game_data import ACHIEVEMENTS
 import logging
 from custom_messagebox import MessageBoxManager, show_info, show_error, show_warning, ask_question, ask_ok_cancel, show_success
 
@@ -18,84 +20,7 @@ class AchievementsManager:
         self.search_var = tk.StringVar()
         
         # FIXED: Updated achievement data based on actual game files
-        self.achievement_data = {
-            # Developer/Debug Achievements
-            "3959147003": {"name": "Mission_ORouleau_1", "max": 1, "category": "Debug"},
-            "3975313082": {"name": "pin_z_dev_orouleau", "max": 1, "category": "Debug"},
-            "3887901362": {"name": "orowin", "max": 2, "category": "Debug"},
-            
-            # Story Achievements - RDA Path
-            "3614666474": {"name": "Orientation Day Graduate", "max": 1, "category": "Story"},
-            "1964522520": {"name": "War's Begun", "max": 1, "category": "Story"},
-            "820789492": {"name": "The First Harmonic", "max": 1, "category": "Story"},
-            "3708977241": {"name": "Harmonic in the FEBA", "max": 1, "category": "Story"},
-            "148645412": {"name": "Grave's Bog Harmonic", "max": 1, "category": "Story"},
-            "3177295287": {"name": "Hanging Gardens Mission", "max": 1, "category": "Story"},
-            "587544596": {"name": "Coualt Highlands Mission", "max": 1, "category": "Story"},
-            "1863714547": {"name": "RDA Tantalus Complete", "max": 1, "category": "Story"},
-            
-            # Story Achievements - Na'vi Path
-            "565628866": {"name": "Na'vi Blue Lagoon", "max": 1, "category": "Story"},
-            "1752941290": {"name": "Na'vi Tantalus Start", "max": 1, "category": "Story"},
-            "2793192431": {"name": "Na'vi Tantalus Mission", "max": 1, "category": "Story"},
-            "208366408": {"name": "Verdant Pinnacle", "max": 1, "category": "Story"},
-            "149358130": {"name": "Dust Bowl Mission", "max": 1, "category": "Story"},
-            "260134042": {"name": "Prolemuris Land", "max": 1, "category": "Story"},
-            "4216837213": {"name": "Vadera's Hollow", "max": 1, "category": "Story"},
-            "1791022025": {"name": "Deserted Heaven", "max": 1, "category": "Story"},
-            "2702278646": {"name": "Na'vi Tantalus Final", "max": 1, "category": "Story"},
-            
-            # Clean Sweep Achievements
-            "355473279": {"name": "Sebastien Clean Sweep", "max": 1, "category": "Completion"},
-            "2587251285": {"name": "Needle Hills Clean Sweep", "max": 1, "category": "Completion"},
-            "1172651822": {"name": "Philippe Clean Sweep", "max": 1, "category": "Completion"},
-            "1847852653": {"name": "Grave's Bog Clean Sweep", "max": 1, "category": "Completion"},
-            "2171723794": {"name": "Coualt Highlands Clean Sweep", "max": 1, "category": "Completion"},
-            "3409126972": {"name": "Plains of Goliath Clean Sweep", "max": 1, "category": "Completion"},
-            "2943222331": {"name": "Verdant Pinnacle Clean Sweep", "max": 1, "category": "Completion"},
-            "2292208788": {"name": "Dust Bowl Clean Sweep", "max": 1, "category": "Completion"},
-            "1057194188": {"name": "Vadera's Hollow Clean Sweep", "max": 1, "category": "Completion"},
-            "2856892107": {"name": "Nancy Clean Sweep", "max": 1, "category": "Completion"},
-            "238707229": {"name": "Pascal Clean Sweep", "max": 1, "category": "Completion"},
-            "1497753099": {"name": "Clean Sweep of Pandora", "max": 11, "category": "Completion"},
-            
-            # Progression Achievements
-            "704269734": {"name": "Claim 50% Territories", "max": 1, "category": "Progression"},
-            "2646580024": {"name": "Pandorapedia Articles", "max": 20, "category": "Collection"},
-            "2932051916": {"name": "Fallback Kills", "max": 100, "category": "Combat"},
-            
-            # Skill Achievements - Corporate
-            "3305899539": {"name": "Corporate Skill Slot 1A", "max": 20, "category": "Skills"},
-            "77959529": {"name": "Corporate Skill Slot 1B", "max": 20, "category": "Skills"},
-            "370163335": {"name": "Corporate Skill Slot 2B", "max": 20, "category": "Skills"},
-            "3619269117": {"name": "Corporate Skill Slot 2A", "max": 20, "category": "Skills"},
-            "1862651544": {"name": "Corporate Skill Slot 3A", "max": 20, "category": "Skills"},
-            "4073911841": {"name": "Corporate Skill Slot 4A", "max": 20, "category": "Skills"},
-            "863723867": {"name": "Corporate Skill Slot 4B", "max": 20, "category": "Skills"},
-            "2847917574": {"name": "Grade 4 Corporate Skills", "max": 7, "category": "Skills"},
-            
-            # Skill Achievements - Na'vi
-            "2171844251": {"name": "Na'vi Skill Slot 1A", "max": 20, "category": "Skills"},
-            "4154870226": {"name": "Na'vi Skill Slot 1B", "max": 20, "category": "Skills"},
-            "3843286588": {"name": "Na'vi Skill Slot 2B", "max": 20, "category": "Skills"},
-            "2167405524": {"name": "Na'vi Skill Slot 2A", "max": 20, "category": "Skills"},
-            "376364380": {"name": "Na'vi Skill Slot 3A", "max": 20, "category": "Skills"},
-            "611800566": {"name": "Na'vi Skill Slot 3P", "max": 20, "category": "Skills"},
-            "3229137376": {"name": "Na'vi Skill Slot 4A", "max": 20, "category": "Skills"},
-            "2479233397": {"name": "Na'vi Skill Slot 2A Alt", "max": 20, "category": "Skills"},
-            "1363959317": {"name": "Grade 4 Na'vi Skills", "max": 8, "category": "Skills"},
-            "1716177172": {"name": "Grade 4 All Skills", "max": 1, "category": "Skills"},
-            
-            # Multiplayer Achievements
-            "3049880868": {"name": "10 Kills in a Row", "max": 10, "category": "Multiplayer"},
-            "569487683": {"name": "Play 150 Matches", "max": 150, "category": "Multiplayer"},
-            "830999210": {"name": "Finish Match Most Kills", "max": 1, "category": "Multiplayer"},
-            "594996582": {"name": "Win 3-0 CTF", "max": 3, "category": "Multiplayer"},
-            "4203819019": {"name": "RDA 3 Intact Missiles", "max": 3, "category": "Multiplayer"},
-            "2779487515": {"name": "Na'vi Destroy All Missiles", "max": 1, "category": "Multiplayer"},
-            "4118326594": {"name": "Win 5 Capture & Hold", "max": 5, "category": "Multiplayer"},
-            "270754235": {"name": "Win 5 King of the Hill", "max": 5, "category": "Multiplayer"},
-        }
+        self.achievement_data = ACHIEVEMENTS
         
         self.setup_modern_ui()
 
@@ -371,10 +296,7 @@ class AchievementsManager:
         try:
             # Clear existing data
             self.achievement_data_dict = {}
-            
-            # Clear existing items in treeview
-            for item in self.achievements_tree.get_children():
-                self.achievements_tree.delete(item)
+            rows = []
 
             # Find all AchievementCounter elements
             achievements = tree.findall(".//AchievementCounter")
@@ -411,19 +333,23 @@ class AchievementsManager:
                     # Format progress
                     progress_text = f"{count}/{achievement_info['max']}"
                     
-                    # Insert into tree
-                    self.achievements_tree.insert("", tk.END, values=(
+                    # Queue tree row
+                    rows.append(((
                         status_icon,
                         achievement_info["name"],
                         achievement_info["category"],
                         progress_text,
                         achievement_id[-8:] if len(achievement_id) > 8 else achievement_id,
                         "View Details"
-                    ), tags=(tag,))
+                    ), (tag,)))
                     
                 except Exception as e:
                     self.logger.error(f"Error processing achievement {achievement_id}: {str(e)}", exc_info=True)
 
+            # Rows are inserted in time-sliced chunks so the window stays responsive
+            populate_treeview(getattr(self.main_window, 'scheduler', None), "achievements.rows",
+                              self.achievements_tree, rows)
+
             # Update all displays
             self._update_all_displays()
             
@@ -486,11 +412,8 @@ class AchievementsManager:
         filter_value = self.filter_var.get()
         search_text = self.search_var.get().lower()
         
-        # Clear and repopulate tree
-        for item in self.achievements_tree.get_children():
-            self.achievements_tree.delete(item)
-        
-        # Re-add filtered items
+        # Repopulate with the filtered items, inserted in time-sliced chunks
+        rows = []
         for achievement_id, achievement_data in self.achievement_data_dict.items():
             if self._should_show_achievement(achievement_id, achievement_data, filter_value, search_text):
                 status = self._determine_status(str(achievement_data['current']), achievement_data['max'])
@@ -498,14 +421,17 @@ class AchievementsManager:
                 
                 progress_text = f"{achievement_data['current']}/{achievement_data['max']}"
                 
-                self.achievements_tree.insert("", tk.END, values=(
+                rows.append(((
                     status_icon,
                     achievement_data['name'],
                     achievement_data['category'],
                     progress_text,
                     achievement_id[-8:] if len(achievement_id) > 8 else achievement_id,
                     "View Details"
-                ), tags=(tag,))
+                ), (tag,)))
+        
+        populate_treeview(getattr(self.main_window, 'scheduler', None), "achievements.rows",
+                          self.achievements_tree, rows)
 
     def _should_show_achievement(self, achievement_id, achievement_data, filter_value, search_text):
         """Determine if achievement should be shown based on filters"""
@@ -783,18 +709,19 @@ Completion Percentage: {progress_pct:.1f}%
         try:
             changes_made = False
             
-            for achievement_id, achievement_data in self.achievement_data_dict.items():
-                if achievement_data['current'] < achievement_data['max']:
-                    # Update data
-                    achievement_data['current'] = achievement_data['max']
-                    achievement_data['element'].set("count", str(achievement_data['max']))
-                    changes_made = True
+            with self.main_window.journal.transaction("Complete all achievements", "achievements", "AchievementCounter"):
+                for achievement_id, achievement_data in self.achievement_data_dict.items():
+                    if achievement_data['current'] < achievement_data['max']:
+                        # Update data
+                        achievement_data['current'] = achievement_data['max']
+                        self.main_window.journal.set(achievement_data['element'], "count", str(achievement_data['max']))
+                        changes_made = True
             
             if changes_made:
                 # Update the tree display
                 self._apply_filter()  # Refresh the display
                 self._update_all_displays()
-                self.main_window.unsaved_label.config(text="Unsaved Changes")
+                self.main_window.mark_dirty("achievements", "AchievementCounter")
                 show_success("Success", "🏆 All achievements have been completed!")
             else:
                 show_info("Info", "ℹ️ All achievements are already completed!")
@@ -813,25 +740,26 @@ Completion Percentage: {progress_pct:.1f}%
         try:
             changes_made = False
             
-            for item in selected_items:
-                values = self.achievements_tree.item(item, "values")
-                achievement_name = values[1]
+            with self.main_window.journal.transaction("Complete selected achievements", "achievements", "AchievementCounter"):
+                for item in selected_items:
+                    values = self.achievements_tree.item(item, "values")
+                    achievement_name = values[1]
                 
-                # Find the achievement data
-                for achievement_id, achievement_data in self.achievement_data_dict.items():
-                    if achievement_data['name'] == achievement_name:
-                        if achievement_data['current'] < achievement_data['max']:
-                            # Update data
-                            achievement_data['current'] = achievement_data['max']
-                            achievement_data['element'].set("count", str(achievement_data['max']))
-                            changes_made = True
-                        break
+                    # Find the achievement data
+                    for achievement_id, achievement_data in self.achievement_data_dict.items():
+                        if achievement_data['name'] == achievement_name:
+                            if achievement_data['current'] < achievement_data['max']:
+                                # Update data
+                                achievement_data['current'] = achievement_data['max']
+                                self.main_window.journal.set(achievement_data['element'], "count", str(achievement_data['max']))
+                                changes_made = True
+                            break
 
             if changes_made:
                 # Update the tree display
                 self._apply_filter()  # Refresh the display
                 self._update_all_displays()
-                self.main_window.unsaved_label.config(text="Unsaved Changes")
+                self.main_window.mark_dirty("achievements", "AchievementCounter")
                 show_success("Success", "✅ Selected achievements have been completed!")
             else:
                 show_info("Info", "ℹ️ Selected achievements are already completed!")
@@ -850,25 +778,26 @@ Completion Percentage: {progress_pct:.1f}%
         try:
             changes_made = False
             
-            for item in selected_items:
-                values = self.achievements_tree.item(item, "values")
-                achievement_name = values[1]
+            with self.main_window.journal.transaction("Reset selected achievements", "achievements", "AchievementCounter"):
+                for item in selected_items:
+                    values = self.achievements_tree.item(item, "values")
+                    achievement_name = values[1]
                 
-                # Find the achievement data
-                for achievement_id, achievement_data in self.achievement_data_dict.items():
-                    if achievement_data['name'] == achievement_name:
-                        if achievement_data['current'] > 0:
-                            # Update data
-                            achievement_data['current'] = 0
-                            achievement_data['element'].set("count", "0")
-                            changes_made = True
-                        break
+                    # Find the achievement data
+                    for achievement_id, achievement_data in self.achievement_data_dict.items():
+                        if achievement_data['name'] == achievement_name:
+                            if achievement_data['current'] > 0:
+                                # Update data
+                                achievement_data['current'] = 0
+                                self.main_window.journal.set(achievement_data['element'], "count", "0")
+                                changes_made = True
+                            break
 
             if changes_made:
                 # Update the tree display
                 self._apply_filter()  # Refresh the display
                 self._update_all_displays()
-                self.main_window.unsaved_label.config(text="Unsaved Changes")
+                self.main_window.mark_dirty("achievements", "AchievementCounter")
                 show_success("Success", "🔄 Selected achievements have been reset!")
             else:
                 show_info("Info", "ℹ️ Selected achievements are already at zero!")
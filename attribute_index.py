@@ -0,0 +1,123 @@
+import re
+import xml.etree.ElementTree as ET
+from xml.parsers import expat
+from typing import Dict, List, Optional, Tuple
+import logging
+
+
+class AttributeIndex:
+    """
+    Byte offsets of every attribute value in a save's XML, recorded at load.
+
+    The index lists elements in document order (the same order as
+    ``tree.getroot().iter()``) with, per attribute, the (start, end) byte span of
+    its raw value in the file and the value as parsed, plus the element's text
+    and tail. When every change made to the tree keeps each raw value the same
+    length, ``diff`` returns byte patches that can be applied to the original
+    file instead of re-serializing the tree.
+    """
+
+    START_MARKERS = [b'<Savegame', b'<SaveGame', b'<savegame', b'<SaveData']
+    END_MARKERS = [b'</Savegame>', b'</SaveGame>', b'</savegame>', b'</SaveData>']
+
+    START_TAG = re.compile(rb'<[^\s/>]+((?:\s+[^\s=/>]+\s*=\s*(?:"[^"]*"|\'[^\']*\'))*)\s*/?>')
+    ATTRIBUTE = re.compile(rb'([^\s=]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+
+    # Values containing these need escaping, so they are never patched in place
+    UNSAFE_CHARS = set('&<>"\'\n\r\t')
+
+    def __init__(self, entries: List[Tuple[str, Dict[str, Tuple[int, int, str]], Optional[str], Optional[str]]]):
+        self.entries = entries
+
+    @staticmethod
+    def get_logger():
+        return logging.getLogger('AttributeIndex')
+
+    @classmethod
+    def build(cls, data: bytes, tree: ET.ElementTree) -> Optional["AttributeIndex"]:
+        """Index the XML inside a save file; None if it can't be matched to the tree"""
+        logger = cls.get_logger()
+
+        xml_start = min((pos for pos in (data.find(m) for m in cls.START_MARKERS) if pos != -1), default=-1)
+        if xml_start == -1:
+            return None
+        xml_end = -1
+        for marker in cls.END_MARKERS:
+            pos = data.find(marker, xml_start)
+            if pos != -1:
+                xml_end = pos + len(marker)
+                break
+        if xml_end == -1:
+            return None
+
+        entries = []
+
+        def start_element(tag, attrib):
+            position = xml_start + parser.CurrentByteIndex
+            match = cls.START_TAG.match(data, position)
+            if match is None:
+                raise ValueError(f"Unrecognised start tag at byte {position}")
+            spans = {}
+            attr_start = match.start(1)
+            for attr in cls.ATTRIBUTE.finditer(match.group(1)):
+                group = 2 if attr.group(2) is not None else 3
+                name = attr.group(1).decode('utf-8')
+                spans[name] = (attr_start + attr.start(group), attr_start + attr.end(group), attrib.get(name))
+            entries.append([tag, spans])
+
+        parser = expat.ParserCreate()
+        parser.StartElementHandler = start_element
+        try:
+            parser.Parse(data[xml_start:xml_end], True)
+        except (expat.ExpatError, ValueError) as e:
+            logger.debug("Attribute index unavailable: %s", e)
+            return None
+
+        # The handlers parse the same bytes, so the element sequence must line up
+        elements = list(tree.getroot().iter())
+        if len(elements) != len(entries) or any(el.tag != tag for el, (tag, _) in zip(elements, entries)):
+            logger.debug("Attribute index does not match the parsed tree, not using it")
+            return None
+        # Text isn't patched in place, only compared: the tree holds it as parsed from these bytes
+        entries = [(tag, spans, element.text, element.tail) for element, (tag, spans) in zip(elements, entries)]
+
+        logger.debug("Indexed %d elements", len(entries))
+        return cls(entries)
+
+    def diff(self, tree: ET.ElementTree, data: bytes) -> Optional[List[Tuple[int, bytes]]]:
+        """
+        Byte patches turning data into the serialized tree, or None when some change
+        is not a same-length attribute value edit (added/removed elements or
+        attributes, text changes, length changes, values needing escaping).
+        """
+        elements = list(tree.getroot().iter())
+        if len(elements) != len(self.entries):
+            return None
+
+        patches = []
+        for element, (tag, spans, text, tail) in zip(elements, self.entries):
+            if (element.tag != tag or len(element.attrib) != len(spans)
+                    or element.text != text or element.tail != tail):
+                return None
+            for name, value in element.attrib.items():
+                span = spans.get(name)
+                if span is None:
+                    return None
+                start, end, original = span
+                if value == original:
+                    continue
+                if self.UNSAFE_CHARS.intersection(value):
+                    return None
+                raw = value.encode('utf-8')
+                if len(raw) != end - start:
+                    return None
+                if data[start:end] != raw:
+                    patches.append((start, raw))
+        return patches
+
+    @staticmethod
+    def apply(data: bytes, patches: List[Tuple[int, bytes]]) -> bytes:
+        patched = bytearray(data)
+        for start, raw in patches:
+            patched[start:start + len(raw)] = raw
+        return bytes(patched)
@@ -0,0 +1,142 @@
+import queue
+import threading
+from typing import Any, Callable, List, Optional
+import logging
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when it has been cancelled"""
+    pass
+
+
+class Job:
+    """A unit of work run on the worker thread"""
+
+    def __init__(self, worker: "BackgroundWorker", name: str, func: Callable[["Job"], Any],
+                 on_success: Optional[Callable[[Any], None]] = None,
+                 on_error: Optional[Callable[[Exception], None]] = None,
+                 on_progress: Optional[Callable[[float, str], None]] = None):
+        self.worker = worker
+        self.name = name
+        self.func = func
+        self.on_success = on_success
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self._cancel_event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+    def report(self, fraction: float, text: str = "") -> None:
+        """Report progress from the worker thread; also the job's cancellation point"""
+        if self.cancelled:
+            raise JobCancelled(self.name)
+        self.worker._results.put(("progress", self, (fraction, text)))
+
+
+class BackgroundWorker:
+    """
+    Runs blocking jobs (file I/O, parsing, checksums, backups) on a single worker
+    thread so the Tk main loop stays responsive.
+
+    Jobs run one at a time in submission order. Their callbacks are always invoked
+    on the Tk main thread: results are put on a queue that is polled with
+    root.after while jobs are pending. A cancelled job's result is discarded.
+    """
+
+    def __init__(self, root, poll_interval_ms: int = 30, name: str = "SaveEditorWorker"):
+        self.logger = logging.getLogger('BackgroundWorker')
+        self.root = root
+        self.poll_interval_ms = poll_interval_ms
+        self._jobs: "queue.Queue[Optional[Job]]" = queue.Queue()
+        self._results: "queue.Queue[tuple]" = queue.Queue()
+        self._pending: List[Job] = []
+        self._poll_id = None
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._pending)
+
+    def is_running(self, name: str) -> bool:
+        return any(job.name == name and not job.cancelled for job in self._pending)
+
+    def submit(self, name: str, func: Callable[[Job], Any],
+               on_success: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[Exception], None]] = None,
+               on_progress: Optional[Callable[[float, str], None]] = None) -> Job:
+        """Queue func(job) for the worker thread"""
+        job = Job(self, name, func, on_success, on_error, on_progress)
+        self._pending.append(job)
+        self._jobs.put(job)
+        self.logger.debug("Submitted job %s", name)
+        if self._poll_id is None:
+            self._poll_id = self.root.after(self.poll_interval_ms, self._poll)
+        return job
+
+    def cancel(self, name: str) -> int:
+        """Cancel every pending or running job with the given name"""
+        cancelled = 0
+        for job in self._pending:
+            if job.name == name and not job.cancelled:
+                job.cancel()
+                cancelled += 1
+        if cancelled:
+            self.logger.debug("Cancelled %d %s job(s)", cancelled, name)
+        return cancelled
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker thread, optionally waiting for queued jobs to finish"""
+        self._jobs.put(None)
+        if wait:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            if job.cancelled:
+                self._results.put(("cancelled", job, None))
+                continue
+            try:
+                self._results.put(("done", job, job.func(job)))
+            except JobCancelled:
+                self._results.put(("cancelled", job, None))
+            except Exception as e:
+                self.logger.error("Job %s failed: %s", job.name, e, exc_info=True)
+                self._results.put(("error", job, e))
+
+    def _poll(self) -> None:
+        """Deliver worker results on the main thread"""
+        self._poll_id = None
+        while True:
+            try:
+                kind, job, payload = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind != "progress" and job in self._pending:
+                self._pending.remove(job)
+            if job.cancelled:
+                if kind != "progress":
+                    self.logger.debug("Discarded result of cancelled job %s", job.name)
+                continue
+
+            try:
+                if kind == "progress" and job.on_progress:
+                    job.on_progress(*payload)
+                elif kind == "done" and job.on_success:
+                    job.on_success(payload)
+                elif kind == "error" and job.on_error:
+                    job.on_error(payload)
+            except Exception as e:
+                self.logger.error("Callback for job %s failed: %s", job.name, e, exc_info=True)
+
+        if self._pending:
+            self._poll_id = self.root.after(self.poll_interval_ms, self._poll)
@@ -0,0 +1,412 @@
+import difflib
+import hashlib
+import json
+import lzma
+import os
+import re
+import struct
+import time
+import zlib
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+import logging
+
+
+class BackupStore:
+    """
+    Content-addressed, compressed backup store.
+
+    Layout (one folder per character):
+        <root>/<character>/manifest.json
+        <root>/<character>/objects/<sha[:2]>/<sha>.<xz|zz>
+
+    Every backup entry maps the save's file names to blob digests, so identical
+    saves (or the untouched PADDING.000 of a PS3 save) are stored once. Retention
+    and disk usage are computed from the manifest instead of scanning folders.
+
+    In delta mode a blob may be stored as copy/insert operations against the
+    same file in the previous backup. Chains are capped at rebase_interval
+    deltas, after which a full snapshot is stored again.
+    """
+
+    MANIFEST_NAME = "manifest.json"
+    MANIFEST_VERSION = 1
+    COMPRESSORS = {
+        'lzma': ('xz', lambda data: lzma.compress(data, preset=6), lzma.decompress),
+        'zlib': ('zz', lambda data: zlib.compress(data, 6), zlib.decompress),
+        'none': ('bin', bytes, bytes),
+    }
+
+    # Saves are tokenized at every '>' so XML edits align on element boundaries; NUL
+    # padding is cut into fixed runs so a shifted XML end only changes the last run
+    DELTA_TOKEN = re.compile(rb'\x00{1,4096}|[^>\x00]*>|[^>\x00]+')
+    DELTA_COPY = b'C'
+    DELTA_INSERT = b'I'
+
+    # Backups of editor versions before the store: Save Backups/<character>/12-19-2024_02-30-45_PM/
+    LEGACY_FOLDER = "Save Backups"
+    LEGACY_TIMESTAMP = "%m-%d-%Y_%I-%M-%S_%p"
+
+    LOCK_NAME = "manifest.lock"
+    LOCK_STALE_SECONDS = 60
+
+    def __init__(self, root: Path, compression: str = "lzma", delta: bool = False, rebase_interval: int = 8):
+        self.logger = logging.getLogger('BackupStore')
+        self.root = Path(root)
+        if compression not in self.COMPRESSORS:
+            self.logger.warning("Unknown backup compression %r, using lzma", compression)
+            compression = "lzma"
+        self.compression = compression
+        self.delta = delta
+        self.rebase_interval = max(1, rebase_interval)
+        self._recent: Dict[str, bytes] = {}  # digest -> contents of the latest backup, spares a chain rebuild
+
+    # ------------------------------------------------------------------ manifest
+
+    def character_dir(self, character: str) -> Path:
+        return self.root / character
+
+    def load_manifest(self, character: str) -> Dict:
+        manifest_path = self.character_dir(character) / self.MANIFEST_NAME
+        if manifest_path.exists():
+            try:
+                with open(manifest_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                self.logger.error("Could not read backup manifest %s: %s", manifest_path, e)
+        return {'version': self.MANIFEST_VERSION, 'character': character, 'blobs': {}, 'entries': []}
+
+    def _write_manifest(self, character: str, manifest: Dict) -> None:
+        character_dir = self.character_dir(character)
+        character_dir.mkdir(parents=True, exist_ok=True)
+        manifest_path = character_dir / self.MANIFEST_NAME
+        temp_path = manifest_path.with_suffix('.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(temp_path, manifest_path)
+
+    @contextmanager
+    def _locked(self, character: str):
+        """
+        Hold the character's manifest lock across processes, so CLI batch workers
+        and the editor don't drop each other's entries. A lock older than
+        LOCK_STALE_SECONDS was left by a crashed process and is taken over.
+        """
+        character_dir = self.character_dir(character)
+        character_dir.mkdir(parents=True, exist_ok=True)
+        lock_path = character_dir / self.LOCK_NAME
+        while True:
+            try:
+                os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - lock_path.stat().st_mtime > self.LOCK_STALE_SECONDS:
+                        self.logger.warning("Taking over stale backup lock %s", lock_path)
+                        lock_path.unlink()
+                        continue
+                except FileNotFoundError:
+                    continue
+                time.sleep(0.05)
+        try:
+            yield
+        finally:
+            lock_path.unlink(missing_ok=True)
+
+    def entries(self, character: str) -> List[Dict]:
+        """Backup entries for a character, oldest first"""
+        return self.load_manifest(character)['entries']
+
+    def characters(self) -> List[str]:
+        if not self.root.exists():
+            return []
+        return sorted(p.name for p in self.root.iterdir() if (p / self.MANIFEST_NAME).exists())
+
+    # --------------------------------------------------------------------- blobs
+
+    def _blob_path(self, character: str, digest: str, compression: str) -> Path:
+        extension = self.COMPRESSORS[compression][0]
+        return self.character_dir(character) / "objects" / digest[:2] / f"{digest}.{extension}"
+
+    def _store_blob(self, character: str, manifest: Dict, data: bytes, base_digest: Optional[str] = None) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        if digest in manifest['blobs']:
+            return digest
+
+        _, compress, _ = self.COMPRESSORS[self.compression]
+        info = {'size': len(data), 'compression': self.compression}
+        raw = data
+
+        if self.delta and base_digest in manifest['blobs']:
+            depth = manifest['blobs'][base_digest].get('depth', 0) + 1
+            if depth <= self.rebase_interval:
+                base_data = self._recent.get(base_digest)
+                if base_data is None:
+                    base_data = self.read_blob(character, base_digest, manifest)
+                delta = self.encode_delta(base_data, data)
+                if len(delta) < len(data) // 2:
+                    raw = delta
+                    info.update(base=base_digest, depth=depth)
+
+        payload = compress(raw)
+        blob_path = self._blob_path(character, digest, self.compression)
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(blob_path, 'wb') as f:
+            f.write(payload)
+
+        info['stored_size'] = len(payload)
+        manifest['blobs'][digest] = info
+        self.logger.debug("Stored %s blob %s (%d -> %d bytes)", 'delta' if 'base' in info else 'full',
+                          digest[:12], len(data), len(payload))
+        return digest
+
+    def _read_payload(self, character: str, digest: str, info: Dict) -> bytes:
+        _, _, decompress = self.COMPRESSORS[info['compression']]
+        with open(self._blob_path(character, digest, info['compression']), 'rb') as f:
+            return decompress(f.read())
+
+    def read_blob(self, character: str, digest: str, manifest: Optional[Dict] = None) -> bytes:
+        """Rebuild a blob's contents, applying its delta chain from the nearest full snapshot"""
+        manifest = manifest or self.load_manifest(character)
+        chain = []
+        while True:
+            if digest in self._recent:
+                data = self._recent[digest]
+                break
+            info = manifest['blobs'][digest]
+            payload = self._read_payload(character, digest, info)
+            if 'base' not in info:
+                data = payload
+                break
+            chain.append(payload)
+            digest = info['base']
+
+        for delta in reversed(chain):
+            data = self.apply_delta(data, delta)
+        return data
+
+    # --------------------------------------------------------------------- delta
+
+    @classmethod
+    def encode_delta(cls, base: bytes, target: bytes) -> bytes:
+        """Encode target as copy-from-base / insert-literal records"""
+        base_tokens = cls.DELTA_TOKEN.findall(base)
+        target_tokens = cls.DELTA_TOKEN.findall(target)
+        base_offsets = [0]
+        for token in base_tokens:
+            base_offsets.append(base_offsets[-1] + len(token))
+        target_offsets = [0]
+        for token in target_tokens:
+            target_offsets.append(target_offsets[-1] + len(token))
+
+        out = bytearray()
+        matcher = difflib.SequenceMatcher(None, base_tokens, target_tokens, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == 'equal':
+                start = base_offsets[i1]
+                out += cls.DELTA_COPY + struct.pack('<II', start, base_offsets[i2] - start)
+            elif j2 > j1:
+                literal = target[target_offsets[j1]:target_offsets[j2]]
+                out += cls.DELTA_INSERT + struct.pack('<I', len(literal)) + literal
+        return bytes(out)
+
+    @classmethod
+    def apply_delta(cls, base: bytes, delta: bytes) -> bytes:
+        out = bytearray()
+        pos = 0
+        while pos < len(delta):
+            op = delta[pos:pos + 1]
+            if op == cls.DELTA_COPY:
+                start, length = struct.unpack_from('<II', delta, pos + 1)
+                out += base[start:start + length]
+                pos += 9
+            elif op == cls.DELTA_INSERT:
+                (length,) = struct.unpack_from('<I', delta, pos + 1)
+                out += delta[pos + 5:pos + 5 + length]
+                pos += 5 + length
+            else:
+                raise ValueError(f"Corrupt backup delta record at offset {pos}")
+        return bytes(out)
+
+    # ------------------------------------------------------------------- backups
+
+    def add(self, character: str, files: Dict[str, bytes], timestamp: Optional[datetime] = None) -> Dict:
+        """
+        Record a backup of the given {file name: contents}.
+
+        If the newest entry already holds exactly the same contents, it is
+        returned unchanged instead of adding a duplicate entry.
+        """
+        with self._locked(character):
+            return self._add(character, files, timestamp)
+
+    def _add(self, character: str, files: Dict[str, bytes], timestamp: Optional[datetime]) -> Dict:
+        manifest = self.load_manifest(character)
+        previous = manifest['entries'][-1]['files'] if manifest['entries'] else {}
+        file_digests = {name: self._store_blob(character, manifest, data, previous.get(name))
+                        for name, data in files.items()}
+        self._recent = {digest: files[name] for name, digest in file_digests.items()}
+
+        if manifest['entries'] and manifest['entries'][-1]['files'] == file_digests:
+            self.logger.debug("Backup for %s identical to the previous one, not duplicated", character)
+            self._write_manifest(character, manifest)
+            return manifest['entries'][-1]
+
+        timestamp = timestamp or datetime.now()
+        entry = {
+            'id': timestamp.strftime("%Y%m%d_%H%M%S_%f"),
+            'timestamp': timestamp.isoformat(timespec='seconds'),
+            'files': file_digests,
+        }
+        manifest['entries'].append(entry)
+        self._write_manifest(character, manifest)
+        self.logger.debug("Backup %s recorded for %s", entry['id'], character)
+        return entry
+
+    def import_legacy(self, legacy_root: Path) -> int:
+        """
+        Import the timestamp folders older versions of the editor wrote
+        (<legacy_root>/<character>/<LEGACY_TIMESTAMP>/<save files>) as entries,
+        in timestamp order with the existing ones. The imported folder names are
+        kept in the manifest apart from the entries, so folders whose entries were
+        pruned since are not imported again and this can run at every start; the
+        folders are left as they are.
+        Returns the number of entries added.
+        """
+        legacy_root = Path(legacy_root)
+        if not legacy_root.is_dir():
+            return 0
+        added = 0
+        for character_dir in sorted(p for p in legacy_root.iterdir() if p.is_dir()):
+            folders = []
+            for folder in character_dir.iterdir():
+                try:
+                    folders.append((datetime.strptime(folder.name, self.LEGACY_TIMESTAMP), folder))
+                except ValueError:
+                    continue  # objects/ of a store sharing the folder, or anything else
+            if not folders:
+                continue
+
+            with self._locked(character_dir.name):
+                added += self._import_legacy_folders(character_dir.name, folders)
+        return added
+
+    def _import_legacy_folders(self, character: str, folders: List[tuple]) -> int:
+        manifest = self.load_manifest(character)
+        imported = manifest.setdefault('imported_legacy', [])
+        # Entries imported before the list existed carry their folder name
+        imported.extend(sorted({entry['legacy'] for entry in manifest['entries'] if 'legacy' in entry}
+                               - set(imported)))
+        skip = set(imported)
+        count = 0
+        for timestamp, folder in sorted(folders):
+            if folder.name in skip or not folder.is_dir():
+                continue
+            try:
+                files = {}
+                for path in folder.iterdir():
+                    if path.is_file():
+                        with open(path, 'rb') as f:
+                            files[path.name] = f.read()
+            except OSError as e:
+                self.logger.warning("Could not import legacy backup %s: %s", folder, e)
+                continue
+            if not files:
+                continue
+            manifest['entries'].append({
+                'id': timestamp.strftime("%Y%m%d_%H%M%S_%f"),
+                'timestamp': timestamp.isoformat(timespec='seconds'),
+                'files': {name: self._store_blob(character, manifest, data) for name, data in files.items()},
+                'legacy': folder.name,
+            })
+            imported.append(folder.name)
+            count += 1
+        if count:
+            manifest['entries'].sort(key=lambda entry: entry['timestamp'])
+            self._write_manifest(character, manifest)
+            self.logger.info("Imported %d legacy backups of %s", count, character)
+        return count
+
+    def find_entry(self, character: str, entry_id: str) -> Optional[Dict]:
+        return next((e for e in self.entries(character) if e['id'] == entry_id), None)
+
+    def restore(self, character: str, entry_id: str) -> Dict[str, bytes]:
+        """Return the {file name: contents} of a backup entry"""
+        manifest = self.load_manifest(character)
+        entry = next((e for e in manifest['entries'] if e['id'] == entry_id), None)
+        if entry is None:
+            raise KeyError(f"No backup {entry_id} for {character}")
+        return {name: self.read_blob(character, digest, manifest) for name, digest in entry['files'].items()}
+
+    def restore_to(self, character: str, entry_id: str, target_dir: Path) -> List[Path]:
+        """Write a backup entry's files into target_dir"""
+        target_dir = Path(target_dir)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        written = []
+        for name, data in self.restore(character, entry_id).items():
+            path = target_dir / name
+            with open(path, 'wb') as f:
+                f.write(data)
+            written.append(path)
+        return written
+
+    def prune(self, character: str, max_backups: int) -> int:
+        """
+        Keep only the newest max_backups entries and delete blobs no longer referenced.
+        Deltas whose base is being deleted are rewritten as full snapshots first.
+        """
+        with self._locked(character):
+            return self._prune(character, max_backups)
+
+    def _prune(self, character: str, max_backups: int) -> int:
+        manifest = self.load_manifest(character)
+        removed = len(manifest['entries']) - max_backups
+        if max_backups <= 0 or removed <= 0:
+            return 0
+
+        manifest['entries'] = manifest['entries'][removed:]
+        referenced = {digest for entry in manifest['entries'] for digest in entry['files'].values()}
+        self._rematerialize(character, manifest, referenced)
+        for digest in [d for d in manifest['blobs'] if d not in referenced]:
+            info = manifest['blobs'].pop(digest)
+            try:
+                self._blob_path(character, digest, info['compression']).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.logger.warning("Could not remove backup blob %s: %s", digest[:12], e)
+
+        self._write_manifest(character, manifest)
+        self.logger.debug("Pruned %d old backups for %s", removed, character)
+        return removed
+
+    def _rematerialize(self, character: str, manifest: Dict, keep: set) -> None:
+        """Store kept delta blobs whose base is not kept as full snapshots"""
+        orphans = [d for d in keep if manifest['blobs'][d].get('base') not in (None, *keep)]
+        rebuilt = {digest: self.read_blob(character, digest, manifest) for digest in orphans}
+        _, compress, _ = self.COMPRESSORS[self.compression]
+        for digest, data in rebuilt.items():
+            old_info = manifest['blobs'][digest]
+            payload = compress(data)
+            temp_path = self._blob_path(character, digest, self.compression).with_suffix('.tmp')
+            with open(temp_path, 'wb') as f:
+                f.write(payload)
+            old_path = self._blob_path(character, digest, old_info['compression'])
+            new_path = self._blob_path(character, digest, self.compression)
+            os.replace(temp_path, new_path)
+            if old_path != new_path:
+                old_path.unlink(missing_ok=True)
+            manifest['blobs'][digest] = {'size': len(data), 'compression': self.compression,
+                                         'stored_size': len(payload)}
+            self.logger.debug("Rebased blob %s to a full snapshot", digest[:12])
+
+    def usage(self, character: str) -> Dict[str, int]:
+        """Original and on-disk byte totals for a character's backups"""
+        manifest = self.load_manifest(character)
+        logical = 0
+        for entry in manifest['entries']:
+            logical += sum(manifest['blobs'][d]['size'] for d in entry['files'].values())
+        stored = sum(info['stored_size'] for info in manifest['blobs'].values())
+        return {'entries': len(manifest['entries']), 'logical_bytes': logical, 'stored_bytes': stored}
@@ -0,0 +1,107 @@
+import json
+import os
+from typing import Dict, List, Optional
+from xml.parsers import expat
+import logging
+
+from backup_store import BackupStore
+from save_library import summarize_save
+
+
+# Progress values tracked across backups: (summary key, column heading)
+TIMELINE_METRICS = [
+    ('level', "Level"),
+    ('eps', "EPs"),
+    ('total_ep', "Total EP"),
+    ('territories_owned', "Territories"),
+    ('pins_unlocked', "Pins"),
+    ('achievements_started', "Achievements"),
+    ('pedia_known', "Pedia"),
+    ('played_time', "Played"),
+]
+
+
+def save_file_name(files: Dict[str, str]) -> Optional[str]:
+    """The file of a backup entry holding the save data (PS3 backups also hold PADDING.000)"""
+    return next((name for name in files if name != "PADDING.000"), None)
+
+
+def progress_deltas(previous: Dict, current: Dict) -> Dict[str, int]:
+    """Change of each tracked value from one timeline point to the next (changed values only)"""
+    deltas = {}
+    for key, _ in TIMELINE_METRICS:
+        if previous.get(key) is not None and current.get(key) is not None and previous[key] != current[key]:
+            deltas[key] = current[key] - previous[key]
+    return deltas
+
+
+class BackupTimeline:
+    """
+    Progress of a character over its backup history, read from the backup
+    store's manifest. Each backed-up save is summarized once; summaries are
+    cached by blob digest next to the manifest, so after a new backup only
+    that one save is parsed.
+    """
+
+    CACHE_NAME = "timeline.json"
+    CACHE_VERSION = 1
+
+    def __init__(self, store: BackupStore):
+        self.logger = logging.getLogger('BackupTimeline')
+        self.store = store
+
+    def _cache_path(self, character: str):
+        return self.store.character_dir(character) / self.CACHE_NAME
+
+    def _load_cache(self, character: str) -> Dict[str, Dict]:
+        try:
+            with open(self._cache_path(character), 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning("Ignoring unreadable timeline cache for %s: %s", character, e)
+            return {}
+        if cache.get('version') != self.CACHE_VERSION:
+            return {}
+        return cache.get('summaries', {})
+
+    def _write_cache(self, character: str, summaries: Dict[str, Dict]) -> None:
+        cache_path = self._cache_path(character)
+        temp_path = cache_path.with_suffix('.tmp')
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.CACHE_VERSION, 'summaries': summaries}, f)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            self.logger.warning("Could not write timeline cache for %s: %s", character, e)
+
+    def build(self, character: str) -> List[Dict]:
+        """One point per backup entry, oldest first: id, timestamp, digest and the save's summary values"""
+        manifest = self.store.load_manifest(character)
+        cache = self._load_cache(character)
+        points = []
+        parsed = 0
+
+        for entry in manifest['entries']:
+            name = save_file_name(entry['files'])
+            if name is None:
+                continue
+            digest = entry['files'][name]
+            summary = cache.get(digest)
+            if summary is None:
+                try:
+                    summary = summarize_save(self.store.read_blob(character, digest, manifest))
+                except (OSError, KeyError, ValueError, expat.ExpatError) as e:
+                    self.logger.error("Could not summarize backup %s of %s: %s", entry['id'], character, e)
+                    summary = {'error': str(e)}
+                cache[digest] = summary
+                parsed += 1
+            points.append({'id': entry['id'], 'timestamp': entry['timestamp'], 'digest': digest, **summary})
+
+        # Drop summaries of pruned backups
+        keep = {point['digest'] for point in points}
+        if parsed or cache.keys() - keep:
+            self._write_cache(character, {digest: cache[digest] for digest in keep})
+        self.logger.debug("Timeline of %s: %d backups, %d parsed", character, len(points), parsed)
+        return points
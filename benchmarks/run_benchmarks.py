@@ -0,0 +1,244 @@
+"""
+Benchmark harness for the save handlers and managers.
+
+Generates synthetic Xbox, PC and PS3 saves (see save_generator.py), then times
+each handler's load, verify, save and pretty-print paths and, when a display is
+available, each manager's load_* data build. The startup import of legacy
+backups is timed after an import and prune, and fails if pruned backups are
+imported again. Results are written as JSON so runs
+from different commits can be compared.
+
+Usage:
+    python benchmarks/run_benchmarks.py --scale 1 --repeat 5
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/<old>.json
+"""
+import argparse
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backup_store import BackupStore
+from save_generator import SaveScale, write_fixtures
+from xml_handler import XMLHandler
+from pc_xml_handler import PCXMLHandler
+from ps3_xml_handler import PS3XMLHandler
+
+HANDLERS = {
+    'xbox': XMLHandler,
+    'pc': PCXMLHandler,
+    'ps3': PS3XMLHandler,
+}
+
+# (manager key, module, class, load method) - mirrors SaveEditor._create_tabbed_interface
+MANAGERS = [
+    ('stats', 'stats_manager', 'StatsManager', 'load_stats'),
+    ('territory', 'territory_manager', 'TerritoryManager', 'load_territory_data'),
+    ('achievements', 'achievements_manager', 'AchievementsManager', 'load_achievements'),
+    ('maps', 'maps_manager', 'MapsManager', 'load_maps_data'),
+    ('checkpoints', 'checkpoints_manager', 'CheckpointsManager', 'load_checkpoints_data'),
+    ('pandora_pedia', 'pandora_pedia_manager', 'PandoraPediaManager', 'load_pandora_pedia'),
+    ('missions', 'missions_manager', 'MissionsManager', 'load_missions'),
+    ('pins', 'pins_manager', 'PinsManager', 'load_pins'),
+    ('sounds', 'sounds_manager', 'SoundsManager', 'load_sounds'),
+    ('tutorial', 'tutorial_manager', 'TutorialManager', 'load_tutorials'),
+    ('vehicle', 'vehicle_manager', 'VehicleManager', 'load_vehicles'),
+    ('skills', 'skills_manager', 'SkillsManager', 'load_skills'),
+]
+
+
+def time_call(func, repeat: int) -> dict:
+    """Run func `repeat` times and return timing statistics in milliseconds"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        'min_ms': round(min(samples), 3),
+        'median_ms': round(statistics.median(samples), 3),
+        'max_ms': round(max(samples), 3),
+        'repeat': repeat,
+    }
+
+
+def primary_file(layout: str, path: Path) -> Path:
+    return PS3XMLHandler.get_primary_save_file(path) if layout == 'ps3' else path
+
+
+def bench_handler(layout: str, path: Path, work_dir: Path, repeat: int) -> dict:
+    handler = HANDLERS[layout]
+    source = primary_file(layout, path)
+    data = source.read_bytes()
+    tree, _, _ = handler.load_xml_tree(source)
+
+    # Saves run against a scratch copy so every iteration starts from the same bytes
+    scratch = work_dir / f"scratch_{layout}"
+    if path.is_dir():
+        shutil.copytree(path, scratch, dirs_exist_ok=True)
+    else:
+        shutil.copyfile(path, scratch)
+
+    def save():
+        handler.save_xml_tree(tree, scratch, create_backup=False)
+
+    return {
+        'file_size': len(data),
+        'load': time_call(lambda: handler.load_xml_tree(source), repeat),
+        'verify': time_call(lambda: handler.verify_checksum(data), repeat),
+        'save': time_call(save, repeat),
+        'pretty_print': time_call(lambda: handler.get_pretty_xml(tree), repeat),
+    }
+
+
+def bench_backup_import(path: Path, work_dir: Path, repeat: int, folders: int = 5, keep: int = 3) -> dict:
+    """
+    Time the legacy backup import that runs at every start, once its folders
+    are imported and pruned. Raises if the pruned folders are imported again.
+    """
+    legacy_root = work_dir / BackupStore.LEGACY_FOLDER
+    for index in range(folders):
+        folder = legacy_root / "Bench" / datetime(2020, 1, 1, 12, index).strftime(BackupStore.LEGACY_TIMESTAMP)
+        folder.mkdir(parents=True)
+        shutil.copyfile(path, folder / path.name)
+    store = BackupStore(work_dir / "backups")
+    first = store.import_legacy(legacy_root)
+    store.add("Bench", {path.name: path.read_bytes()})
+    store.prune("Bench", keep)
+
+    def reimport():
+        count = store.import_legacy(legacy_root)
+        if count:
+            raise RuntimeError(f"{count} pruned legacy backups were imported again")
+
+    return {
+        'imported': first,
+        'reimport': time_call(reimport, repeat),
+        'entries': len(store.entries("Bench")),
+    }
+
+
+class BenchmarkWindow:
+    """Minimal host exposing what the managers read from SaveEditor"""
+
+    def __init__(self, root, tree):
+        from tkinter import ttk
+        self.root = root
+        self.tree = tree
+        self.managers = {}
+        self.scheduler = None  # Treeview rows are inserted synchronously so they are timed
+        self.dirty_sections = {}
+        self.unsaved_label = ttk.Label(root, text="")
+
+    def mark_dirty(self, manager_key, section="*"):
+        self.dirty_sections.setdefault(manager_key, set()).add(section)
+
+
+def bench_managers(path: Path, repeat: int) -> dict:
+    """Time each manager's load_* against the Xbox fixture; needs a display for Tk"""
+    import importlib
+    import tkinter as tk
+    from tkinter import ttk
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        return {'skipped': f"Tk unavailable: {e}"}
+    root.withdraw()
+
+    results = {}
+    try:
+        tree, _, _ = XMLHandler.load_xml_tree(path)
+        window = BenchmarkWindow(root, tree)
+        for key, module_name, class_name, method_name in MANAGERS:
+            try:
+                manager_class = getattr(importlib.import_module(module_name), class_name)
+                manager = manager_class(ttk.Frame(root), window)
+                window.managers[key] = manager
+                load = getattr(manager, method_name)
+                results[key] = time_call(lambda: (load(tree), root.update_idletasks()), repeat)
+            except Exception as e:
+                results[key] = {'error': str(e)}
+    finally:
+        root.destroy()
+    return results
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                       cwd=Path(__file__).resolve().parent, text=True).strip()
+    except Exception:
+        return "unknown"
+
+
+def compare(current: dict, baseline: dict) -> None:
+    """Print median ratios current/baseline for every timed entry"""
+    def walk(cur, base, prefix=""):
+        for key, value in cur.items():
+            if not isinstance(value, dict) or key not in base or not isinstance(base[key], dict):
+                continue
+            if 'median_ms' in value and 'median_ms' in base[key]:
+                ratio = value['median_ms'] / base[key]['median_ms'] if base[key]['median_ms'] else float('inf')
+                print(f"{prefix}{key:<30} {base[key]['median_ms']:>10.2f} -> {value['median_ms']:>10.2f} ms  x{ratio:.2f}")
+            else:
+                walk(value, base[key], f"{prefix}{key}.")
+
+    print(f"Comparing {current['revision']} against {baseline.get('revision', '?')}")
+    walk(current['results'], baseline.get('results', {}))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the save handlers and managers")
+    parser.add_argument("--scale", type=float, default=1.0, help="Element count multiplier for the synthetic saves")
+    parser.add_argument("--repeat", type=int, default=5, help="Iterations per measurement")
+    parser.add_argument("--layouts", nargs="+", default=list(HANDLERS), choices=list(HANDLERS))
+    parser.add_argument("--no-managers", action="store_true", help="Skip the Tk manager benchmarks")
+    parser.add_argument("--output", type=Path, default=None, help="Result file (default: benchmarks/results/<revision>.json)")
+    parser.add_argument("--compare", type=Path, default=None, help="Earlier result file to compare against")
+    args = parser.parse_args(argv)
+
+    revision = git_revision()
+    scale = SaveScale().scaled(args.scale)
+    results = {}
+
+    with tempfile.TemporaryDirectory(prefix="avatar_bench_") as tmp:
+        work_dir = Path(tmp)
+        fixtures = write_fixtures(work_dir / "fixtures", scale)
+        for layout in args.layouts:
+            print(f"Benchmarking {layout} handler...")
+            results[layout] = bench_handler(layout, fixtures[layout], work_dir, args.repeat)
+        print("Benchmarking legacy backup import...")
+        results['backup_import'] = bench_backup_import(fixtures['xbox'], work_dir, args.repeat)
+        if not args.no_managers:
+            print("Benchmarking managers...")
+            results['managers'] = bench_managers(fixtures['xbox'], args.repeat)
+
+    report = {
+        'revision': revision,
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'scale': vars(scale),
+        'results': results,
+    }
+
+    output = args.output or Path(__file__).resolve().parent / "results" / f"{revision}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding='utf-8')
+    print(f"Results written to {output}")
+
+    if args.compare:
+        compare(report, json.loads(args.compare.read_text(encoding='utf-8')))
+
+
+if __name__ == "__main__":
+    main()
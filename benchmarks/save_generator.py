@@ -0,0 +1,231 @@
+"""
+Synthetic save generator for Avatar: The Game save layouts.
+
+Produces saves that look like the real thing to the handlers and managers:
+  - Xbox 360: binary header, checksum at bytes 8..12, XML at 0x800, NUL padding and a small footer
+  - PC:       short binary header followed by the XML
+  - PS3:      a save directory with SAVEDATA.000 / PADDING.000 wrapping the XML, plus PARAM.SFO
+
+Element counts (Territory, Pin, AchievementCounter, Poss, Mission_*...) are configurable
+through SaveScale so the benchmarks can be run at realistic and stress sizes.
+
+Usage:
+    python benchmarks/save_generator.py --out fixtures --scale 4
+"""
+import argparse
+import random
+import struct
+import sys
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, fields
+from io import BytesIO
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from xml_handler import XMLHandler
+
+
+@dataclass
+class SaveScale:
+    """Number of repeated elements per section"""
+    territories: int = 28
+    pins: int = 70
+    achievements: int = 60
+    possessions: int = 40
+    missions: int = 120
+    articles: int = 200
+    skills: int = 60
+    maps: int = 40
+    checkpoints: int = 150
+    sounds: int = 80
+    tutorials: int = 50
+    vehicles: int = 12
+
+    def scaled(self, factor: float) -> "SaveScale":
+        return SaveScale(**{f.name: max(1, int(getattr(self, f.name) * factor)) for f in fields(self)})
+
+
+XBOX_XML_OFFSET = XMLHandler.XML_START_OFFSET
+XBOX_FOOTER = b"AVFOOTER\x01\x02\x03\x04"
+PC_MAGIC = b"AVTRSAVE"
+PS3_MAGIC = b"AVTRPS3\x00"
+
+
+def _crc(rng: random.Random) -> str:
+    return str(rng.randrange(1, 2**32))
+
+
+def name_to_vec(name: str) -> str:
+    """Encode a character name the way BaseInfo/@namevec stores it"""
+    return f"Count({len(name)}) " + "".join(f"{ord(ch)};" for ch in name)
+
+
+def build_savegame(scale: SaveScale = None, seed: int = 0, name: str = "Benchmark") -> ET.ElementTree:
+    """Build a <Savegame> document with the sections the managers read"""
+    scale = scale or SaveScale()
+    rng = random.Random(seed)
+    root = ET.Element("Savegame")
+
+    profile = ET.SubElement(root, "PlayerProfile", crc_LastLoadedPin=_crc(rng))
+    ET.SubElement(profile, "BaseInfo", namevec=name_to_vec(name), side="1", pawn="1", isfemale="0",
+                  face="3", TotalEP=str(rng.randrange(0, 500000)), bEntityScanningEnabled="1")
+    ET.SubElement(profile, "XpInfo", Level=str(rng.randrange(1, 60)), XP=str(rng.randrange(0, 100000)))
+    ET.SubElement(profile, "OptionsInfo", RumbleEnabled="1", FirstPersonMode="0")
+    ET.SubElement(profile, "TimeInfo", GameTime=str(rng.randrange(0, 10**6)),
+                  PlayedTime=str(rng.randrange(0, 10**6)), EnvTime="43200")
+    ET.SubElement(profile, "LocationInfo", YouAreHere_LatitudeLongitude="12.5,-8.25")
+    ET.SubElement(profile, "Possessions_Recovery", RecoveryBits="500")
+    for container_name in ("Possessions_Soldier", "Possessions_Avatar"):
+        container = ET.SubElement(profile, container_name)
+        weapons = ET.SubElement(container, "EquippedWeapons")
+        for slot in range(4):
+            ET.SubElement(weapons, "Slot", Index=str(slot))
+        armors = ET.SubElement(container, "EquippedArmors")
+        for slot in range(3):
+            ET.SubElement(armors, "Slot", Index=str(4 + slot))
+        possessions = ET.SubElement(container, "Posessions")
+        for index in range(scale.possessions):
+            ET.SubElement(possessions, "Poss", Index=str(index), crc_ItemID=_crc(rng),
+                          NbInStack=str(rng.randrange(0, 999)), NbInClip=str(rng.randrange(0, 60)),
+                          crc_AmmoType="4294967295")
+
+    metagame = ET.SubElement(root, "Metagame", PlayerFaction="1", NaviCostReduction="0", CorpCostReduction="0")
+    ET.SubElement(metagame, "Player0", EPs=str(rng.randrange(0, 5000)), newEPs="0")
+    ET.SubElement(metagame, "Player1", EPs=str(rng.randrange(0, 5000)), newEPs="0")
+    for _ in range(scale.territories):
+        territory = ET.SubElement(metagame, "Territory", crc_ID=_crc(rng), Faction=str(rng.choice((0, 1, 2))),
+                                  BaseUnits=str(rng.randrange(0, 50)), HomeBase="0", SecondaryBase="0",
+                                  DefenseFlags=str(rng.randrange(0, 8)), Active=str(rng.choice((0, 1))))
+        ET.SubElement(territory, "FreeUnits", Troops=str(rng.randrange(0, 3000)),
+                      Ground=str(rng.randrange(0, 20)), Air=str(rng.randrange(0, 10)))
+
+    pins = ET.SubElement(root, "AvatarPinDB_Status")
+    for _ in range(scale.pins):
+        pin = ET.SubElement(pins, "Pin", crc_id=_crc(rng), eUnlocked=rng.choice("01"),
+                            fFoWcurrent=f"{rng.random() * 100:.2f}")
+        for _ in range(rng.randrange(0, 3)):
+            ET.SubElement(pin, "CompletionCounter", crc_id=_crc(rng), count=str(rng.randrange(0, 10)))
+
+    achievements = ET.SubElement(root, "AvatarAchievementDB_Status")
+    for _ in range(scale.achievements):
+        ET.SubElement(achievements, "AchievementCounter", crc_id=_crc(rng), count=str(rng.randrange(0, 2)))
+
+    missions = ET.SubElement(root, "AvatarMissionDB_Status")
+    for _ in range(scale.missions):
+        tag = rng.choice(("Mission_Completed", "Mission_InProgress", "Mission_NotStarted"))
+        mission = ET.SubElement(missions, tag, crc_id=_crc(rng), iCurrentStepIndex=str(rng.randrange(0, 6)))
+        for _ in range(rng.randrange(0, 4)):
+            ET.SubElement(mission, "Objective", crc_id=_crc(rng), status=rng.choice("01"))
+
+    articles = ET.SubElement(root, "AvatarPandorapediaDB_Status")
+    for _ in range(scale.articles):
+        ET.SubElement(articles, "Article", crc_id=_crc(rng), eKnown=rng.choice("012"))
+
+    skills = ET.SubElement(root, "AvatarSkillDB_Status")
+    for _ in range(scale.skills):
+        ET.SubElement(skills, "Skill", crc_id=_crc(rng), eLocked=rng.choice("02"))
+
+    fog = ET.SubElement(root, "AvatarFogOfWarDB_Status")
+    for _ in range(scale.maps):
+        ET.SubElement(fog, "FoW_Map", crc_id=_crc(rng))
+
+    checkpoints = ET.SubElement(root, "VisitedCheckpoints")
+    for _ in range(scale.checkpoints):
+        ET.SubElement(checkpoints, "CheckPoint", EntityID=_crc(rng))
+
+    sounds = ET.SubElement(root, "SoundKnowledge")
+    for _ in range(scale.sounds):
+        ET.SubElement(sounds, "Sound", ID=_crc(rng))
+
+    tutorials = ET.SubElement(root, "AvatarTutorialDB_Status")
+    for _ in range(scale.tutorials):
+        ET.SubElement(tutorials, "Tutorial_Completed", crc_id=_crc(rng))
+
+    barks = ET.SubElement(root, "BarkKnowledge", FirstTravelBarkPlayed="1")
+    for _ in range(scale.vehicles):
+        ET.SubElement(barks, "EnteredVehicle", crc_vehicleItem=_crc(rng))
+
+    return ET.ElementTree(root)
+
+
+def serialize_xml(tree: ET.ElementTree) -> bytes:
+    buffer = BytesIO()
+    tree.write(buffer, encoding='utf-8', xml_declaration=False)
+    return buffer.getvalue()
+
+
+def build_xbox_save(scale: SaveScale = None, seed: int = 0, name: str = "Benchmark") -> bytes:
+    """Xbox 360 layout: header, checksum at 8..12, XML at 0x800, NUL padding, footer"""
+    xml_data = serialize_xml(build_savegame(scale, seed, name))
+    footer = XBOX_FOOTER
+    size = XMLHandler.EXPECTED_FILE_SIZE
+    minimum = XBOX_XML_OFFSET + len(xml_data) + len(footer) + 0x1000
+    if minimum > size:
+        size = (minimum + 0xFFFF) & ~0xFFFF  # Stress scales outgrow the real container
+
+    data = bytearray(size)
+    data[0:8] = b"AVTRX360"
+    data[12:16] = struct.pack("<I", XBOX_XML_OFFSET)
+    data[16:20] = struct.pack("<I", len(xml_data))
+    data[XBOX_XML_OFFSET:XBOX_XML_OFFSET + len(xml_data)] = xml_data
+    data[size - len(footer):] = footer
+    return XMLHandler.update_checksum(bytes(data))
+
+
+def build_pc_save(scale: SaveScale = None, seed: int = 0, name: str = "Benchmark") -> bytes:
+    """PC layout: short binary header then the XML"""
+    xml_data = serialize_xml(build_savegame(scale, seed, name))
+    return PC_MAGIC + struct.pack("<II", 1, len(xml_data)) + xml_data
+
+
+def build_ps3_file(scale: SaveScale = None, seed: int = 0, name: str = "Benchmark") -> bytes:
+    """PS3 SAVEDATA.000 / PADDING.000 payload: wrapper header, XML, NUL tail"""
+    xml_data = serialize_xml(build_savegame(scale, seed, name))
+    return PS3_MAGIC + struct.pack(">I", len(xml_data)) + xml_data + bytes(256)
+
+
+def write_fixtures(out_dir: Path, scale: SaveScale = None, seed: int = 0, name: str = "Benchmark") -> dict:
+    """Write one save per layout under out_dir and return their paths"""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    xbox_path = out_dir / "xbox.sav"
+    xbox_path.write_bytes(build_xbox_save(scale, seed, name))
+
+    pc_path = out_dir / "pc.sav"
+    pc_path.write_bytes(build_pc_save(scale, seed, name))
+
+    ps3_dir = out_dir / "PS3SAVE"
+    ps3_dir.mkdir(exist_ok=True)
+    payload = build_ps3_file(scale, seed, name)
+    (ps3_dir / "SAVEDATA.000").write_bytes(payload)
+    (ps3_dir / "PADDING.000").write_bytes(payload)
+    (ps3_dir / "PARAM.SFO").write_bytes(b"\x00PSF" + bytes(60))
+
+    return {'xbox': xbox_path, 'pc': pc_path, 'ps3': ps3_dir}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic Avatar: The Game saves")
+    parser.add_argument("--out", type=Path, default=Path("fixtures"), help="Output directory")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier applied to every element count")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--name", default="Benchmark", help="Character name written to BaseInfo/@namevec")
+    for f in fields(SaveScale):
+        parser.add_argument(f"--{f.name}", type=int, default=None, help=f"Override number of {f.name}")
+    args = parser.parse_args(argv)
+
+    scale = SaveScale().scaled(args.scale)
+    for f in fields(SaveScale):
+        override = getattr(args, f.name)
+        if override is not None:
+            setattr(scale, f.name, override)
+
+    paths = write_fixtures(args.out, scale, args.seed, args.name)
+    for layout, path in paths.items():
+        print(f"{layout}: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+import json
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+import logging
+
+from backup_store import BackupStore
+from edit_journal import SET, INSERT, REMOVE, perform
+from save_batch import SaveDocument
+
+
+# An attribute at the end of a path: "Territory/FreeUnits/@Troops"
+ATTRIBUTE_PATH = re.compile(r'^(?P<path>.+)/@(?P<name>[\w:.-]+)$')
+
+# Command line shorthand: "path/@name=value" or "path/@name+=amount"
+ASSIGNMENT = re.compile(r'^(?P<target>.+/@[\w:.-]+)\s*(?P<operator>\+?=)(?P<value>.*)$')
+
+DOCUMENT_TAGS = ("Savegame", "SaveGame", "savegame", "SaveData")
+
+# Edit kind: (path ends with an attribute, extra key the edit needs)
+EDIT_KINDS = {
+    'set': (True, 'value'),
+    'increment': (True, 'by'),
+    'unset': (True, None),
+    'append': (False, 'xml'),
+    'remove': (False, None),
+}
+
+
+class PatchError(ValueError):
+    """A patch is malformed, or a required edit matched nothing"""
+
+
+def element_path(path: str) -> str:
+    """
+    ElementTree path relative to the document element. Absolute paths start at
+    the document element (as save_diff prints them); other paths match at any
+    depth, so "AvatarPinDB_Status/Pin" finds the pins wherever the section is.
+    """
+    if path.startswith("/"):
+        first, _, rest = path[1:].partition("/")
+        if first not in DOCUMENT_TAGS:
+            raise PatchError(f"Absolute path {path!r} must start with the document element, /Savegame")
+        return f"./{rest}" if rest else "."
+    if path.startswith("."):
+        return path
+    return f".//{path}"
+
+
+@dataclass(frozen=True)
+class Edit:
+    """One edit of a patch, applied to every element its path matches"""
+    kind: str
+    path: str  # ElementTree path, relative to the document element
+    name: Optional[str] = None  # Attribute of set, increment and unset
+    value: Optional[str] = None  # set: new value, increment: amount, append: XML of the new element
+    required: bool = False  # Fail the save if the path matches nothing
+
+    @classmethod
+    def from_json(cls, number: int, data: Dict) -> "Edit":
+        if not isinstance(data, dict):
+            raise PatchError(f"Edit {number}: expected an object, got {data!r}")
+        kinds = [kind for kind in EDIT_KINDS if kind in data]
+        if len(kinds) != 1:
+            raise PatchError(f"Edit {number}: needs exactly one of {', '.join(EDIT_KINDS)}")
+        kind = kinds[0]
+        has_attribute, extra = EDIT_KINDS[kind]
+
+        path, name = data[kind], None
+        if has_attribute:
+            match = ATTRIBUTE_PATH.match(path)
+            if match is None:
+                raise PatchError(f"Edit {number}: {kind} needs a path ending in /@attribute, got {path!r}")
+            path, name = match.group('path'), match.group('name')
+
+        value = None
+        if extra is not None:
+            if extra not in data:
+                raise PatchError(f"Edit {number}: {kind} needs '{extra}'")
+            value = str(data[extra])
+            if kind == 'increment' and not re.fullmatch(r'-?\d+', value):
+                raise PatchError(f"Edit {number}: 'by' must be a whole number, got {value!r}")
+            if kind == 'append':
+                try:
+                    ET.fromstring(value)
+                except ET.ParseError as e:
+                    raise PatchError(f"Edit {number}: invalid xml: {e}") from e
+
+        path = element_path(path)
+        try:
+            ET.Element("Savegame").findall(path)  # Compiles the path (ElementTree caches it)
+        except (SyntaxError, KeyError, TypeError) as e:
+            raise PatchError(f"Edit {number}: invalid path {path!r}: {e}") from e
+        return cls(kind, path, name, value, bool(data.get('required', False)))
+
+    @classmethod
+    def parse_assignment(cls, text: str) -> "Edit":
+        """Command line shorthand: "path/@name=value" sets, "path/@name+=n" increments"""
+        match = ASSIGNMENT.match(text.strip())
+        if match is None:
+            raise PatchError(f"Expected path/@attribute=value, got {text!r}")
+        if match.group('operator') == '+=':
+            return cls.from_json(1, {'increment': match.group('target'), 'by': match.group('value').strip()})
+        return cls.from_json(1, {'set': match.group('target'), 'value': match.group('value')})
+
+    def plan(self, root: ET.Element, edits: List[tuple]) -> int:
+        """Add this edit's perform() edits for the tree as it is now; returns the number of elements matched"""
+        matched = root.findall(self.path)
+        parents = {}
+        if self.kind == 'remove' and matched:
+            parents = {child: parent for parent in root.iter() for child in parent}
+        for element in matched:
+            if self.kind == 'set':
+                if element.get(self.name) != self.value:
+                    edits.append((SET, element, self.name, self.value))
+            elif self.kind == 'increment':
+                try:
+                    current = int(element.get(self.name) or 0)
+                except ValueError:
+                    raise PatchError(f"{self.path}/@{self.name} is not a number: {element.get(self.name)!r}")
+                edits.append((SET, element, self.name, str(current + int(self.value))))
+            elif self.kind == 'unset':
+                if self.name in element.attrib:
+                    edits.append((SET, element, self.name, None))
+            elif self.kind == 'append':
+                edits.append((INSERT, element, ET.fromstring(self.value)))
+            elif element is not root:
+                edits.append((REMOVE, parents[element], element))
+        if self.required and not matched:
+            raise PatchError(f"Required path matched nothing: {self.path}")
+        return len(matched)
+
+
+class Patch:
+    """
+    A list of path-based edits, compiled once and applied to any number of saves.
+
+    JSON format, a list of edits or {"description": ..., "edits": [...]}:
+        {"set": "AvatarPinDB_Status/Pin/@eUnlocked", "value": "1"}
+        {"increment": "Territory[@crc_ID='904419227']/FreeUnits/@Troops", "by": 50}
+        {"unset": "PlayerProfile/@crc_LastLoadedPin"}
+        {"append": "Territory[@crc_ID='904419227']", "xml": "<FreeUnits Troops='0' Ground='0' Air='0'/>"}
+        {"remove": "AvatarTutorialDB_Status/Tutorial_Completed[@crc_id='44333413']"}
+    Paths use the XPath subset ElementTree supports, predicates included. An
+    edit with "required": true fails the save if its path matches nothing.
+    Edits apply in order, each to the tree as the edits before it left it, so
+    a set followed by an increment of the same attribute adds to the new value.
+    """
+
+    def __init__(self, edits: List[Edit], description: str = ""):
+        self.edits = edits
+        self.description = description
+
+    @classmethod
+    def from_json(cls, data) -> "Patch":
+        description = ""
+        if isinstance(data, dict):
+            description = data.get('description', "")
+            data = data.get('edits')
+        if not isinstance(data, list):
+            raise PatchError("A patch is a list of edits, or an object with an 'edits' list")
+        return cls([Edit.from_json(number, edit) for number, edit in enumerate(data, 1)], description)
+
+    @classmethod
+    def load(cls, path: Path) -> "Patch":
+        with open(path, 'r', encoding='utf-8') as f:
+            try:
+                data = json.load(f)
+            except ValueError as e:
+                raise PatchError(f"{path} is not valid JSON: {e}") from e
+        return cls.from_json(data)
+
+    def apply(self, root: ET.Element, journal=None) -> int:
+        """
+        Apply the edits in order; through journal, the patch undoes as one step
+        and a failing edit rolls back the ones before it. Returns the number of changes.
+        """
+        label = self.description or "Bulk edit"
+        if journal is None:
+            return self._apply_edits(root, None, label)
+        with journal.transaction(label, "*"):
+            return self._apply_edits(root, journal, label)
+
+    def _apply_edits(self, root: ET.Element, journal, label: str) -> int:
+        changes = 0
+        matched = []
+        for edit in self.edits:
+            edits: List[tuple] = []
+            matched.append(edit.plan(root, edits))
+            perform(edits, journal, label)
+            changes += len(edits)
+        logging.getLogger('Patch').debug("%d changes, matches per edit: %s", changes, matched)
+        return changes
+
+
+def apply_patch_to_save(patch: Patch, path: Path, dry_run: bool = False,
+                        backup_store: Optional[BackupStore] = None, max_backups: int = 0) -> int:
+    """
+    Batch entry point: apply a patch to one save file or PS3 save folder; returns
+    the change count. A dry run applies it to the loaded tree only.
+    """
+    document = SaveDocument(path)
+    changes = patch.apply(document.root)
+    if changes and not dry_run:
+        document.write(backup_store, max_backups)
+    return changes
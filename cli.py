@@ -0,0 +1,378 @@
+"""
+Command line tools for Avatar: The Game saves (no GUI required).
+
+Usage:
+    python cli.py probe <save> [<save> ...]
+    python cli.py library scan [<folder> ...] [--backups]
+    python cli.py library query --faction navi --min-level 20
+    python cli.py diff <old save> <new save> [--summary]
+    python cli.py timeline [<character>] [--csv]
+    python cli.py preset complete <save or folder> [...] [--dry-run]
+    python cli.py patch <save or folder> [...] [--patch edits.json] [--set "Pin/@eUnlocked=1"] [--dry-run]
+    python cli.py export <save or folder> [...] [--format jsonl|csv|sqlite] [--output PATH] [--sections pins ...]
+    python cli.py convert <save or folder> [...] --template <target save> --output <folder> [--overwrite]
+"""
+import argparse
+import configparser
+import csv
+import multiprocessing
+import sys
+from functools import partial
+from pathlib import Path
+
+from backup_store import BackupStore
+from bulk_edit import Patch, PatchError, Edit, apply_patch_to_save
+from backup_timeline import BackupTimeline, TIMELINE_METRICS, progress_deltas
+from completion_presets import PRESETS, apply_preset_to_save
+from ps3_xml_handler import PS3XMLHandler
+from save_diff import diff_saves, count_changes
+from save_library import SaveLibrary
+from save_probe import probe_save
+from save_batch import run_batch, save_paths
+from save_converter import convert_saves
+from save_export import EXPORT_SECTIONS, WRITERS, export_saves
+
+SETTINGS_FILE = "settings.ini"
+FACTION_ALIASES = {"navi": "Na'vi", "na'vi": "Na'vi", "rda": "RDA", "undecided": "Undecided"}
+
+
+def read_settings(config_file: str = SETTINGS_FILE) -> configparser.ConfigParser:
+    """The editor's settings.ini, for the paths the commands share with it"""
+    parser = configparser.ConfigParser()
+    parser.optionxform = str
+    parser.read(config_file)
+    return parser
+
+
+def open_backup_store(settings) -> BackupStore:
+    """The editor's backup store, with the backups of editor versions before it imported"""
+    store = BackupStore(
+        Path(settings.get('Backup', 'backup_root_folder', fallback="Save Backups")),
+        settings.get('Backup', 'backup_compression', fallback="lzma"),
+        delta=settings.get('Backup', 'backup_mode', fallback="delta") == "delta",
+        rebase_interval=settings.getint('Backup', 'backup_rebase_interval', fallback=8)
+    )
+    store.import_legacy(Path(BackupStore.LEGACY_FOLDER))
+    return store
+
+
+def backup_arguments(args, settings) -> dict:
+    """backup_store and max_backups for writing saves, as the editor backs them up (none with --no-backup)"""
+    if args.no_backup or getattr(args, 'dry_run', False):
+        return {'backup_store': None, 'max_backups': 0}
+    return {'backup_store': open_backup_store(settings),
+            'max_backups': settings.getint('Backup', 'max_backups_per_character', fallback=10)}
+
+
+def read_save_source(source: str) -> bytes:
+    """Contents of a save file (SAVEDATA.000 of a PS3 save folder), or of a backup given as listed by 'library query'
+    (backup://<store folder>/<character>/<backup id>/<file name>)"""
+    if source.startswith(SaveLibrary.BACKUP_PREFIX):
+        root, character, entry_id, name = source[len(SaveLibrary.BACKUP_PREFIX):].rsplit('/', 3)
+        files = BackupStore(Path(root)).restore(character, entry_id)
+        if name not in files:
+            raise KeyError(f"Backup {entry_id} of {character} has no {name}")
+        return files[name]
+    if Path(source).is_dir():
+        source = PS3XMLHandler.get_primary_save_file(Path(source))
+    with open(source, 'rb') as f:
+        return f.read()
+
+
+def open_library(args, settings) -> SaveLibrary:
+    database = args.database or settings.get('Library', 'library_database', fallback="save_library.db")
+    return SaveLibrary(Path(database))
+
+
+def cmd_probe(args, settings) -> int:
+    failed = 0
+    for path in args.saves:
+        try:
+            summary = probe_save(Path(path))
+        except (OSError, ValueError) as e:
+            failed += 1
+            print(f"{path}: failed: {e}")
+            continue
+        level = summary.level if summary.level is not None else "?"
+        total_ep = summary.total_ep if summary.total_ep is not None else "?"
+        played = summary.played_time
+        played = f"{played // 3600}h{played % 3600 // 60:02d}" if played is not None else "?"
+        print(f"{path}: {summary.character_name or 'Unknown'} | level {level} | {summary.faction} | "
+              f"EP {total_ep} | played {played} | read {summary.bytes_read} bytes")
+    return 1 if failed else 0
+
+
+def cmd_library_scan(args, settings) -> int:
+    folders = args.folders
+    if not folders:
+        configured = settings.get('Library', 'library_folders', fallback="")
+        folders = [Path(folder.strip()) for folder in configured.split(';') if folder.strip()]
+    if not folders and not args.backups:
+        print("No folders given and none configured in [Library] library_folders", file=sys.stderr)
+        return 2
+
+    library = open_library(args, settings)
+    try:
+        if folders:
+            stats = library.scan(folders, workers=args.workers)
+            print(f"Saves: {stats['added']} added, {stats['updated']} updated, {stats['removed']} removed, "
+                  f"{stats['unchanged']} unchanged, {stats['failed']} failed")
+        if args.backups:
+            stats = library.scan_backups(open_backup_store(settings))
+            print(f"Backups: {stats['added']} added, {stats['removed']} removed, {stats['unchanged']} unchanged, "
+                  f"{stats['failed']} failed")
+    finally:
+        library.close()
+    return 0
+
+
+def cmd_library_query(args, settings) -> int:
+    faction = FACTION_ALIASES.get(args.faction.lower(), args.faction) if args.faction else None
+    library = open_library(args, settings)
+    try:
+        rows = library.query(character=args.character, faction=faction, min_level=args.min_level,
+                             max_level=args.max_level, platform=args.platform,
+                             include_backups=not args.no_backups)
+    finally:
+        library.close()
+
+    for row in rows:
+        print(f"{row['character_name'] or 'Unknown':<20} lvl {row['level'] if row['level'] is not None else '?':>3} "
+              f"{row['faction']:<9} {row['platform']:<4} pins {row['pins_unlocked']}/{row['pins_total']} "
+              f"pedia {row['pedia_known']}/{row['pedia_total']}  {row['path']}")
+    print(f"{len(rows)} saves")
+    return 0
+
+
+def cmd_diff(args, settings) -> int:
+    changes = diff_saves(read_save_source(args.old), read_save_source(args.new))
+    if not args.summary:
+        for change in changes:
+            print(change)
+    counts = count_changes(changes)
+    print(f"{counts['attribute']} attributes changed, {counts['text']} texts changed, "
+          f"{counts['added']} elements added, {counts['removed']} elements removed")
+    return 1 if changes else 0
+
+
+def cmd_timeline(args, settings) -> int:
+    store = open_backup_store(settings)
+    if not args.character:
+        for character in store.characters():
+            print(f"{character}: {len(store.entries(character))} backups")
+        return 0
+
+    points = BackupTimeline(store).build(args.character)
+    if not points:
+        print(f"No backups for {args.character}", file=sys.stderr)
+        return 2
+
+    if args.csv:
+        writer = csv.writer(sys.stdout)
+        writer.writerow(["timestamp", "backup"] + [key for key, _ in TIMELINE_METRICS])
+        for point in points:
+            writer.writerow([point['timestamp'], point['id']] + [point.get(key) for key, _ in TIMELINE_METRICS])
+        return 0
+
+    def cell(point, key):
+        value = point.get(key)
+        if value is None:
+            return "?"
+        if key == 'played_time':
+            return f"{value // 3600}h{value % 3600 // 60:02d}"
+        total = {'territories_owned': 'territories', 'pins_unlocked': 'pins_total',
+                 'achievements_started': 'achievements_total', 'pedia_known': 'pedia_total'}.get(key)
+        return f"{value}/{point[total]}" if total else str(value)
+
+    print(f"{'Backup time':<20}" + "".join(f"{heading:>14}" for _, heading in TIMELINE_METRICS) + "  Changes")
+    previous = None
+    for point in points:
+        if 'error' in point:
+            print(f"{point['timestamp']:<20}  unreadable: {point['error']}")
+            continue
+        deltas = progress_deltas(previous, point) if previous else {}
+        changes = ", ".join(f"{heading} {deltas[key]:+d}" for key, heading in TIMELINE_METRICS
+                            if key in deltas and key != 'played_time')
+        print(f"{point['timestamp']:<20}" + "".join(f"{cell(point, key):>14}" for key, _ in TIMELINE_METRICS)
+              + f"  {changes}")
+        previous = point
+    return 0
+
+
+def cmd_preset(args, settings) -> int:
+    paths = save_paths(args.saves)
+    if not paths:
+        print("No saves found", file=sys.stderr)
+        return 2
+
+    preset = PRESETS[args.preset]
+    apply = partial(apply_preset_to_save, args.preset, dry_run=args.dry_run, **backup_arguments(args, settings))
+    return report_batch(preset.label, paths, apply, args)
+
+
+def report_batch(label: str, paths, apply, args) -> int:
+    """Run apply(path) over the saves, printing the change count of each"""
+    failed = 0
+    for path, count, error in run_batch(paths, apply, workers=args.workers):
+        if error is not None:
+            failed += 1
+            print(f"{path}: failed: {error}")
+        else:
+            print(f"{path}: {count} values {'to change' if args.dry_run else 'changed'}")
+    print(f"{label}: {len(paths) - failed} saves done, {failed} failed")
+    return 1 if failed else 0
+
+
+def cmd_patch(args, settings) -> int:
+    try:
+        patch = Patch.load(args.patch) if args.patch else Patch([])
+        patch.edits.extend(Edit.parse_assignment(assignment) for assignment in args.set)
+    except (OSError, PatchError) as e:
+        print(e, file=sys.stderr)
+        return 2
+    if not patch.edits:
+        print("No edits given: pass a patch file or --set", file=sys.stderr)
+        return 2
+
+    paths = save_paths(args.saves)
+    if not paths:
+        print("No saves found", file=sys.stderr)
+        return 2
+    apply = partial(apply_patch_to_save, patch, dry_run=args.dry_run, **backup_arguments(args, settings))
+    return report_batch(patch.description or "Patch", paths, apply, args)
+
+
+def cmd_export(args, settings) -> int:
+    paths = save_paths(args.saves)
+    if not paths:
+        print("No saves found", file=sys.stderr)
+        return 2
+    if args.output is None and args.format != 'jsonl':
+        print(f"--output is required for {args.format}", file=sys.stderr)
+        return 2
+
+    writer = WRITERS[args.format](args.output)
+    try:
+        counts = export_saves(paths, writer, args.sections or EXPORT_SECTIONS)
+    finally:
+        writer.close()
+    failed = counts.pop('failed', 0)
+    print(f"Exported {len(paths) - failed} saves: " + ", ".join(f"{count} {section}"
+                                                                for section, count in counts.items()),
+          file=sys.stderr)
+    return 1 if failed else 0
+
+
+def cmd_convert(args, settings) -> int:
+    paths = save_paths(args.saves)
+    if not paths:
+        print("No saves found", file=sys.stderr)
+        return 2
+
+    failed = 0
+    try:
+        for path, output, error in convert_saves(paths, args.template, args.output, args.overwrite, args.workers,
+                                                 **backup_arguments(args, settings)):
+            if error is not None:
+                failed += 1
+                print(f"{path}: failed: {error}")
+            else:
+                print(f"{path} -> {output}")
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 2
+    print(f"Converted {len(paths) - failed} saves, {failed} failed")
+    return 1 if failed else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Avatar: The Game save tools")
+    parser.add_argument("--settings", default=SETTINGS_FILE, help="Editor settings file")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    probe = commands.add_parser("probe", help="Show character name, level and faction of saves")
+    probe.add_argument("saves", nargs="+")
+    probe.set_defaults(func=cmd_probe)
+
+    library = commands.add_parser("library", help="Save library index")
+    library.add_argument("--database", default=None, help="Library database (default from settings.ini)")
+    library_commands = library.add_subparsers(dest="library_command", required=True)
+
+    scan = library_commands.add_parser("scan", help="Index new and changed saves")
+    scan.add_argument("folders", nargs="*", type=Path)
+    scan.add_argument("--backups", action="store_true", help="Also index the backup store")
+    scan.add_argument("--workers", type=int, default=None, help="Indexing processes (default: one per CPU)")
+    scan.set_defaults(func=cmd_library_scan)
+
+    query = library_commands.add_parser("query", help="List indexed saves")
+    query.add_argument("--character", help="Character name contains")
+    query.add_argument("--faction", help="navi, rda or undecided")
+    query.add_argument("--min-level", type=int)
+    query.add_argument("--max-level", type=int)
+    query.add_argument("--platform", choices=["xbox", "pc", "ps3"])
+    query.add_argument("--no-backups", action="store_true", help="Leave out backup store entries")
+    query.set_defaults(func=cmd_library_query)
+
+    diff = commands.add_parser("diff", help="Show what changed between two saves (exit status 1 if they differ)")
+    diff.add_argument("old", help="Save file, or a backup:// path from 'library query'")
+    diff.add_argument("new", help="Save file, or a backup:// path from 'library query'")
+    diff.add_argument("--summary", action="store_true", help="Only print the number of changes")
+    diff.set_defaults(func=cmd_diff)
+
+    timeline = commands.add_parser("timeline", help="Progress of a character across its backups")
+    timeline.add_argument("character", nargs="?", help="Backed-up character (lists the characters if left out)")
+    timeline.add_argument("--csv", action="store_true", help="Write the timeline as CSV")
+    timeline.set_defaults(func=cmd_timeline)
+
+    preset = commands.add_parser(
+        "preset", help="Apply a completion preset to saves",
+        description="Presets: " + " ".join(f"{name} - {preset.description}" for name, preset in PRESETS.items()))
+    preset.add_argument("preset", choices=sorted(PRESETS))
+    preset.add_argument("saves", nargs="+", type=Path, help="Save files, PS3 save folders or folders to search")
+    preset.add_argument("--dry-run", action="store_true", help="Only count the values that would change")
+    preset.add_argument("--no-backup", action="store_true", help="Don't back the saves up in the backup store")
+    preset.add_argument("--workers", type=int, default=None, help="Processes (default: one per CPU)")
+    preset.set_defaults(func=cmd_preset)
+
+    patch = commands.add_parser("patch", help="Apply path-based edits to saves", description=Patch.__doc__,
+                                formatter_class=argparse.RawDescriptionHelpFormatter)
+    patch.add_argument("saves", nargs="+", type=Path, help="Save files, PS3 save folders or folders to search")
+    patch.add_argument("--patch", type=Path, help="JSON patch file")
+    patch.add_argument("--set", action="append", default=[], metavar="PATH/@ATTR=VALUE",
+                       help="Set (=) or increment (+=) an attribute; may be repeated")
+    patch.add_argument("--dry-run", action="store_true", help="Only count the values that would change")
+    patch.add_argument("--no-backup", action="store_true", help="Don't back the saves up in the backup store")
+    patch.add_argument("--workers", type=int, default=None, help="Processes (default: one per CPU)")
+    patch.set_defaults(func=cmd_patch)
+
+    export = commands.add_parser("export", help="Export territories, items, missions and more for analysis")
+    export.add_argument("saves", nargs="+", type=Path, help="Save files, PS3 save folders or folders to search")
+    export.add_argument("--format", choices=sorted(WRITERS), default="jsonl",
+                        help="jsonl: one object per line, csv: a <section>.csv per section in the output "
+                             "folder, sqlite: a table per section (default: jsonl)")
+    export.add_argument("--output", type=Path, help="Output file or folder (jsonl default: stdout)")
+    export.add_argument("--sections", nargs="+", choices=list(EXPORT_SECTIONS), help="Sections (default: all)")
+    export.set_defaults(func=cmd_export)
+
+    convert = commands.add_parser("convert", help="Convert saves between the Xbox 360, PC and PS3 layouts",
+                                  description="Wraps each save's XML in a copy of the template, a save of the "
+                                              "target platform: an Xbox .sav, a PC .sav or a PS3 save folder.")
+    convert.add_argument("saves", nargs="+", type=Path, help="Save files, PS3 save folders or folders to search")
+    convert.add_argument("--template", type=Path, required=True, help="Save of the target platform")
+    convert.add_argument("--output", type=Path, required=True, help="Folder for the converted saves")
+    convert.add_argument("--overwrite", action="store_true", help="Replace converted saves already there")
+    convert.add_argument("--no-backup", action="store_true", help="Don't back up replaced saves in the backup store")
+    convert.add_argument("--workers", type=int, default=None, help="Processes (default: one per CPU)")
+    convert.set_defaults(func=cmd_convert)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args, read_settings(args.settings))
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,175 @@
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+import logging
+
+from backup_store import BackupStore
+from edit_journal import SET, INSERT, perform
+from game_data import ACHIEVEMENTS
+from save_batch import SaveDocument
+from save_sections import index_sections, managers_for_tags
+
+
+# Rules compile to edit_journal.perform() edits: (SET, element, name, value) and, for
+# a territory without FreeUnits, (INSERT, parent, child). Every rule of a preset is
+# compiled against the tree as it was before the preset.
+
+Sections = Dict[str, List[ET.Element]]
+
+
+class PresetError(ValueError):
+    """A preset cannot be applied to this save"""
+
+
+@dataclass(frozen=True)
+class SetAttribute:
+    """Set an attribute on the section's children with the given tag (or, if tag is the section, on the sections)"""
+    section: str
+    tag: str
+    name: str
+    value: Union[str, Callable[[ET.Element], Optional[str]]]  # Callables return None to leave the element as is
+    only: Optional[Tuple[str, ...]] = None  # Only change elements whose current value is one of these
+    unless: Tuple[str, ...] = ()  # Never change elements whose current value is one of these
+
+    def compile(self, sections: Sections, ops: List[tuple]) -> None:
+        for section in sections.get(self.section, ()):
+            targets = [section] if self.tag == self.section else section.iter(self.tag)
+            for element in targets:
+                current = element.get(self.name)
+                if (self.only is not None and current not in self.only) or current in self.unless:
+                    continue
+                value = self.value(element) if callable(self.value) else self.value
+                if value is not None and value != current:
+                    ops.append((SET, element, self.name, value))
+
+
+@dataclass(frozen=True)
+class ReinforceOpponent:
+    """Add units and defenses to every territory of the faction the player is fighting"""
+    troops: int = 3000
+    ground: int = 20
+    air: int = 10
+    defense_flags: str = "7"  # All defense types (1+2+4)
+    factory: str = "1"
+    section: str = "Metagame"
+
+    @staticmethod
+    def player_faction(metagame: ET.Element, territories: List[ET.Element]) -> Optional[str]:
+        """PlayerFaction, or else the faction holding more territories"""
+        faction = metagame.get("PlayerFaction")
+        if faction in ("1", "2"):
+            return faction
+        navi = sum(1 for territory in territories if territory.get("Faction") == "1")
+        rda = sum(1 for territory in territories if territory.get("Faction") == "2")
+        return "1" if navi > rda else "2" if rda > navi else None
+
+    def compile(self, sections: Sections, ops: List[tuple]) -> None:
+        for metagame in sections.get(self.section, ())[:1]:
+            territories = metagame.findall(".//Territory")
+            player = self.player_faction(metagame, territories)
+            if player is None:
+                raise PresetError("Cannot determine the player's faction; pick a faction in the game first")
+            opponent = "2" if player == "1" else "1"
+
+            for territory in territories:
+                if territory.get("Faction") != opponent:
+                    continue
+                for name, value in (("SecondaryBase", self.factory), ("DefenseFlags", self.defense_flags)):
+                    if territory.get(name) != value:
+                        ops.append((SET, territory, name, value))
+                boosts = {"Troops": self.troops, "Ground": self.ground, "Air": self.air}
+                free_units = territory.find("FreeUnits")
+                if free_units is None:
+                    ops.append((INSERT, territory, ET.Element("FreeUnits", {
+                        name: str(boost) for name, boost in boosts.items()})))
+                    continue
+                for name, boost in boosts.items():
+                    ops.append((SET, free_units, name, str(int(free_units.get(name) or 0) + boost)))
+
+
+def _completed_count(counter: ET.Element) -> Optional[str]:
+    achievement = ACHIEVEMENTS.get(counter.get("crc_id", ""))
+    if achievement is None or int(counter.get("count") or 0) >= achievement["max"]:
+        return None
+    return str(achievement["max"])
+
+
+class CompiledPreset:
+    """The operations a preset makes on one tree"""
+
+    def __init__(self, preset: "Preset", ops: List[tuple], sections: Set[str]):
+        self.preset = preset
+        self.ops = ops
+        self.sections = sections  # Section tags with operations
+
+    @property
+    def manager_keys(self) -> Set[str]:
+        """Editor tabs showing the changed sections"""
+        return managers_for_tags(self.sections)
+
+    def apply(self, journal=None) -> int:
+        """Apply the operations; through journal, they undo and redo as one step"""
+        perform(self.ops, journal, self.preset.label)
+        return len(self.ops)
+
+
+@dataclass(frozen=True)
+class Preset:
+    """Named set of rules, compiled against a save with one walk over its tree"""
+    label: str
+    description: str
+    rules: tuple
+
+    def compile(self, root: ET.Element) -> CompiledPreset:
+        sections = index_sections(root, {rule.section for rule in self.rules})
+        ops: List[tuple] = []
+        changed = set()
+        for rule in self.rules:
+            count = len(ops)
+            rule.compile(sections, ops)
+            if len(ops) > count:
+                changed.add(rule.section)
+        logging.getLogger('Preset').debug("%s: %d operations on %s", self.label, len(ops), sorted(changed))
+        return CompiledPreset(self, ops, changed)
+
+
+PRESETS = {
+    'complete': Preset(
+        "100% completion",
+        "Completes all achievements and unlocks all pins, skills and Pandorapedia articles.",
+        (
+            SetAttribute("AchievementCounter", "AchievementCounter", "count", _completed_count),
+            SetAttribute("AvatarPinDB_Status", "Pin", "eUnlocked", "1"),
+            SetAttribute("AvatarSkillDB_Status", "Skill", "eLocked", "0", unless=("0", "2")),
+            SetAttribute("AvatarPandorapediaDB_Status", "Article", "eKnown", "1", only=("0",)),
+        )
+    ),
+    'fresh_navi': Preset(
+        "Fresh Na'vi start",
+        "Makes the character a Na'vi and resets achievements, pins and Pandorapedia articles.",
+        (
+            SetAttribute("Metagame", "Metagame", "PlayerFaction", "1"),
+            SetAttribute("AchievementCounter", "AchievementCounter", "count", "0"),
+            SetAttribute("AvatarPinDB_Status", "Pin", "eUnlocked", "0"),
+            SetAttribute("AvatarPandorapediaDB_Status", "Article", "eKnown", "0"),
+        )
+    ),
+    'hard_mode': Preset(
+        "Hard Mode",
+        "Adds 3,000 troops, 20 ground and 10 air units, all defenses and a factory "
+        "to every territory of the opposing faction.",
+        (ReinforceOpponent(),)
+    ),
+}
+
+
+def apply_preset_to_save(preset_name: str, path: Path, dry_run: bool = False,
+                         backup_store: Optional[BackupStore] = None, max_backups: int = 0) -> int:
+    """Batch entry point: apply a preset to one save file or PS3 save folder; returns the operation count"""
+    document = SaveDocument(path)
+    compiled = PRESETS[preset_name].compile(document.root)
+    if compiled.ops and not dry_run:
+        compiled.apply()
+        document.write(backup_store, max_backups)
+    return len(compiled.ops)
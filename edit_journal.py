@@ -0,0 +1,251 @@
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from typing import Callable, List, Optional
+import logging
+
+
+# Journal operations are plain tuples, first item the opcode:
+#   (SET, element, name, old, new)      attribute change, None = attribute absent
+#   (TEXT, element, old, new)           element text change
+#   (INSERT, parent, index, child)      child inserted at index
+#   (REMOVE, parent, index, child)      child removed from index
+#   (CHILDREN, parent, old, new)        child list replaced (recorded by watched transactions)
+SET, TEXT, INSERT, REMOVE, CHILDREN = range(5)
+
+
+def _set_attribute(element: ET.Element, name: str, value: Optional[str]) -> None:
+    if value is None:
+        element.attrib.pop(name, None)
+    else:
+        element.set(name, value)
+
+
+def _apply(op: tuple, forward: bool) -> None:
+    code = op[0]
+    if code == SET:
+        _, element, name, old, new = op
+        _set_attribute(element, name, new if forward else old)
+    elif code == TEXT:
+        _, element, old, new = op
+        element.text = new if forward else old
+    elif code == CHILDREN:
+        _, parent, old, new = op
+        parent[:] = new if forward else old
+    else:
+        _, parent, index, child = op
+        if (code == INSERT) == forward:
+            parent.insert(index, child)
+        elif any(existing is child for existing in parent):
+            # A watched CHILDREN op of the same transaction may have moved it already
+            parent.remove(child)
+
+
+def perform(edits: List[tuple], journal: Optional["EditJournal"] = None, label: str = "Edit",
+            manager_key: str = "*", section: str = "*") -> None:
+    """
+    Apply a list of planned edits, through journal (as one transaction) if given:
+        (SET, element, name, value)   set (None: delete) an attribute
+        (INSERT, parent, child)       append child
+        (REMOVE, parent, child)       remove child
+    """
+    if journal is None:
+        for edit in edits:
+            if edit[0] == SET:
+                _set_attribute(edit[1], edit[2], edit[3])
+            elif edit[0] == INSERT:
+                edit[1].append(edit[2])
+            else:
+                edit[1].remove(edit[2])
+        return
+    with journal.transaction(label, manager_key, section):
+        for edit in edits:
+            if edit[0] == SET:
+                journal.set(edit[1], edit[2], edit[3])
+            elif edit[0] == INSERT:
+                journal.append(edit[1], edit[2])
+            else:
+                journal.remove(edit[1], edit[2])
+
+
+class Transaction:
+    """The operations of one user action, undone and redone as a unit"""
+    __slots__ = ('label', 'manager_key', 'section', 'ops')
+
+    def __init__(self, label: str, manager_key: str, section: str):
+        self.label = label
+        self.manager_key = manager_key
+        self.section = section
+        self.ops: List[tuple] = []
+
+
+class _Snapshot:
+    """Attributes, text and children of every element under a watched element"""
+
+    def __init__(self, root: ET.Element):
+        self.root = root
+        self.state = {id(element): (element, dict(element.attrib), element.text, list(element))
+                      for element in root.iter()}
+
+    def diff(self) -> List[tuple]:
+        ops = []
+        for element in self.root.iter():
+            before = self.state.get(id(element))
+            if before is None:
+                continue  # New element: restored with its parent's child list
+            _, attrib, text, children = before
+            if element.attrib != attrib:
+                for name in attrib.keys() | element.attrib.keys():
+                    old, new = attrib.get(name), element.attrib.get(name)
+                    if old != new:
+                        ops.append((SET, element, name, old, new))
+            if element.text != text:
+                ops.append((TEXT, element, text, element.text))
+            current = list(element)
+            if len(current) != len(children) or any(a is not b for a, b in zip(current, children)):
+                ops.append((CHILDREN, element, children, current))
+        return ops
+
+
+class EditJournal:
+    """
+    Undo/redo history of the edits made to the loaded save's XML tree.
+
+    Edits go through set()/insert()/append()/remove(), which change the tree
+    and record the operation. Edits made inside a transaction() undo and redo
+    together, so "Unlock all" is one step. Code that edits a subtree directly
+    can pass watch=element to transaction(); the subtree is compared when the
+    transaction ends and the differences are recorded.
+
+    Listeners are called as listener(transaction, op, forward) right after each
+    operation is applied to the tree, including by undo, redo and rollback.
+    """
+
+    def __init__(self, max_transactions: int = 100):
+        self.logger = logging.getLogger('EditJournal')
+        self.max_transactions = max_transactions
+        self.undo_stack: List[Transaction] = []
+        self.redo_stack: List[Transaction] = []
+        self._current: Optional[Transaction] = None
+        self._snapshots: List[_Snapshot] = []
+        self.listeners: List[Callable[[Transaction, tuple, bool], None]] = []
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self.undo_stack)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self.redo_stack)
+
+    def _notify(self, transaction: Transaction, op: tuple, forward: bool) -> None:
+        for listener in self.listeners:
+            try:
+                listener(transaction, op, forward)
+            except Exception as e:
+                self.logger.error("Journal listener failed: %s", e, exc_info=True)
+
+    def _watched_ops(self, transaction: Transaction) -> None:
+        ops = self._snapshots.pop().diff()
+        transaction.ops.extend(ops)
+        for op in ops:
+            self._notify(transaction, op, True)
+
+    def clear(self) -> None:
+        """Forget the history, e.g. when another save is loaded"""
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+
+    @contextmanager
+    def transaction(self, label: str, manager_key: str, section: str = "*", watch: Optional[ET.Element] = None):
+        """
+        Group the edits made in the with-block into one undo step. Nested
+        transactions join the outer one. If the block raises, its edits are
+        rolled back.
+        """
+        if watch is not None:
+            self._snapshots.append(_Snapshot(watch))
+        if self._current is not None:
+            # Nested: the outer transaction collects the operations
+            try:
+                yield self._current
+            finally:
+                if watch is not None:
+                    self._watched_ops(self._current)
+            return
+
+        transaction = self._current = Transaction(label, manager_key, section)
+        try:
+            yield transaction
+            if watch is not None:
+                self._watched_ops(transaction)
+        except BaseException:
+            if watch is not None:
+                self._watched_ops(transaction)
+            for op in reversed(transaction.ops):
+                _apply(op, False)
+                self._notify(transaction, op, False)
+            raise
+        finally:
+            self._current = None
+        self._commit(transaction)
+
+    def _commit(self, transaction: Transaction) -> None:
+        if not transaction.ops:
+            return
+        self.undo_stack.append(transaction)
+        del self.undo_stack[:-self.max_transactions]
+        self.redo_stack.clear()
+        self.logger.debug("Recorded '%s': %d operations", transaction.label, len(transaction.ops))
+
+    def _record(self, op: tuple, label: str, manager_key: str, section: str) -> None:
+        transaction = self._current or Transaction(label, manager_key, section)
+        transaction.ops.append(op)
+        self._notify(transaction, op, True)
+        if transaction is not self._current:
+            self._commit(transaction)
+
+    def set(self, element: ET.Element, name: str, value: Optional[str],
+            manager_key: str = "", section: str = "*") -> bool:
+        """Set (or with None, delete) an attribute; returns False if it already had that value"""
+        old = element.get(name)
+        if old == value:
+            return False
+        _set_attribute(element, name, value)
+        self._record((SET, element, name, old, value), f"Set {name}", manager_key, section)
+        return True
+
+    def insert(self, parent: ET.Element, index: int, child: ET.Element,
+               manager_key: str = "", section: str = "*") -> None:
+        index = min(max(index if index >= 0 else len(parent) + index, 0), len(parent))
+        parent.insert(index, child)
+        self._record((INSERT, parent, index, child), f"Add {child.tag}", manager_key, section)
+
+    def append(self, parent: ET.Element, child: ET.Element, manager_key: str = "", section: str = "*") -> None:
+        self.insert(parent, len(parent), child, manager_key, section)
+
+    def remove(self, parent: ET.Element, child: ET.Element, manager_key: str = "", section: str = "*") -> None:
+        index = list(parent).index(child)
+        parent.remove(child)
+        self._record((REMOVE, parent, index, child), f"Remove {child.tag}", manager_key, section)
+
+    def undo(self) -> Optional[Transaction]:
+        """Revert the latest transaction; returns it, or None if there is nothing to undo"""
+        if not self.undo_stack or self._current is not None:
+            return None
+        transaction = self.undo_stack.pop()
+        for op in reversed(transaction.ops):
+            _apply(op, False)
+            self._notify(transaction, op, False)
+        self.redo_stack.append(transaction)
+        return transaction
+
+    def redo(self) -> Optional[Transaction]:
+        """Re-apply the latest undone transaction; returns it, or None if there is nothing to redo"""
+        if not self.redo_stack or self._current is not None:
+            return None
+        transaction = self.redo_stack.pop()
+        for op in transaction.ops:
+            _apply(op, True)
+            self._notify(transaction, op, True)
+        self.undo_stack.append(transaction)
+        return transaction
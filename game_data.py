@@ -0,0 +1,766 @@
+# Static game tables keyed by the crc ids the save uses, shared by the editor tabs
+# and the headless tools
+
+# Achievement counters: name, count that completes it, category
+ACHIEVEMENTS = {
+    # Developer/Debug Achievements
+    "3959147003": {"name": "Mission_ORouleau_1", "max": 1, "category": "Debug"},
+    "3975313082": {"name": "pin_z_dev_orouleau", "max": 1, "category": "Debug"},
+    "3887901362": {"name": "orowin", "max": 2, "category": "Debug"},
+
+    # Story Achievements - RDA Path
+    "3614666474": {"name": "Orientation Day Graduate", "max": 1, "category": "Story"},
+    "1964522520": {"name": "War's Begun", "max": 1, "category": "Story"},
+    "820789492": {"name": "The First Harmonic", "max": 1, "category": "Story"},
+    "3708977241": {"name": "Harmonic in the FEBA", "max": 1, "category": "Story"},
+    "148645412": {"name": "Grave's Bog Harmonic", "max": 1, "category": "Story"},
+    "3177295287": {"name": "Hanging Gardens Mission", "max": 1, "category": "Story"},
+    "587544596": {"name": "Coualt Highlands Mission", "max": 1, "category": "Story"},
+    "1863714547": {"name": "RDA Tantalus Complete", "max": 1, "category": "Story"},
+
+    # Story Achievements - Na'vi Path
+    "565628866": {"name": "Na'vi Blue Lagoon", "max": 1, "category": "Story"},
+    "1752941290": {"name": "Na'vi Tantalus Start", "max": 1, "category": "Story"},
+    "2793192431": {"name": "Na'vi Tantalus Mission", "max": 1, "category": "Story"},
+    "208366408": {"name": "Verdant Pinnacle", "max": 1, "category": "Story"},
+    "149358130": {"name": "Dust Bowl Mission", "max": 1, "category": "Story"},
+    "260134042": {"name": "Prolemuris Land", "max": 1, "category": "Story"},
+    "4216837213": {"name": "Vadera's Hollow", "max": 1, "category": "Story"},
+    "1791022025": {"name": "Deserted Heaven", "max": 1, "category": "Story"},
+    "2702278646": {"name": "Na'vi Tantalus Final", "max": 1, "category": "Story"},
+
+    # Clean Sweep Achievements
+    "355473279": {"name": "Sebastien Clean Sweep", "max": 1, "category": "Completion"},
+    "2587251285": {"name": "Needle Hills Clean Sweep", "max": 1, "category": "Completion"},
+    "1172651822": {"name": "Philippe Clean Sweep", "max": 1, "category": "Completion"},
+    "1847852653": {"name": "Grave's Bog Clean Sweep", "max": 1, "category": "Completion"},
+    "2171723794": {"name": "Coualt Highlands Clean Sweep", "max": 1, "category": "Completion"},
+    "3409126972": {"name": "Plains of Goliath Clean Sweep", "max": 1, "category": "Completion"},
+    "2943222331": {"name": "Verdant Pinnacle Clean Sweep", "max": 1, "category": "Completion"},
+    "2292208788": {"name": "Dust Bowl Clean Sweep", "max": 1, "category": "Completion"},
+    "1057194188": {"name": "Vadera's Hollow Clean Sweep", "max": 1, "category": "Completion"},
+    "2856892107": {"name": "Nancy Clean Sweep", "max": 1, "category": "Completion"},
+    "238707229": {"name": "Pascal Clean Sweep", "max": 1, "category": "Completion"},
+    "1497753099": {"name": "Clean Sweep of Pandora", "max": 11, "category": "Completion"},
+
+    # Progression Achievements
+    "704269734": {"name": "Claim 50% Territories", "max": 1, "category": "Progression"},
+    "2646580024": {"name": "Pandorapedia Articles", "max": 20, "category": "Collection"},
+    "2932051916": {"name": "Fallback Kills", "max": 100, "category": "Combat"},
+
+    # Skill Achievements - Corporate
+    "3305899539": {"name": "Corporate Skill Slot 1A", "max": 20, "category": "Skills"},
+    "77959529": {"name": "Corporate Skill Slot 1B", "max": 20, "category": "Skills"},
+    "370163335": {"name": "Corporate Skill Slot 2B", "max": 20, "category": "Skills"},
+    "3619269117": {"name": "Corporate Skill Slot 2A", "max": 20, "category": "Skills"},
+    "1862651544": {"name": "Corporate Skill Slot 3A", "max": 20, "category": "Skills"},
+    "4073911841": {"name": "Corporate Skill Slot 4A", "max": 20, "category": "Skills"},
+    "863723867": {"name": "Corporate Skill Slot 4B", "max": 20, "category": "Skills"},
+    "2847917574": {"name": "Grade 4 Corporate Skills", "max": 7, "category": "Skills"},
+
+    # Skill Achievements - Na'vi
+    "2171844251": {"name": "Na'vi Skill Slot 1A", "max": 20, "category": "Skills"},
+    "4154870226": {"name": "Na'vi Skill Slot 1B", "max": 20, "category": "Skills"},
+    "3843286588": {"name": "Na'vi Skill Slot 2B", "max": 20, "category": "Skills"},
+    "2167405524": {"name": "Na'vi Skill Slot 2A", "max": 20, "category": "Skills"},
+    "376364380": {"name": "Na'vi Skill Slot 3A", "max": 20, "category": "Skills"},
+    "611800566": {"name": "Na'vi Skill Slot 3P", "max": 20, "category": "Skills"},
+    "3229137376": {"name": "Na'vi Skill Slot 4A", "max": 20, "category": "Skills"},
+    "2479233397": {"name": "Na'vi Skill Slot 2A Alt", "max": 20, "category": "Skills"},
+    "1363959317": {"name": "Grade 4 Na'vi Skills", "max": 8, "category": "Skills"},
+    "1716177172": {"name": "Grade 4 All Skills", "max": 1, "category": "Skills"},
+
+    # Multiplayer Achievements
+    "3049880868": {"name": "10 Kills in a Row", "max": 10, "category": "Multiplayer"},
+    "569487683": {"name": "Play 150 Matches", "max": 150, "category": "Multiplayer"},
+    "830999210": {"name": "Finish Match Most Kills", "max": 1, "category": "Multiplayer"},
+    "594996582": {"name": "Win 3-0 CTF", "max": 3, "category": "Multiplayer"},
+    "4203819019": {"name": "RDA 3 Intact Missiles", "max": 3, "category": "Multiplayer"},
+    "2779487515": {"name": "Na'vi Destroy All Missiles", "max": 1, "category": "Multiplayer"},
+    "4118326594": {"name": "Win 5 Capture & Hold", "max": 5, "category": "Multiplayer"},
+    "270754235": {"name": "Win 5 King of the Hill", "max": 5, "category": "Multiplayer"},
+}
+
+# Weapons, armor and other possessions by crc_ItemID
+ITEM_NAMES = {
+    #############################################
+
+    # RDA Weapons
+
+    # Dual Wasp Pistol
+    "1042188764": "Dual Wasp Pistol I",
+    "815885611": "Dual Wasp Pistol II",
+    "760079057": "Dual Wasp Pistol III",
+    "999316102": "Dual Wasp Pistol IV",
+
+    # DLC Dual Wasp Pistols
+    "3859060838": "DLC WARLOCK Dual Wasp Pistol I",
+    "3904601233": "DLC WARLOCK Dual Wasp Pistol II",
+    "102867538": "DLC WARLOCK Dual Wasp Pistol III",
+    "749353518": "DLC WARLOCK Dual Wasp Pistol IV",
+
+    # Standard Issue Rifle
+    "1130814347": "Standard Issue Rifle TERRA I",
+    "1306083196": "Standard Issue Rifle EURYS II",
+    "3628031700": "Standard Issue Rifle SOLARIS III",
+    "1146928137": "Standard Issue Rifle SOLARIS IV",
+
+    # DLC Standard Issue Rifles
+    "2850329205": "DLC ARGO Standard Issue Rifle I",
+    "2807789186": "DLC ARGO Standard Issue Rifle II",
+    "2194670470": "DLC ARGO Standard Issue Rifle III",
+    "324172685": "DLC ARGO Standard Issue Rifle IV",
+
+    # Combat Shotgun
+    "2313824646": "Combat Shotgun PHALANX I",
+    "2270547313": "Combat Shotgun PHALANX II",
+    "2789519003": "Combat Shotgun PHALANX III",
+    "1919695864": "Combat Shotgun PHALANX IV",
+
+    # DLC Combat Shotguns
+    "2664450350": "DLC SIGNET Combat Shotgun I",
+    "2423238105": "DLC SIGNET Combat Shotgun II",
+    "2120138529": "DLC SIGNET Combat Shotgun III",
+    "4289908838": "DLC SIGNET Combat Shotgun IV",
+
+    # Assault Rifle
+    "2397981034": "Assault Rifle TERRA I",
+    "2152836509": "Assault Rifle EURYS II",
+    "268371112": "Assault Rifle SOLARIS III",
+    "466145020": "Assault Rifle SOLARIS IV",
+
+    # DLC Assault Rifles
+    "3655372526": "DLC BARRO Assault Rifle I",
+    "3613354521": "DLC BARRO Assault Rifle II",
+    "3850194262": "DLC BARRO Assault Rifle III",
+    "2109370248": "DLC BARRO Assault Rifle IV",
+
+    # M60 Machine Gun
+    "85991974": "BANISHER M60 Machine Gun I",
+    "195020497": "BANISHER M60 Machine Gun II",
+    "1881065336": "BANISHER M60 Machine Gun III",
+    "1796958374": "BANISHER M60 Machine Gun IV",
+
+    # DLC Machine Guns
+    "2015914953": "DLC STELLAR M60 Machine Gun I",
+    "1989644094": "DLC STELLAR M60 Machine Gun II",
+    "1087779032": "DLC STELLAR M60 Machine Gun III",
+    "1691104809": "DLC STELLAR M60 Machine Gun IV",
+
+    # Grenade Launcher
+    "94681171": "Grenade Launcher M222 - I",
+    "186342564": "Grenade Launcher M222 - II",
+    "1349633617": "Grenade Launcher M222 - III",
+    "4018216358": "Grenade Launcher M222 - IV",
+
+    # DLC Grenade Launchers
+    "2157668310": "DLC CRUSHER Grenade Launcher I",
+    "2384757537": "DLC CRUSHER Grenade Launcher II",
+    "3441856033": "DLC CRUSHER Grenade Launcher III",
+    "3043901684": "DLC CRUSHER Grenade Launcher IV",
+
+    # Flamethrower
+    "2529862352": "Flamethrower VESUPYRE I",
+    "2557822503": "Flamethrower STERILATOR II",
+    "609450705": "Flamethrower BUSHBOSS III",
+    "2288255787": "Flamethrower BUSHBOSS IV",
+
+    # DLC Flamethrowers
+    "3250873684": "DLC BUDDY Flamethrower I",
+    "3480977827": "DLC BUDDY Flamethrower II",
+    "3469816623": "DLC BUDDY Flamethrower III",
+    "3994460767": "DLC BUDDY Flamethrower IV",
+
+    # Nail Gun
+    "2548581230": "Nail Gun HAMMER I",
+    "2572658585": "Nail Gun HAMMER II",
+    "143378107": "Nail Gun HAMMER III",
+    "1911864170": "Nail Gun HAMMER IV",
+
+    # DLC Nail Guns
+    "2161255366": "DLC DENT Nail Gun I",
+    "2389559089": "DLC DENT Nail Gun II",
+    "3499218689": "DLC DENT Nail Gun III",
+    "4230631668": "DLC DENT Nail Gun IV",
+
+    # RDA Ammo
+    "4029490973": "Rifle Ammo",
+    "2220072441": "Shotgun Ammo",
+    "3183424835": "SMG Ammo",
+    "3227899887": "Grenade Ammo",
+    "4198025789": "Rocket Ammo",
+    "2442117335": "LMG Ammo",
+    "3819023512": "Heavy Ammo",
+
+    #############################################
+
+    # RDA Armor Sets
+
+    # E3 Exotant Armor Set
+    "666504347":  "E3 Exotant Head",
+    "531856612":  "E3 Exotant Torso",
+    "1234921930": "E3 Exotant Legs",
+
+    # Tusk Armor set
+    "2800661647": "Tusk Head",
+    "2024422324": "Tusk Torso",
+    "1949228588": "Tusk Legs",
+
+    # Titan Armor Set
+    "4082430736": "Titan Head",
+    "205852157":  "Titan Torso",
+    "1052486966": "Titan Legs",
+
+    # Militum Armor Set
+    "149499402":  "Militum Head",
+    "4160278759": "Militum Torso",
+    "3305533484": "Militum Legs",
+
+    # Kodiak Armor Set
+    "1593826001": "Kodiak Head",
+    "2716738620": "Kodiak Torso",
+    "2467333367": "Kodiak Legs",
+
+    # Exotant Armor Set
+    "3527939275": "Exotant Head",
+    "1193780569": "Exotant Torso",
+    "1379870057": "Exotant Legs",
+
+    # Centauri Armor Set
+    "403319592":  "Centauri Head",
+    "3877361093": "Centauri Torso",
+    "3588584718": "Centauri Legs",
+
+    # Hydra Armor Set
+    "3753317026": "Hydra Head",
+    "1851965193": "Hydra Torso",
+    "2428117146": "Hydra Legs",
+
+    # Warthog Armor Set
+    "2823901304": "Warthog Head",
+    "1981144899": "Warthog Torso",
+    "2056338139": "Warthog Legs",
+
+    # Viper Armor Set
+    "3980056687": "Viper Head",
+    "3574042272": "Viper Torso",
+    "1417888964": "Viper Legs",
+
+    # DLC BRASHER I Armor Set
+    "3005472419": "DLC BRASHER I Head",
+    "730661330": "DLC BRASHER I Torso",
+    "3718956374": "DLC BRASHER I Legs",
+
+    # DLC BRASHER IV Armor Set
+    "3064631211": "DLC BRASHER II Head",
+    "2822640242": "DLC BRASHER II Torso",
+    "2398239326": "DLC BRASHER II Legs",
+
+    # DLC BRASHER III Armor Set
+    "3228789267": "DLC BRASHER III Head",
+    "1063425278": "DLC BRASHER III Troso",
+    "228340789": "DLC BRASHER III Legs",
+
+    # DLC BRASHER IV Armor Set
+    "3818917462": "DLC BRASHER IV Head",
+    "1993326532": "DLC BRASHER IV Torso",
+    "1675050996": "DLC BRASHER IV Legs",
+
+    # DLC MISHETICA I Armor Set
+    "1563279247": "DLC MISHETICA I Head",
+    "3313721598": "DLC MISHETICA I Torso",
+    "866428026": "DLC MISHETICA I Legs",
+
+    # DLC MISHETICA II Armor Set
+    "4103047382": "DLC MISHETICA II Head",
+    "3927643407": "DLC MISHETICA II Torso",
+    "3436657955": "DLC MISHETICA II Legs",
+
+    # DLC MISHETICA III Armor Set
+    "4001710741": "DLC MISHETICA III Head",
+    "294960248": "DLC MISHETICA III Torso",
+    "594156723": "DLC MISHETICA III Legs",
+
+    # DLC MISHETICA IV Armor Set
+    "1950293887": "DLC MISHETICA IV Head",
+    "3780161261": "DLC MISHETICA IV Torso",
+    "4098371293": "DLC MISHETICA IV Legs",
+
+    # Default RDA Armor Set
+    "433486271":  "Default RDA Head",
+    "2818823188": "Default RDA Torso",
+    "1457212295": "Default RDA Legs",
+
+    #############################################
+
+    # Na'vi Weapons
+
+    # Dual Blade
+    "2740507591": "Ikranä Syal Dual Blade I",
+    "2917611312": "'Angtsìkä Zawng Dual Blade II",
+    "2813685095": "Palulukanä Srew Dual Blade III",
+    "2948460035": "Torukä Way Dual Blade IV",
+
+    # DLC Dual Blade
+    "2285146948": "DLC Tanhì Dual Blade I",
+    "2257287091": "DLC Tanhì Dual Blade II",
+    "3543126973": "DLC Tanhì Dual Blade III",
+    "2007498681": "DLC Tanhì Dual Balde IV",
+
+    # Crossbow
+    "1662469074": "Taronyu Crossbow I",
+    "1839769381": "Tsamsiyu Crossbow II",
+    "3400058396": "Kyktan Crossbow III",
+    "1514231420": "Nawm Crossbow IV",
+
+    # DLC Crossbow
+    "3138212456": "DLC PXI Crossbow I",
+    "2486913109": "DLC PXI Crossbow II",
+    "2589205711": "DLC PXI Crossbow III",
+    "1886472672": "DLC PXI Crossbow IV",
+
+    # M30 Machine Gun
+    "1304439874": "AVR-M30 Machine Gun I",
+    "1132447925": "AVR-M30 Machine Gun II",
+    "982090295": "AVR-M30 Machine Gun III",
+    "958613249": "AVR-M30 Machine Gun IV",
+
+    # ELITE M30 Machine Gun
+    "1048019290": "ELITE AVR-M30 II",
+    "172062103": "ELITE AVR-M30 III",
+    "921966990": "ELITE AVR-M30 IV",
+
+    # Club
+    "4093397293": "Taronyu Club I",
+    "4249071066": "Tsamsiyu Club II",
+    "3879387803": "Eyktan Club III",
+    "240531571": "Nawm Club IV",
+
+    # DLC Axe
+    "1958996617": "DLC Ikran Axe 'Eko",
+    "2689671946": "DLC Ikran Axe Kurakx",
+    "1639187137": "DLC Ikran Axe Tsmukan",
+    "2934884349": "DLC Ikran Axe 'Ampi",
+
+    # Fighting Staff
+    "2255793432": "Ikranä Zawng Fighting Staff I",
+    "2295024111": "Pa'liä Tìtxur Fighting Staff II",
+    "2986118748": "Palulukanä Tìtakuk Fighting Staff III",
+    "3960574385": "Torukä Tirea Fighting Staff IV",
+
+    # DLC Fighting Staff
+    "1828119782": "DLC Hufwe Fighting Staff I",
+    "1648951313": "DLC Hufwe Fighting Staff II",
+    "3943944974": "DLC Hufwe Fighting Staff III",
+    "3139393077": "DLC Hufwe Fighting Staff IV",
+
+    # Bow
+    "291262189": "DLC Taronyu Tsko Bow I",
+    "371977402": "Tsko Nawm Bow IV",
+    "2092736556": "Tsko Kyktan Bow III",
+    "535013914": "Tasmsiyu Tsko Bow II",
+
+    # DLC Bow
+    "1817446146": "DLC RAWKE Bow I",
+    "1659626485": "DLC RAWKE Bow II",
+    "1282693004": "DLC RAWKE Bow III",
+    "435991093": "DLC RAWKE Bow IV",
+
+    # Na'vi Ammo
+    "1042656528": "Arrow Ammo",
+    "435601722": "Spear Ammo",
+    "3069972540": "Poison Ammo",
+
+    #############################################
+
+    # Na'vi Armor
+
+    # RDA-Issue Avatar Gear
+    "236713729": "RDA-Issue Avatar Head",
+    "2228061969": "RDA-Issue Avatar Torso",
+    "753645081": "RDA-Issue Avatar Legs",
+
+    # TSAMSIYU Armor Set
+    "3705555217":"TSAMSIYU Head",
+    "1869067530":"TSAMSIYU Torso",
+    "780789927":"TSAMSIYU Legs",
+
+    # NAWM Armor III
+    "3363478556": "NAWM Head",
+    "1118628876": "NAWM Torso",
+    "3934969092": "NAWM Legs",
+
+    # EYKTAN Armor Set
+    "84098544": "EYKTAN Head",
+    "3666151432": "EYKTAN Torso",
+    "815973795": "EYKTAN Legs",
+
+    # KARYU Armor Set
+    "2070955956": "KARYU Head",
+    "1711646853": "KARYU Torso",
+    "2024863229": "KARYU Legs",
+
+    # NAWMA EYKTAN Armor Set
+    "1519513878": "NAWMA EYKTAN Head",
+    "2232927470": "NAWMA EYKTAN Torso",
+    "1865419077": "NAWMA EYKTAN Legs",
+
+    # NAWMA TARONYU Armor Set
+    "3932154789": "NAWMA TARONYU Head",
+    "884530381": "NAWMA TARONYU Torso",
+    "3480671099": "NAWMA TARONYU Legs",
+
+    # NAWMA TSAMSIYU Armor Set
+    "25166328": "NAWMA TSAMSIYU Head",
+    "3724948480": "NAWMA TSAMSIYU Torso",
+    "874641835": "NAWMA TSAMSIYU Legs",
+
+    # TIREA Armor Set
+    "985254384": "TIREA Head",
+    "386149755": "TIREA Torso",
+    "216177023": "TIREA Legs",
+
+    # 'AWVEA TSAMSIYU Armor Set
+    "3529616870": "'AWVEA TSAMSIYU Head",
+    "1641566717": "'AWVEA TSAMSIYU Torso",
+    "540413008": "'AWVEA TSAMSIYU Legs",
+
+    # TSTEU II Armor Set
+    "1336514870": "DLC TSTEU II Head",
+    "904822394": "DLC TSTEU II Torso",
+    "848846039": "DLC TSTEU II Legs",
+
+    # TSTEU III Armor Set
+    "1312065276": "DLC TSTEU III Head",
+    "824495264": "DLC TSTEU III Torso",
+    "2571396567": "DLC TSTEU III Legs",
+
+    # TSTEU IV Armor Set
+    "1500118218": "DLC TSTEU IV Head",
+    "1960056897": "DLC TSTSU IV Torso",
+    "1865591877": "DLC TSTEU IV legs",
+
+    # TARONYU II Armor Set
+    "3240533717": "DLC TARONYU II Head",
+    "3143727513": "DLC TARONYU II Torso",
+    "3155647284": "DLC TARONYU II Legs",
+
+    # TARONYU III Armor Set
+    "2008660537": "DLC TARONYU III Head",
+    "145354853": "DLC TARONYU III Torso",
+    "2697550098": "DLC TARONYU III Legs",
+
+    # TARONYU IV Armor Set
+    "1753343575": "DLC TARONYU IV Head",
+    "1161560796": "DLC TARONYU IV Torso",
+    "1591391960": "DLC TARONYU IV Legs",
+}
+
+# Map pins (locations) by crc_id
+PIN_LOCATION_NAMES = {
+    # SP MAPS
+    "3822194552": "HOMETREE",
+    "1057194188": "VA'ERÄ RAMUNONG",
+    "1172651822": "THE FEBA",
+    "1847852653": "GRAVE'S BOG",
+    "2171723794": "THE HANGING GARDENS",
+    "2292208788": "SWOTULU",
+    "238707229":  "TORUKÄ NA'RìNG",
+    "2587251285": "NEEDLE HILLS",
+    "2752812145": "ECHO CHASM",
+    "2856892107": "KXANìA TAW",
+    "2961077726": "LOST CATHEDRAL",
+    "3409126972": "PLAINS OF GOLIATH (KAOLIÄ TEI)",
+    "355473279":  "BLUE LAGOON",
+    "2943222331": "IKNIMAYA",
+    "615754132":  "HELL'S GATE",
+    "837458676":  "TANTALUS (TA'NATASI)",
+    # MULTIPLAYER
+    "1437051617": "IKNIMAYA - MULTIPLAYER",
+    "902032528":  "NA'RìNG - MULTIPLAYER",
+    "1846881984": "FREYNA TARON - MULTIPLAYER",
+    "2427499480": "NO'ANI TEI - MULTIPLAYER",
+    "4220570174": "KXANìA TAW - MULTIPLAYER",
+    "4168272830": "VA'ERÄ RAMUNONG - MULTIPLAYER",
+    "408444403":  "UNIL TUKRU - MULTIPLAYER",
+    "3575765971": "VUL NAWM - MULTIPLAYER",
+    "948986278":  "SWOTULU - MULTIPLAYER",
+    "2232107097": "FORT NAVARONE - MULTIPLAYER",
+    "3616200713": "STALKER'S VALLEY - MULTIPLAYER",
+    "2509501782": "HELL'S GATE - MULTIPLAYER",
+    # FIXME! PINS
+    "105239137":  "FIXME! 105239137",
+    "1504064473": "FIXME! 1504064473",
+    "1578821154": "FIXME! 1578821154",
+    "1628184437": "FIXME! 1628184437",
+    "1741938656": "FIXME! 1741938656",
+    "1771880106": "FIXME! 1771880106",
+    "1782610090": "FIXME! 1782610090",
+    "1865345760": "FIXME! 1865345760",
+    "194406935":  "FIXME! 194406935",
+    "2001468046": "FIXME! 2001468046",
+    "2169212369": "Dev Room: Animation Creatures",
+    "2185381138": "FIXME! 2185381138",
+    "2216033045": "FIXME! 2216033045",
+    "2353717556": "FIXME! 2353717556",
+    "2555792139": "FIXME! 2555792139",
+    "2672591835": "FIXME! 2672591835",
+    "3564339531": "FIXME! 3564339531",
+    "3586942544": "FIXME! 3586942544",
+    "3615918544": "FIXME! 3615918544",
+    "3903502716": "FIXME! 3903502716",
+    "3975313082": "Dev Room: Orouleau",
+    "4294730242": "FIXME! 4294730242",
+    "470159002":  "FIXME! 470159002",
+    "60855408":   "FIXME! 60855408",
+    "3852438644": "FIXME! 3852438644",
+}
+
+# Missions by crc_id
+MISSION_NAMES = {
+    # Main Story Missions
+    "148645412": "The First Harmonic",
+    "587544596": "Song of Ancient Forest",
+    "820789492": "Search for the Song",
+    "1964522520": "Assault on RDA Base",
+    "3614666474": "Reporting For Duty",
+    "11089996": "Cover Fire",
+    "90368515": "RDA Advanced Training",
+    "121662641": "Resource Depot Defense",
+    "215262760": "Secure the Mine",
+    "263316029": "Escort the Convoy",
+    "320553437": "Mineral Deposit Survey",
+    "431098125": "Missing Scientist",
+    "464447814": "Aerial Combat Drills",
+    "716403775": "Weapons Testing",
+    "818627565": "Science Project",
+    "931235053": "Lost Patrol",
+    "977638923": "Rogue Scientist",
+    "984264030": "Supply Line Defense",
+    "1030999372": "Security Systems Calibration",
+    "1036478791": "Pest Control",
+    "1042381703": "Creature Containment",
+    "1157473354": "Equipment Recovery",
+    "1204581243": "A New You",
+    "1206612066": "Flora Analysis",
+    "1249181146": "Experimental Weapons",
+    "1254119889": "Anti-Insurgent Operation",
+    "1313574664": "Resource Extraction",
+    "1327439578": "Medical Supply Delivery",
+    "1399835803": "Mine Sabotage Investigation",
+    "1409419394": "Hazardous Materials Transport",
+    "1506597615": "Arrived At Hells Gate",
+    "1546449249": "Territorial Expansion",
+    "1563937596": "Spy Network Elimination",
+    "1564508887": "Escort Mission",
+    "1572095145": "Chemical Spill Cleanup",
+    "1617867177": "Resource Gathering",
+    "1657988851": "Jungle Patrol",
+    "1775828354": "Field Research",
+    "1854235998": "Special Forces Operation",
+    "1919277717": "Machinery Repair",
+    "1949395925": "Comms Array Installation",
+    "1963466380": "Weapons Smuggling Investigation",
+    "2025247403": "Radar Outpost Setup",
+    "2037743848": "Artifact Recovery",
+    "2057131377": "Wildlife Control",
+    "2129913038": "Outpost Construction",
+    "2145064626": "Specimen Collection",
+    "2159761591": "Sabotage",
+    "2162960250": "VIP Protection",
+    "2223059682": "Reconnaissance",
+    "2278988974": "Hunter Challenge",
+    "2288339483": "Emergency Evacuation",
+    "2359406436": "Tech Recovery",
+    "2375737874": "Border Dispute",
+    "2446686110": "Hazardous Terrain Survey",
+    "2472171157": "Training Exercises",
+    "2528686983": "Anti-Air Defense Setup",
+    "2536946474": "Aerial Support",
+    "2538293033": "Experimental Tech Recovery",
+    "2556640181": "Mine Clearing",
+    "2577426934": "Legwork",
+    "2600894368": "Base Expansion",
+    "2624306105": "Tactical Assessment",
+    "2635659551": "Vehicle Recovery",
+    "2664279535": "Creature Taming",
+    "2691980924": "To The Lagoon",
+    "2699578136": "Territorial Dispute",
+    "2702278646": "Contamination Cleanup",
+    "2706890028": "Advanced Weaponry Test",
+    "2745433316": "Aerial Reconnaissance",
+    "2804427325": "Extraction Operation",
+    "2850361678": "Geological Survey",
+    "2853548239": "Indigenous Relations",
+    "2928203095": "Bridge Construction",
+    "2964671126": "Scout Network Establishment",
+    "3005466356": "Dangerous Wildlife Elimination",
+    "3018211430": "Supply Disruption",
+    "3121375662": "Communications Relay Setup",
+    "3176297883": "Intelligence Gathering",
+    "3177295287": "Prototype Weapon Test",
+    "3184855484": "Tunnel System Exploration",
+    "3188729112": "Ancient Artifacts",
+    "3223683550": "Pandoran Study",
+    "3277020831": "Special Materials Collection",
+    "3395722529": "Minefield Deployment",
+    "3440073016": "Resource Survey",
+    "3492747947": "Spy Network Disruption",
+    "3505535715": "Ambush Preparation",
+    "3548228704": "Defense Perimeter Setup",
+    "3553167467": "Fauna Relocation",
+    "3567570034": "Emergency Response",
+    "3591786336": "Waterfall Cave Expedition",
+    "3650086337": "Recon Drone Deployment",
+    "3708977241": "Advanced Combat Training",
+    "3869409139": "Special Mission 2",
+    "3872540424": "Remote Sensing Array",
+    "3922369913": "Resource Extraction",
+    "3941247737": "Vehicle Combat Training",
+    "3949759279": "Specimen Transport",
+    "3959508790": "Technology Demonstration",
+    "4003944800": "Reconnaissance Mission",
+    "4004743186": "Security Patrol",
+    "4040272952": "Territorial Control",
+    "4085556621": "Environmental Monitoring",
+    "4156182083": "Special Mission 1",
+    "4214204955": "Biodiversity Survey",
+    "4238570271": "Outpost Defense"
+}
+
+# Skills by crc_id, per category (a skill listed under two categories gets the later one)
+SKILL_CATEGORIES = {
+    "Combat": {
+        "370163335": "Rapid Fire",
+        "1588994160": "Precision Shot",
+        "2288728861": "Burst Fire",
+        "1298333286": "Quick Reload",
+        "1749835489": "Headshot",
+        "2901239959": "Combat Roll",
+        "228756694": "Suppression Fire",
+        "2122270851": "Incendiary Rounds",
+        "2193097390": "Frag Grenade",
+        "2282375423": "Armor Piercing"
+    },
+    "Survival": {
+        "3121856597": "Health Regeneration",
+        "208683785": "Resource Efficiency",
+        "4172838722": "Scavenger",
+        "1054477512": "Stamina Boost",
+        "1906639931": "Environmental Resistance",
+        "3989189724": "Heat Resistance",
+        "138960729": "Cold Resistance",
+        "1987225269": "Toxin Resistance",
+        "3072205389": "Quick Recovery",
+        "1147345197": "Endurance"
+    },
+    "Stealth": {
+        "3619269117": "Silent Movement",
+        "3919303244": "Camouflage",
+        "707441961": "Enhanced Vision",
+        "1533580208": "Distraction",
+        "1823892354": "Stealth Takedown",
+        "2248739839": "Shadow Step",
+        "464605972": "Quick Strike",
+        "1578904643": "Noise Reduction",
+        "2507739827": "Track Covering",
+        "3843286588": "Night Vision"
+    },
+    "Movement": {
+        "4279072873": "Sprint",
+        "4285766578": "Climbing",
+        "1774875854": "Swimming",
+        "2149792658": "Jump Height",
+        "4141500320": "Fall Damage Reduction",
+        "527383063": "Agility",
+        "611800566": "Acrobatics",
+        "863723867": "Wall Run",
+        "1533394898": "Balance",
+        "2479233397": "Terrain Navigation"
+    },
+    "Crafting": {
+        "2596340938": "Weapon Crafting",
+        "2815647090": "Armor Crafting",
+        "771604749": "Tool Crafting",
+        "2120156884": "Resource Gathering",
+        "154070465": "Material Analysis",
+        "1711548883": "Advanced Engineering",
+        "1785634812": "Recycling",
+        "2057681984": "Improvisation",
+        "2779483555": "Medical Supplies",
+        "2953989487": "Ammunition Crafting"
+    },
+    "Na'vi Connection": {
+        "3149590643": "Ikran Bond",
+        "3819761146": "Direhorse Bond",
+        "480060929": "Na'vi Language",
+        "525037175": "Tribal Knowledge",
+        "1411228025": "Forest Navigation",
+        "2932769824": "Plant Identification",
+        "3043422876": "Animal Handling",
+        "3605504349": "Hunting",
+        "4047834971": "Tsaheylu Mastery",
+        "4221139584": "Cultural Understanding"
+    },
+    "RDA Training": {
+        "929187032": "AMP Suit Operation",
+        "1073248985": "Vehicle Operation",
+        "1849804230": "Security Systems",
+        "1887679822": "Communications",
+        "2824265184": "Equipment Maintenance",
+        "3490889542": "Data Analysis",
+        "62547143": "Mining Operations",
+        "77959529": "Heavy Weapons",
+        "376364380": "Technology Interface",
+        "521610040": "Science Research"
+    },
+    "Specialist": {
+        "699117554": "Sniper Training",
+        "896499985": "Demolitions Expert",
+        "1539660776": "Tactical Analysis",
+        "3305899539": "Squad Command",
+        "4049689403": "Armor Specialist",
+        "1719323144": "Field Medic",
+        "1745871194": "Reconnaissance",
+        "2831657996": "Electronics",
+        "3130830861": "Hacking",
+        "3440701635": "Sabotage"
+    },
+    "Special Abilities": {
+        "3659056238": "Aerial Assault",
+        "651760328": "Berserker Rage",
+        "1862651544": "Stealth Camouflage",
+        "1745884078": "Time Perception",
+        "2071425951": "Enhanced Reflexes",
+        "745513766": "Adrenaline Surge",
+        "4073911841": "Force Field",
+        "689642709": "Tracking Vision",
+        "895550929": "Thermal Vision",
+        "1239235678": "Enhanced Strength"
+    },
+    "Exploration": {
+        "1761588079": "Map Reading",
+        "1959749094": "Pathfinding",
+        "2278341981": "Grappling Hook",
+        "3305111690": "Climbing Gear",
+        "4044964372": "Gliding",
+        "1125225940": "Cave Navigation",
+        "2171844251": "River Navigation",
+        "482995089": "Tracking",
+        "2289347364": "Mountaineering",
+        "2904552696": "Weather Prediction"
+    },
+    "Vehicle": {
+        "4154870226": "Helicopter Piloting",
+        "1774378097": "ATV Operation",
+        "2167405524": "Tank Operation",
+        "2254859181": "Boat Navigation",
+        "3229137376": "Aircraft Operation",
+        "218464304": "Defensive Driving",
+        "516287719": "Evasive Maneuvers",
+        "3548279530": "Vehicle Repair"
+    },
+}
+
+SKILLS = {skill_id: {"name": name, "category": category}
+          for category, skills in SKILL_CATEGORIES.items() for skill_id, name in skills.items()}
@@ -0,0 +1,197 @@
+import tkinter as tk
+from tkinter import ttk
+from pathlib import Path
+import os
+import logging
+from save_library import SaveLibrary
+from task_scheduler import populate_treeview
+from custom_messagebox import show_info, show_error
+
+
+class LibraryWindow:
+    """Browse and search the save library; double-click a save to open it in the editor"""
+
+    COLUMNS = [
+        ("character", "Character", 160),
+        ("level", "Level", 60),
+        ("faction", "Faction", 90),
+        ("platform", "Platform", 70),
+        ("ep", "Total EP", 80),
+        ("territories", "Territories", 90),
+        ("pins", "Pins", 80),
+        ("achievements", "Achievements", 100),
+        ("pedia", "Pedia", 80),
+        ("played", "Played", 80),
+        ("path", "Path", 420),
+    ]
+    FACTIONS = ["Any", "Na'vi", "RDA", "Undecided"]
+    PLATFORMS = ["Any", "xbox", "pc", "ps3"]
+
+    def __init__(self, parent, main_window):
+        self.logger = logging.getLogger('LibraryWindow')
+        self.main_window = main_window
+        self.config = main_window.config
+        self.window = tk.Toplevel(parent)
+        self.window.title("📚 Save Library")
+        self.window.geometry("1400x700")
+        self.window.configure(bg='#1e1e1e')
+
+        try:
+            self.window.iconbitmap(os.path.join("icon", "avatar_icon.ico"))
+        except Exception as e:
+            self.logger.error(f"Failed to set Library icon: {str(e)}")
+
+        self.character_var = tk.StringVar()
+        self.faction_var = tk.StringVar(value="Any")
+        self.platform_var = tk.StringVar(value=main_window.game_version)
+        self.min_level_var = tk.StringVar()
+        self.backups_var = tk.BooleanVar(value=False)
+
+        self._setup_ui()
+        self.refresh()
+
+    def _setup_ui(self):
+        container = ttk.Frame(self.window, padding=15)
+        container.pack(fill=tk.BOTH, expand=True)
+
+        filters = ttk.Frame(container)
+        filters.pack(fill=tk.X, pady=(0, 10))
+
+        ttk.Label(filters, text="Character:").pack(side=tk.LEFT, padx=(0, 5))
+        character_entry = ttk.Entry(filters, textvariable=self.character_var, width=20)
+        character_entry.pack(side=tk.LEFT, padx=(0, 10))
+        character_entry.bind("<Return>", lambda event: self.refresh())
+
+        ttk.Label(filters, text="Faction:").pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Combobox(filters, textvariable=self.faction_var, values=self.FACTIONS,
+                     state="readonly", width=10).pack(side=tk.LEFT, padx=(0, 10))
+
+        ttk.Label(filters, text="Min level:").pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Entry(filters, textvariable=self.min_level_var, width=5).pack(side=tk.LEFT, padx=(0, 10))
+
+        ttk.Label(filters, text="Platform:").pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Combobox(filters, textvariable=self.platform_var, values=self.PLATFORMS,
+                     state="readonly", width=6).pack(side=tk.LEFT, padx=(0, 10))
+
+        ttk.Checkbutton(filters, text="Include backups", variable=self.backups_var).pack(side=tk.LEFT, padx=(0, 10))
+
+        ttk.Button(filters, text="Search", command=self.refresh).pack(side=tk.LEFT, padx=5)
+        self.rescan_button = ttk.Button(filters, text="Rescan", command=self.rescan)
+        self.rescan_button.pack(side=tk.LEFT, padx=5)
+
+        tree_frame = ttk.Frame(container)
+        tree_frame.pack(fill=tk.BOTH, expand=True)
+        self.tree = ttk.Treeview(tree_frame, columns=[key for key, _, _ in self.COLUMNS], show="headings")
+        for key, heading, width in self.COLUMNS:
+            self.tree.heading(key, text=heading)
+            self.tree.column(key, width=width, minwidth=40)
+        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.bind("<Double-1>", self._on_open)
+
+        self.status_label = ttk.Label(container, text="", font=('Segoe UI', 9))
+        self.status_label.pack(anchor=tk.W, pady=(10, 0))
+
+    def _open_library(self) -> SaveLibrary:
+        return SaveLibrary(Path(self.config.library_database))
+
+    def refresh(self):
+        """Run the current filters against the library"""
+        try:
+            min_level = int(self.min_level_var.get()) if self.min_level_var.get().strip() else None
+        except ValueError:
+            show_error("Error", "Min level must be a number.")
+            return
+
+        library = self._open_library()
+        try:
+            rows = library.query(
+                character=self.character_var.get().strip() or None,
+                faction=None if self.faction_var.get() == "Any" else self.faction_var.get(),
+                min_level=min_level,
+                platform=None if self.platform_var.get() == "Any" else self.platform_var.get(),
+                include_backups=self.backups_var.get()
+            )
+        finally:
+            library.close()
+
+        tree_rows = []
+        for row in rows:
+            tree_rows.append(((
+                row['character_name'] or "Unknown",
+                row['level'] if row['level'] is not None else "",
+                row['faction'],
+                row['platform'],
+                row['total_ep'] if row['total_ep'] is not None else "",
+                f"{row['territories_owned']}/{row['territories']}",
+                f"{row['pins_unlocked']}/{row['pins_total']}",
+                f"{row['achievements_started']}/{row['achievements_total']}",
+                f"{row['pedia_known']}/{row['pedia_total']}",
+                self._format_played_time(row['played_time']),
+                row['path'],
+            ), ()))
+        populate_treeview(getattr(self.main_window, 'scheduler', None), "library.rows", self.tree, tree_rows)
+        self.status_label.config(text=f"{len(rows)} saves")
+
+    @staticmethod
+    def _format_played_time(seconds):
+        if seconds is None:
+            return ""
+        hours, remainder = divmod(int(seconds), 3600)
+        return f"{hours}h {remainder // 60:02d}m"
+
+    def rescan(self):
+        """Update the library from the configured folders and the backup store on the library worker thread"""
+        folders = self.main_window.get_library_folders()
+        self.rescan_button.config(state="disabled")
+        self.status_label.config(text="Scanning...")
+
+        def scan(job):
+            library = self._open_library()
+            try:
+                stats = library.scan(folders, workers=self.config.library_workers or None, progress=job.report)
+                backup_stats = library.scan_backups(self.main_window.backup_store)
+                return stats, backup_stats
+            finally:
+                library.close()
+
+        self.main_window.library_worker.submit(
+            "library_scan", scan,
+            on_success=self._scan_finished,
+            on_error=self._scan_failed,
+            on_progress=lambda fraction, text: self.status_label.config(text=text)
+        )
+
+    def _scan_finished(self, result):
+        stats, backup_stats = result
+        if not self.window.winfo_exists():
+            return
+        self.rescan_button.config(state="normal")
+        self.refresh()
+        self.status_label.config(
+            text=f"{self.status_label.cget('text')} | scan: {stats['added']} added, {stats['updated']} updated, "
+                 f"{stats['removed']} removed, {stats['unchanged']} unchanged; "
+                 f"{backup_stats['added']} new backups")
+
+    def _scan_failed(self, error):
+        if not self.window.winfo_exists():
+            return
+        self.rescan_button.config(state="normal")
+        self.status_label.config(text="")
+        show_error("Error", f"Library scan failed: {error}")
+
+    def _on_open(self, event):
+        item = self.tree.focus()
+        if not item:
+            return
+        values = self.tree.item(item, "values")
+        path, platform = values[-1], values[3]
+        if path.startswith(SaveLibrary.BACKUP_PREFIX):
+            show_info("Library", "Backups can't be opened directly; restore them from the backup store first.")
+            return
+        if platform != self.main_window.game_version:
+            show_info("Library", f"This is a {platform.upper()} save; restart the editor in {platform.upper()} mode to open it.")
+            return
+        self.main_window.load_save_file(Path(path))
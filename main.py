@@ -5,25 +5,43 @@ Version: 2.0
 
 A modern, feature-rich save editor for Avatar: The Game across multiple platforms.
 """
-from datetime import datetime
+import copy
+import hashlib
 import os
 import sys
 import tkinter as tk
 from tkinter import ttk, filedialog
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Set
 import xml.etree.ElementTree as ET
 import logging
+import logging.handlers
+import queue
+import atexit
 import configparser
-from dataclasses import dataclass
+import multiprocessing
+from dataclasses import dataclass, field
 from custom_messagebox import MessageBoxManager, show_info, show_error, show_warning, ask_question, ask_ok_cancel, show_success
 
 # Import handlers and managers
-from xml_handler import XMLHandler
+from xml_handler import XMLHandler, SaveRegionMap, SaveSizeError
 from pc_xml_handler import PCXMLHandler
 from ps3_xml_handler import PS3XMLHandler
 from xml_viewer import XMLViewerWindow
+from library_window import LibraryWindow
 from version_selector import VersionSelector
+from timing import tracer, span
+from backup_store import BackupStore
+from background_worker import BackgroundWorker
+from task_scheduler import TaskScheduler
+from attribute_index import AttributeIndex
+from parse_cache import ParseCache
+from save_probe import character_folder_name, name_vec_to_string
+from save_sections import section_digests, changed_sections, apply_section_changes, managers_for_tags
+from save_watcher import SaveWatcher
+from edit_journal import EditJournal
+from recovery_journal import RecoveryJournal
+from completion_presets import PRESETS, PresetError
 
 # Import all manager classes
 from territory_manager import TerritoryManager
@@ -39,10 +57,6 @@ from tutorial_manager import TutorialManager
 from vehicle_manager import VehicleManager
 from skills_manager import SkillsManager
 
-import configparser
-import os
-from dataclasses import dataclass
-
 @dataclass
 class SaveEditorConfig:
     """Configuration settings for the Save Editor"""
@@ -56,10 +70,29 @@ class SaveEditorConfig:
     enable_file_logging: bool = False
     enable_console_logging: bool = False
     log_level: str = "INFO"
+    logger_levels: Dict[str, str] = field(default_factory=dict)  # Per-logger overrides, e.g. {"XMLHandler": "WARNING"}
     
     # Backup configuration
     max_backups_per_character: int = 10  # Keep only last 10 backups per character
     backup_root_folder: str = "Save Backups"
+    backup_compression: str = "lzma"  # lzma, zlib or none
+    backup_mode: str = "delta"  # full, or delta against the previous backup
+    backup_rebase_interval: int = 8  # Deltas allowed before a new full snapshot
+    
+    # Parse cache configuration
+    parse_cache_folder: str = "Parse Cache"
+    parse_cache_max_mb: int = 64  # 0 disables the cache
+    
+    # Save library configuration
+    library_database: str = "save_library.db"
+    library_folders: str = ""  # Semicolon-separated; empty means the default save directory
+    library_workers: int = 0  # Processes for rescans, 0 = one per CPU
+    
+    # Save file watcher configuration
+    watch_interval_ms: int = 2000  # How often the open save is checked for outside changes, 0 disables
+    
+    # Crash recovery configuration
+    recovery_flush_ms: int = 1000  # How often journaled edits are flushed to disk, 0 disables the journal
     
     @classmethod
     def load_from_file(cls, config_file: str = "settings.ini"):
@@ -69,6 +102,7 @@ class SaveEditorConfig:
         if os.path.exists(config_file):
             try:
                 parser = configparser.ConfigParser()
+                parser.optionxform = str  # Logger names are case-sensitive
                 parser.read(config_file)
                 
                 # Load logging settings
@@ -78,6 +112,10 @@ class SaveEditorConfig:
                     config.enable_console_logging = logging_section.getboolean('enable_console_logging', config.enable_console_logging)
                     config.log_level = logging_section.get('log_level', config.log_level)
                 
+                # Load per-logger level overrides
+                if 'LogLevels' in parser:
+                    config.logger_levels = {name: level.upper() for name, level in parser['LogLevels'].items()}
+                
                 # Load window settings
                 if 'Window' in parser:
                     window_section = parser['Window']
@@ -97,6 +135,32 @@ class SaveEditorConfig:
                     config.max_backups_per_character = backup_section.getint('max_backups_per_character', config.max_backups_per_character)
                     config.backup_root_folder = backup_section.get('backup_root_folder', config.backup_root_folder)
                     config.backup_suffix = backup_section.get('backup_suffix', config.backup_suffix)
+                    config.backup_compression = backup_section.get('backup_compression', config.backup_compression)
+                    config.backup_mode = backup_section.get('backup_mode', config.backup_mode)
+                    config.backup_rebase_interval = backup_section.getint('backup_rebase_interval', config.backup_rebase_interval)
+                
+                # Load parse cache settings
+                if 'Cache' in parser:
+                    cache_section = parser['Cache']
+                    config.parse_cache_folder = cache_section.get('parse_cache_folder', config.parse_cache_folder)
+                    config.parse_cache_max_mb = cache_section.getint('parse_cache_max_mb', config.parse_cache_max_mb)
+                
+                # Load save library settings
+                if 'Library' in parser:
+                    library_section = parser['Library']
+                    config.library_database = library_section.get('library_database', config.library_database)
+                    config.library_folders = library_section.get('library_folders', config.library_folders)
+                    config.library_workers = library_section.getint('library_workers', config.library_workers)
+                
+                # Load save file watcher settings
+                if 'Watcher' in parser:
+                    watcher_section = parser['Watcher']
+                    config.watch_interval_ms = watcher_section.getint('watch_interval_ms', config.watch_interval_ms)
+                
+                # Load crash recovery settings
+                if 'Recovery' in parser:
+                    recovery_section = parser['Recovery']
+                    config.recovery_flush_ms = recovery_section.getint('recovery_flush_ms', config.recovery_flush_ms)
                         
                 print(f"Loaded configuration from {config_file}")
                         
@@ -112,6 +176,7 @@ class SaveEditorConfig:
     def save_to_file(self, config_file: str = "settings.ini"):
         """Save current configuration to INI file"""
         parser = configparser.ConfigParser()
+        parser.optionxform = str  # Logger names are case-sensitive
         
         # Logging section
         parser.add_section('Logging')
@@ -119,6 +184,11 @@ class SaveEditorConfig:
         parser.set('Logging', 'enable_console_logging', str(self.enable_console_logging))
         parser.set('Logging', 'log_level', self.log_level)
         
+        # Per-logger levels section
+        parser.add_section('LogLevels')
+        for logger_name, level in self.logger_levels.items():
+            parser.set('LogLevels', logger_name, level)
+        
         # Window section
         parser.add_section('Window')
         parser.set('Window', 'geometry', self.window_geometry)
@@ -129,6 +199,28 @@ class SaveEditorConfig:
         parser.set('Backup', 'max_backups_per_character', str(self.max_backups_per_character))
         parser.set('Backup', 'backup_root_folder', self.backup_root_folder)
         parser.set('Backup', 'backup_suffix', self.backup_suffix)
+        parser.set('Backup', 'backup_compression', self.backup_compression)
+        parser.set('Backup', 'backup_mode', self.backup_mode)
+        parser.set('Backup', 'backup_rebase_interval', str(self.backup_rebase_interval))
+        
+        # Parse cache section
+        parser.add_section('Cache')
+        parser.set('Cache', 'parse_cache_folder', self.parse_cache_folder)
+        parser.set('Cache', 'parse_cache_max_mb', str(self.parse_cache_max_mb))
+        
+        # Save library section
+        parser.add_section('Library')
+        parser.set('Library', 'library_database', self.library_database)
+        parser.set('Library', 'library_folders', self.library_folders)
+        parser.set('Library', 'library_workers', str(self.library_workers))
+        
+        # Save file watcher section
+        parser.add_section('Watcher')
+        parser.set('Watcher', 'watch_interval_ms', str(self.watch_interval_ms))
+        
+        # Crash recovery section
+        parser.add_section('Recovery')
+        parser.set('Recovery', 'recovery_flush_ms', str(self.recovery_flush_ms))
         
         # Add comments at the top
         with open(config_file, 'w') as f:
@@ -140,6 +232,9 @@ class SaveEditorConfig:
             f.write("#   enable_console_logging: True/False - Shows logs in console\n")
             f.write("#   log_level: DEBUG, INFO, WARNING, ERROR, CRITICAL\n")
             f.write("# \n")
+            f.write("# LogLevels options (per-logger overrides of log_level):\n")
+            f.write("#   LoggerName = LEVEL - e.g. XMLHandler = WARNING, TerritoryManager = DEBUG\n")
+            f.write("# \n")
             f.write("# Window options:\n")
             f.write("#   geometry: WIDTHxHEIGHT - Default window size\n")
             f.write("#   min_size: WIDTH,HEIGHT - Minimum window size\n")
@@ -148,6 +243,24 @@ class SaveEditorConfig:
             f.write("#   max_backups_per_character: Number - How many backups to keep per character\n")
             f.write("#   backup_root_folder: String - Main folder name for all backups\n")
             f.write("#   backup_suffix: String - File extension for simple backups\n")
+            f.write("#   backup_compression: lzma, zlib or none - Compression for stored backups\n")
+            f.write("#   backup_mode: full/delta - Store each backup whole, or as a delta against the previous one\n")
+            f.write("#   backup_rebase_interval: Number - Deltas in a row before a new full snapshot is stored\n")
+            f.write("# \n")
+            f.write("# Cache options:\n")
+            f.write("#   parse_cache_folder: String - Folder for cached parsed saves (speeds up reopening)\n")
+            f.write("#   parse_cache_max_mb: Number - Size cap of the parse cache in MB, 0 disables it\n")
+            f.write("# \n")
+            f.write("# Library options:\n")
+            f.write("#   library_database: String - SQLite file indexing your saves and backups\n")
+            f.write("#   library_folders: String - Folders to index, separated by ; (empty = default save folder)\n")
+            f.write("#   library_workers: Number - Processes used to index changed saves, 0 = one per CPU\n")
+            f.write("# \n")
+            f.write("# Watcher options:\n")
+            f.write("#   watch_interval_ms: Number - How often the open save is checked for changes made by the game, 0 disables\n")
+            f.write("# \n")
+            f.write("# Recovery options:\n")
+            f.write("#   recovery_flush_ms: Number - How often unsaved edits are written to the crash recovery journal, 0 disables it\n")
             f.write("\n")
             parser.write(f)
 
@@ -230,9 +343,10 @@ class ThemeManager:
 class FileOperations:
     """Handles file loading and saving operations"""
     
-    def __init__(self, game_version: str):
+    def __init__(self, game_version: str, parse_cache: Optional[ParseCache] = None):
         self.game_version = game_version
         self.logger = logging.getLogger(f'FileOperations.{game_version}')
+        self.parse_cache = parse_cache
         
         # Platform-specific handlers
         self.handlers = {
@@ -240,6 +354,11 @@ class FileOperations:
             'pc': PCXMLHandler, 
             'ps3': PS3XMLHandler
         }
+        
+        # {path: (sha256, AttributeIndex, SaveRegionMap)} of files as last loaded/written;
+        # the index enables in-place saves of same-length edits (Xbox/PC), the region
+        # map spares rescanning the Xbox container on every save
+        self.layouts: Dict[Path, tuple] = {}
      
     def get_file_types(self) -> list:
         """Get appropriate file types for file dialog"""
@@ -252,26 +371,143 @@ class FileOperations:
             
         return base_types
     
-    def load_file(self, file_path: Path) -> tuple:
-        """Load file using appropriate handler"""
+    def load_file(self, file_path: Path, progress=None) -> tuple:
+        """Load file using appropriate handler; progress(fraction, text) is called between stages"""
         handler = self.handlers[self.game_version]
+        progress = progress or (lambda fraction, text: None)
         
-        with open(file_path, 'rb') as f:
-            file_data = f.read()
-        
-        # Verify integrity
-        is_valid = handler.verify_checksum(file_data)
-        self.logger.debug(f"{self.game_version.upper()} integrity check: {is_valid}")
-        
-        # Load XML
-        tree, xml_start, original_size = handler.load_xml_tree(file_path)
+        with span("FileOperations.load_file", path=file_path.name):
+            progress(0.1, "Reading file")
+            with span("read"):
+                with open(file_path, 'rb') as f:
+                    file_data = f.read()
+            
+            # Digests of every file a save would rewrite, to detect no-op saves
+            with span("digest"):
+                digests = {}
+                for path in self.get_save_files(file_path):
+                    if path == file_path:
+                        digests[path] = hashlib.sha256(file_data).hexdigest()
+                    else:
+                        with open(path, 'rb') as f:
+                            digests[path] = hashlib.sha256(f.read()).hexdigest()
+            
+            # An unchanged save that was opened before comes straight from the parse cache
+            cache_key = None
+            if self.parse_cache is not None and self.parse_cache.enabled:
+                with span("cache_lookup"):
+                    cache_key = self.parse_cache.make_key(self.game_version, digests)
+                    cached = self.parse_cache.get(cache_key)
+                if cached is not None:
+                    self.layouts = {file_path: (digests[file_path], cached['index'], cached['region_map'])}
+                    return (ET.ElementTree(cached['root']), cached['xml_start'], cached['original_size'],
+                            cached['is_valid'], digests)
+            
+            # Verify integrity
+            progress(0.3, "Verifying checksum")
+            region_map = None
+            with span("verify"):
+                if self.game_version == 'xbox':
+                    # One pass locates every region of the container and computes the checksum
+                    region_map = self._scan_regions(file_data)
+                    is_valid = handler.verify_checksum(file_data, region_map)
+                else:
+                    is_valid = handler.verify_checksum(file_data)
+            self.logger.debug("%s integrity check: %s", self.game_version.upper(), is_valid)
+            
+            # Load XML
+            progress(0.6, "Parsing XML")
+            if region_map is not None:
+                tree, xml_start, original_size = handler.load_xml_tree(file_path, region_map)
+            else:
+                tree, xml_start, original_size = handler.load_xml_tree(file_path)
+            
+            self.layouts = {}
+            self.record_layouts(tree, {file_path: file_data}, {file_path: region_map})
+            
+            if cache_key is not None:
+                with span("cache_store"):
+                    _, index, region_map = self.layouts.get(file_path, (None, None, region_map))
+                    self.parse_cache.put(cache_key, {
+                        'root': tree.getroot(), 'xml_start': xml_start, 'original_size': original_size,
+                        'is_valid': is_valid, 'index': index, 'region_map': region_map,
+                    })
         
-        return tree, xml_start, original_size, is_valid
+        return tree, xml_start, original_size, is_valid, digests
+    
+    def build_outputs(self, tree: ET.ElementTree, file_path: Path) -> Dict[Path, tuple]:
+        """Read every file the save rewrites and build its new contents: {path: (original, output)}"""
+        handler = self.handlers[self.game_version]
+        outputs = {}
+        for path in self.get_save_files(file_path):
+            with open(path, 'rb') as f:
+                original_data = f.read()
+            
+            # Layouts only apply to the exact bytes they were recorded from
+            index = region_map = None
+            digest, *layout = self.layouts.get(path, (None, None, None))
+            if digest == hashlib.sha256(original_data).hexdigest():
+                index, region_map = layout
+            extra = {'region_map': region_map} if region_map is not None else {}
+            
+            # Same-length attribute edits are patched into the original bytes
+            patches = None
+            if index is not None:
+                with span("diff_attributes"):
+                    patches = index.diff(tree, original_data)
+            
+            if patches is not None:
+                outputs[path] = (original_data, handler.patch_output(original_data, patches, **extra))
+                continue
+            
+            output_data = handler.build_output(tree, original_data, **extra)
+            if self.game_version == 'xbox':
+                # Same checksum rule as patch_output: recomputed only if the original one was valid
+                if region_map is None or region_map.calculated_checksum is None:
+                    region_map = SaveRegionMap.scan(original_data)
+                if region_map.checksum_valid:
+                    output_data = handler.update_checksum(output_data)
+            outputs[path] = (original_data, output_data)
+        return outputs
+    
+    def _scan_regions(self, data: bytes) -> Optional[SaveRegionMap]:
+        try:
+            with span("scan_regions"):
+                return SaveRegionMap.scan(data)
+        except ValueError as e:
+            self.logger.debug("No region map: %s", e)
+            return None
+    
+    def record_layouts(self, tree: ET.ElementTree, outputs: Dict[Path, bytes],
+                       region_maps: Optional[Dict[Path, Optional[SaveRegionMap]]] = None) -> None:
+        """Record attribute offsets and regions of freshly loaded or written files (Xbox/PC only)"""
+        if self.game_version not in ['xbox', 'pc']:
+            return
+        region_maps = region_maps or {}
+        for path, data in outputs.items():
+            with span("index_attributes"):
+                index = AttributeIndex.build(data, tree)
+            region_map = region_maps.get(path)
+            if region_map is None and self.game_version == 'xbox':
+                region_map = self._scan_regions(data)
+            self.layouts[path] = (hashlib.sha256(data).hexdigest(), index, region_map)
     
-    def save_file(self, tree: ET.ElementTree, file_path: Path) -> None:
-        """Save file using appropriate handler"""
+    def write_outputs(self, outputs: Dict[Path, bytes], originals: Optional[Dict[Path, bytes]] = None) -> None:
+        """Write new file contents; Xbox saves only rewrite the ranges that differ from originals"""
         handler = self.handlers[self.game_version]
-        handler.save_xml_tree(tree, file_path)
+        originals = originals or {}
+        for path, output_data in outputs.items():
+            if self.game_version == 'xbox':
+                handler.write_output(path, output_data, originals.get(path))
+            else:
+                handler.write_output(path, output_data)
+    
+    def get_save_files(self, file_path: Path) -> list:
+        """Files a save of file_path will overwrite (both SAVEDATA.000 and PADDING.000 on PS3)"""
+        if self.game_version == 'ps3' and file_path.name in ['SAVEDATA.000', 'PADDING.000']:
+            siblings = PS3XMLHandler.get_all_save_files(file_path.parent)
+            return siblings or [file_path]
+        return PS3XMLHandler.get_all_save_files(file_path) if file_path.is_dir() else [file_path]
 
 
 class SaveEditor:
@@ -284,17 +520,53 @@ class SaveEditor:
         # Core properties
         self.root = root
         self.game_version = game_version
-        self.file_ops = FileOperations(game_version)
+        self.file_ops = FileOperations(
+            game_version,
+            ParseCache(Path(self.config.parse_cache_folder), self.config.parse_cache_max_mb * 1024 * 1024)
+        )
+        self.backup_store = BackupStore(
+            Path(self.config.backup_root_folder),
+            self.config.backup_compression,
+            delta=self.config.backup_mode == "delta",
+            rebase_interval=self.config.backup_rebase_interval
+        )
         
         # File state
         self.tree: Optional[ET.ElementTree] = None
         self.file_path: Optional[Path] = None
         self.original_size: Optional[int] = None
         self.xml_start: Optional[int] = None
+        self.dirty_sections: Dict[str, Set[str]] = {}  # manager key -> XML sections it changed
+        self.file_digests: Dict[Path, str] = {}  # sha256 of each save file as last loaded/written
+        self.section_digests: Dict[tuple, str] = {}  # digest of each XML section as on disk
+        self.journal = EditJournal()  # Undo/redo of the edits made to self.tree
         
         # UI components
         self.managers: Dict[str, Any] = {}
         
+        # Load/save I/O runs off the Tk main thread; long Treeview builds are time-sliced
+        self.worker = BackgroundWorker(root)
+        # Library scans can take minutes, so they don't queue in front of loads and saves
+        self.library_worker = BackgroundWorker(root, name="LibraryScanWorker")
+        self.scheduler = TaskScheduler(root)
+        
+        # Notices when the game (or anything else) rewrites the open save
+        self.watcher = SaveWatcher(
+            root, self._on_save_file_changed, interval_ms=self.config.watch_interval_ms,
+            paused=lambda: self.worker.is_running("load") or self.worker.is_running("save")
+        )
+        
+        # Unsaved edits are also journaled next to the save, to be replayed after a crash
+        self.recovery = RecoveryJournal(root, interval_ms=self.config.recovery_flush_ms)
+        self.journal.listeners.append(self.recovery.record)
+        
+        # Backups made before the store (in "Save Backups") join the store's history once; on the
+        # worker, so the store is never written by two threads
+        self.worker.submit(
+            "import_backups", lambda job: self.backup_store.import_legacy(Path(BackupStore.LEGACY_FOLDER)),
+            on_error=lambda error: self.logger.error("Could not import legacy backups: %s", error)
+        )
+        
         self._initialize_application()
     
     def _initialize_application(self):
@@ -348,6 +620,9 @@ class SaveEditor:
     def _setup_event_handlers(self):
         """Setup application event handlers"""
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.root.bind_all("<Control-z>", self.undo)
+        self.root.bind_all("<Control-y>", self.redo)
+        self.root.bind_all("<Control-Z>", self.redo)  # Ctrl+Shift+Z
     
     def _create_file_operations_section(self):
         """Create the file operations toolbar"""
@@ -372,7 +647,10 @@ class SaveEditor:
         buttons_config = [
             ("Load Save File", self.load_save_file, None),
             ("View XML", self.open_xml_viewer, None),
-            ("Save Changes", self.save_changes, "disabled")
+            ("Save Library", self.open_library, None),
+            ("Presets", self.show_presets_menu, None),
+            ("Save Changes", self.save_changes, "disabled"),
+            ("Export Timings", self.export_timings, None)
         ]
         
         self.action_buttons = {}
@@ -405,6 +683,14 @@ class SaveEditor:
         # Checksum status
         self.checksum_label = ttk.Label(status_frame, text="Checksum: None", font=("", 9))
         self.checksum_label.pack(side=tk.RIGHT, padx=(20, 0))
+        
+        # Last load/save timings
+        self.timing_label = ttk.Label(status_frame, text="", font=("", 8), foreground="gray")
+        self.timing_label.pack(side=tk.RIGHT, padx=(20, 0))
+        
+        # Background load/save progress
+        self.progress_bar = ttk.Progressbar(status_frame, mode="determinate", length=120, maximum=100)
+        self.progress_bar.pack(side=tk.RIGHT, padx=(20, 0))
     
     def _create_time_display(self, parent):
         """Create time statistics display"""
@@ -535,6 +821,42 @@ class SaveEditor:
         except (ValueError, TypeError):
             return time_str  # Return original if conversion fails
     
+    def _update_timing_display(self):
+        """Show the timings of the last load/save operation in the status section"""
+        summary = tracer.summarize()
+        self.timing_label.config(text=summary)
+        self.logger.info("%s", summary)
+    
+    def _show_progress(self, fraction: float, text: str = ""):
+        """Update the progress bar from a background job"""
+        self.progress_bar.config(value=fraction * 100)
+        if text:
+            self.timing_label.config(text=f"{text}...")
+    
+    def export_timings(self):
+        """Export recorded load/save timings as Chrome-trace or Speedscope JSON"""
+        if tracer.last_operation is None:
+            show_info("Export Timings", "No load or save operation has been timed yet.")
+            return
+        
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            initialfile="save_editor.trace.json",
+            filetypes=[("Chrome Trace", "*.trace.json"), ("Speedscope", "*.speedscope.json"), ("JSON", "*.json")]
+        )
+        if not file_path:
+            return
+        
+        try:
+            if file_path.endswith(".speedscope.json"):
+                tracer.export_speedscope(Path(file_path))
+            else:
+                tracer.export_chrome_trace(Path(file_path))
+            show_success("Export Timings", f"Timings exported to:\n{file_path}")
+        except Exception as e:
+            self.logger.error(f"Failed to export timings: {e}", exc_info=True)
+            show_error("Error", f"Failed to export timings: {e}")
+    
     def _update_checksum_display(self, is_valid: bool):
         """Update checksum verification display"""
         self.checksum_label.config(
@@ -542,8 +864,8 @@ class SaveEditor:
             foreground="dark green" if is_valid else "red"
         )
     
-    def _load_data_into_managers(self):
-        """Load data into all managers"""
+    def _load_data_into_managers(self, manager_keys: Optional[Set[str]] = None):
+        """Load data into all managers, or only the given ones"""
         manager_methods = {
             'stats': 'load_stats',
             'territory': 'load_territory_data',
@@ -560,16 +882,19 @@ class SaveEditor:
         }
         
         for manager_key, method_name in manager_methods.items():
+            if manager_keys is not None and manager_key not in manager_keys:
+                continue
             try:
                 manager = self.managers.get(manager_key)
                 if manager and hasattr(manager, method_name):
                     method = getattr(manager, method_name)
-                    method(self.tree)
+                    with span(f"{manager_key}.{method_name}", category="manager"):
+                        method(self.tree)
             except Exception as e:
                 self.logger.error(f"Error loading data for {manager_key}: {e}")
     
-    def load_save_file(self):
-        """Load a save file with comprehensive error handling"""
+    def load_save_file(self, file_path: Optional[Path] = None):
+        """Load a save file (asking for one unless given) with comprehensive error handling"""
         self.logger.debug(f"Loading save file for {self.game_version}")
         
         # Check for unsaved changes
@@ -577,37 +902,174 @@ class SaveEditor:
             return
         
         try:
-            # Get default save game directory for Avatar
-            default_dir = self._get_default_save_directory()
+            if file_path is None:
+                # Get default save game directory for Avatar
+                default_dir = self._get_default_save_directory()
+                
+                # File selection
+                file_path = filedialog.askopenfilename(
+                    filetypes=self.file_ops.get_file_types(),
+                    initialdir=default_dir
+                )
+                if not file_path:
+                    return
             
-            # File selection
-            file_path = filedialog.askopenfilename(
-                filetypes=self.file_ops.get_file_types(),
-                initialdir=default_dir
-            )
-            if not file_path:
-                return
+            file_path = Path(file_path)
             
-            self.file_path = Path(file_path)
-            self.file_label.config(text=self.file_path.name)
+            # A newly chosen file supersedes any load still in flight
+            self.worker.cancel("load")
+            self.file_label.config(text=f"{file_path.name} (loading...)")
+            self.action_buttons['save_changes'].config(state="disabled")
             
-            # Load file
-            self.tree, self.xml_start, self.original_size, is_valid = self.file_ops.load_file(self.file_path)
+            self.worker.submit(
+                "load",
+                lambda job: self._read_save_file(job, file_path),
+                on_success=lambda result: self._finish_load(file_path, result),
+                on_error=lambda error: self._load_failed(file_path, error),
+                on_progress=self._show_progress
+            )
             
-            # Update UI
-            self._update_checksum_display(is_valid)
-            self._load_data_into_managers()
+        except Exception as e:
+            self.logger.error(f"Failed to load save file: {e}", exc_info=True)
+            show_error("Error", f"Failed to load save file: {e}")
+    
+    def _read_save_file(self, job, file_path: Path) -> tuple:
+        """Worker thread: read, verify and parse the save"""
+        with tracer.operation("Load", path=file_path.name) as operation:
+            result = self.file_ops.load_file(file_path, progress=job.report)
+            with span("section_digests"):
+                digests = section_digests(result[0].getroot())
+            job.report(0.9, "Loading editors")
+        return (operation,) + result + (digests,)
+    
+    def _finish_load(self, file_path: Path, result: tuple):
+        """Main thread: install the parsed tree and fill the managers"""
+        operation, tree, xml_start, original_size, is_valid, digests, sections = result
+        
+        self.file_path = file_path
+        self.tree, self.xml_start, self.original_size = tree, xml_start, original_size
+        self.file_digests = digests
+        self.section_digests = sections
+        self.journal.clear()
+        self.file_label.config(text=file_path.name)
+        self.watcher.watch(self.file_ops.get_save_files(file_path))
+        
+        try:
+            # Managers may mark sections they fix up while loading (e.g. EnvTime)
+            self.clear_dirty()
+            with tracer.resume(operation):
+                # Update UI
+                self._update_checksum_display(is_valid)
+                with span("_load_data_into_managers"):
+                    self._load_data_into_managers()
+            self._update_timing_display()
+            self.progress_bar.config(value=0)
             
             # Enable save functionality
             self.action_buttons['save_changes'].config(state="normal")
-            self.unsaved_label.config(text="")
             
             self.logger.debug("Save file loaded successfully")
             show_success("Success", "Save file loaded successfully!")
             
+            self._start_recovery(file_path)
+            
         except Exception as e:
-            self.logger.error(f"Failed to load save file: {e}", exc_info=True)
-            show_error("Error", f"Failed to load save file: {e}")
+            self._load_failed(file_path, e)
+    
+    def _on_save_file_changed(self, changed_paths: list):
+        """The open save was rewritten outside the editor: offer to reload it"""
+        if not self.file_path:
+            return
+        discard = self.has_unsaved_changes
+        if discard and not ask_question(
+            "Save File Changed",
+            f"{self.file_path.name} was changed outside the editor.\n"
+            "Reload it? Your unsaved changes will be lost."
+        ):
+            return
+        
+        file_path = self.file_path
+        self.worker.submit(
+            "load",
+            lambda job: self._read_save_file(job, file_path),
+            on_success=lambda result: self._finish_reload(file_path, result, discard),
+            on_error=lambda error: self._load_failed(file_path, error),
+            on_progress=self._show_progress
+        )
+    
+    def _finish_reload(self, file_path: Path, result: tuple, discard: bool):
+        """
+        Main thread: bring a reloaded save into the editor. When only section contents
+        changed, those sections are swapped into the current tree and only the tabs
+        reading them reload; anything else takes the full load path.
+        """
+        if file_path != self.file_path:
+            return
+        operation, tree, xml_start, original_size, is_valid, digests, sections = result
+        changed = changed_sections(self.section_digests, sections)
+        if changed is None or discard or self.has_unsaved_changes:
+            self._finish_load(file_path, result)
+            return
+        
+        self.xml_start, self.original_size = xml_start, original_size
+        self.file_digests = digests
+        try:
+            with tracer.resume(operation):
+                with span("apply_section_changes"):
+                    apply_section_changes(self.tree.getroot(), tree.getroot(), changed)
+                # Recorded edits may point into the replaced sections
+                self.journal.clear()
+                self.recovery.start(file_path, digests, self.tree.getroot())
+                self.section_digests = sections
+                self._update_checksum_display(is_valid)
+                manager_keys = managers_for_tags(tag for tag, _ in changed)
+                with span("_load_data_into_managers", managers=len(manager_keys)):
+                    self._load_data_into_managers(manager_keys)
+            # Managers may mark sections they fix up while loading
+            self.clear_dirty()
+            self._update_timing_display()
+            self.progress_bar.config(value=0)
+            self.logger.info(f"Reloaded {file_path.name}: {len(changed)} changed sections, "
+                             f"tabs: {', '.join(sorted(manager_keys)) or 'none'}")
+        except Exception as e:
+            self._load_failed(file_path, e)
+    
+    def _start_recovery(self, file_path: Path):
+        """Offer to replay edits journaled by a session that ended without saving, then journal this one"""
+        if self.recovery.path is not None and self.recovery.path != RecoveryJournal.path_for(file_path):
+            # The previously open save's edits were saved or dropped when this one was opened
+            self.recovery.discard()
+        records = self.recovery.pending(file_path, self.file_digests)
+        edits = sum(1 for record in records if record[0] == "m")
+        replay = bool(edits) and ask_question(
+            "Recover Unsaved Edits",
+            f"The editor was closed without saving {edits} edit(s) to {file_path.name}.\n"
+            "Do you want to restore them?"
+        )
+        if replay:
+            try:
+                with span("recovery_replay", records=len(records)):
+                    edited = RecoveryJournal.replay(self.tree.getroot(), records)
+            except Exception as e:
+                self.logger.error(f"Failed to replay recovery journal: {e}", exc_info=True)
+                show_error("Error", f"Could not restore the unsaved edits: {e}\nReloading the save is recommended.")
+                replay = False
+            else:
+                for manager_key, section in edited:
+                    self.mark_dirty(manager_key, section)
+                manager_keys = {manager_key for manager_key, _ in edited}
+                self._load_data_into_managers(None if "*" in manager_keys else manager_keys)
+                self.logger.info(f"Restored {edits} unsaved edits from the recovery journal")
+        self.recovery.start(file_path, self.file_digests, self.tree.getroot(), keep=replay)
+    
+    def _load_failed(self, file_path: Path, error: Exception):
+        self.logger.error(f"Failed to load save file: {error}")
+        self.progress_bar.config(value=0)
+        self.timing_label.config(text="")
+        self.file_label.config(text=self.file_path.name if self.file_path else "No file loaded")
+        if self.tree:
+            self.action_buttons['save_changes'].config(state="normal")
+        show_error("Error", f"Failed to load save file: {error}")
 
     def _get_default_save_directory(self):
         """Get the default Avatar save game directory for the current user"""
@@ -638,9 +1100,88 @@ class SaveEditor:
             # Final fallback to current directory
             return os.getcwd()
 
+    def mark_dirty(self, manager_key: str, section: str = "*"):
+        """Record that a manager changed an XML section; only dirty managers are processed on save"""
+        self.dirty_sections.setdefault(manager_key, set()).add(section)
+        self.unsaved_label.config(text="Unsaved Changes")
+    
+    def clear_dirty(self):
+        self.dirty_sections = {}
+        self.unsaved_label.config(text="")
+    
+    @property
+    def has_unsaved_changes(self) -> bool:
+        return bool(self.dirty_sections)
+    
+    def undo(self, event=None):
+        """Revert the latest recorded edit (Ctrl+Z)"""
+        self._step_journal(self.journal.undo, "Undone")
+    
+    def redo(self, event=None):
+        """Re-apply the latest undone edit (Ctrl+Y)"""
+        self._step_journal(self.journal.redo, "Redone")
+    
+    def _step_journal(self, step, verb: str):
+        if self.tree is None or self.worker.is_running("save") or self.worker.is_running("load"):
+            return
+        transaction = step()
+        if transaction is None:
+            return
+        # The tab that made the edit re-reads the reverted values from the tree ("*": presets, all tabs)
+        self.mark_dirty(transaction.manager_key, transaction.section)
+        self._load_data_into_managers(None if transaction.manager_key == "*" else {transaction.manager_key})
+        self.timing_label.config(text=f"{verb}: {transaction.label}")
+        self.logger.debug(f"{verb} '{transaction.label}' ({len(transaction.ops)} operations)")
+    
+    def show_presets_menu(self):
+        """Drop down the completion presets under the Presets button"""
+        if not self.tree:
+            show_error("Error", "No save file loaded. Please load a save file first.")
+            return
+        menu = tk.Menu(self.root, tearoff=0)
+        for preset_name, preset in PRESETS.items():
+            menu.add_command(label=preset.label, command=lambda name=preset_name: self.apply_preset(name))
+        button = self.action_buttons['presets']
+        menu.tk_popup(button.winfo_rootx(), button.winfo_rooty() + button.winfo_height())
+    
+    def apply_preset(self, preset_name: str):
+        """Apply a completion preset as one undo step, then refresh the tabs it changed once"""
+        if self.tree is None or self.worker.is_running("save") or self.worker.is_running("load"):
+            return
+        preset = PRESETS[preset_name]
+        if not ask_question(preset.label, f"{preset.description}\n\nApply it to this save?"):
+            return
+        
+        try:
+            with tracer.operation("Preset", preset=preset_name) as operation:
+                with span("compile"):
+                    compiled = preset.compile(self.tree.getroot())
+                operation.args['operations'] = len(compiled.ops)
+                if compiled.ops:
+                    with span("apply"):
+                        compiled.apply(self.journal)
+                    for section in compiled.sections:
+                        for manager_key in managers_for_tags({section}):
+                            self.mark_dirty(manager_key, section)
+                    with span("refresh"):
+                        self._load_data_into_managers(compiled.manager_keys)
+        except PresetError as e:
+            show_error("Error", str(e))
+            return
+        except Exception as e:
+            self.logger.error(f"Failed to apply preset {preset_name}: {e}", exc_info=True)
+            show_error("Error", f"Failed to apply {preset.label}: {e}")
+            return
+        
+        self._update_timing_display()
+        if compiled.ops:
+            show_success(preset.label, f"{preset.label} applied: {len(compiled.ops)} values changed.")
+        else:
+            show_info(preset.label, "The save already matches this preset.")
+    
     def _check_unsaved_changes(self) -> bool:
         """Check for unsaved changes and prompt user"""
-        if self.unsaved_label.cget("text") == "Unsaved Changes":
+        if self.has_unsaved_changes:
             response = ask_question(
                 "Unsaved Changes",
                 "You have unsaved changes. Do you want to save before loading a new file?"
@@ -667,91 +1208,193 @@ class SaveEditor:
             self.logger.error(f"Error opening XML viewer: {e}", exc_info=True)
             show_error("Error", f"Failed to open XML viewer: {e}")
 
-    def save_changes(self):
-        """Save all changes to file"""
+    def open_library(self):
+        """Open the save library browser"""
+        try:
+            LibraryWindow(self.root, self)
+            self.logger.debug("Save library opened")
+        except Exception as e:
+            self.logger.error(f"Error opening save library: {e}", exc_info=True)
+            show_error("Error", f"Failed to open the save library: {e}")
+    
+    def get_library_folders(self) -> list:
+        """Folders the save library indexes"""
+        folders = [Path(folder.strip()) for folder in self.config.library_folders.split(';') if folder.strip()]
+        return folders or [Path(self._get_default_save_directory())]
+
+    def save_changes(self, on_complete=None):
+        """Save all changes to file; backup and write run on the worker thread"""
         if not self.tree or not self.file_path:
             show_error("Error", "No save file loaded!")
             return
+        if self.worker.is_running("save"):
+            return
         
+        file_path = self.file_path
         try:
-            # Create backup
-            self._create_backup()
+            with tracer.operation("Save", path=file_path.name) as operation:
+                # Process all manager updates (touches the widgets, so stays on the main thread)
+                with span("_process_manager_updates"):
+                    self._process_manager_updates()
+                
+                if not self.dirty_sections:
+                    operation.args['skipped'] = "no changes"
+                else:
+                    # The worker writes a snapshot so edits made meanwhile don't race the serializer
+                    with span("snapshot"):
+                        tree = copy.deepcopy(self.tree)
+                    # Edits journaled after this point are not in the snapshot
+                    recovery_mark = self.recovery.mark()
+                    character_name = self._get_character_name()
+        except Exception as e:
+            self.logger.error(f"Failed to save changes: {e}", exc_info=True)
+            show_error("Error", f"Failed to save changes: {e}")
+            return
+        
+        if not self.dirty_sections:
+            # Nothing changed: no backup, no write
+            self._update_timing_display()
+            self.logger.debug("No changes to save")
+            show_info("Save", "There are no changes to save.")
+            if on_complete:
+                on_complete()
+            return
+        
+        # Changes made from here on belong to the next save
+        saved_sections = self.dirty_sections
+        self.clear_dirty()
+        self.action_buttons['save_changes'].config(state="disabled")
+        
+        file_digests = dict(self.file_digests)
+        self.worker.submit(
+            "save",
+            lambda job: self._write_save_file(job, operation, tree, file_path, character_name, file_digests),
+            on_success=lambda result: self._finish_save(file_path, *result, on_complete, recovery_mark),
+            on_error=lambda error: self._save_failed(error, saved_sections),
+            on_progress=self._show_progress
+        )
+    
+    def _write_save_file(self, job, operation, tree: ET.ElementTree, file_path: Path,
+                         character_name: str, file_digests: Dict[Path, str]) -> tuple:
+        """
+        Worker thread: build the new file contents, then back up and write only the
+        files whose contents differ from what was loaded.
+        Returns ({path: new digest}, section digests of the written tree).
+        """
+        with tracer.resume(operation):
+            job.report(0.2, "Building save data")
+            with span("build_outputs"):
+                outputs = self.file_ops.build_outputs(tree, file_path)
             
-            # Process all manager updates
-            self._process_manager_updates()
+            changed = {}
+            with span("digest"):
+                for path, (original_data, output_data) in outputs.items():
+                    loaded_digest = file_digests.get(path)
+                    if (hashlib.sha256(output_data).hexdigest() != loaded_digest
+                            or hashlib.sha256(original_data).hexdigest() != loaded_digest):
+                        changed[path] = output_data
+            if not changed:
+                operation.args['skipped'] = "identical output"
+                return {}, {}
             
-            # Save file
-            self.file_ops.save_file(self.tree, self.file_path)
+            job.report(0.4, "Creating backup")
+            with span("_create_backup"):
+                self._create_backup(character_name, {path.name: outputs[path][0] for path in outputs}, file_path.parent)
             
-            # Update UI
-            self.unsaved_label.config(text="")
+            job.report(0.7, "Writing save")
+            with span("write", files=len(changed)):
+                self.file_ops.write_outputs(changed, {path: outputs[path][0] for path in changed})
+            self.file_ops.record_layouts(tree, changed)
+            with span("section_digests"):
+                sections = section_digests(tree.getroot())
             
+            return {path: hashlib.sha256(data).hexdigest() for path, data in changed.items()}, sections
+    
+    def _finish_save(self, file_path: Path, written: Dict[Path, str], sections: Dict[tuple, str], on_complete=None,
+                     recovery_mark=None):
+        self._update_timing_display()
+        self.progress_bar.config(value=0)
+        self.action_buttons['save_changes'].config(state="normal")
+        
+        if not written:
+            self.logger.debug("Save output identical to the file on disk, nothing written")
+            show_info("Save", "The save file already contains these values; nothing was written.")
+        else:
+            if file_path == self.file_path:
+                self.file_digests.update(written)
+                self.section_digests = sections
+                self.watcher.acknowledge()
+                # Edits journaled up to the snapshot are in the file now; later ones stay journaled
+                self.recovery.start(file_path, self.file_digests, self.tree.getroot(), since=recovery_mark)
             self.logger.debug("Changes saved successfully")
             show_success("Success", "Save file modified successfully!\nA backup has been created.")
-            
-        except ValueError as ve:
-            self.logger.error(f"Save failed - size error: {ve}")
+        if on_complete:
+            on_complete()
+    
+    def _save_failed(self, error: Exception, saved_sections: Dict[str, Set[str]]):
+        self.progress_bar.config(value=0)
+        self.timing_label.config(text="")
+        for manager_key, sections in saved_sections.items():
+            for section in sections:
+                self.mark_dirty(manager_key, section)
+        self.action_buttons['save_changes'].config(state="normal")
+        
+        if isinstance(error, SaveSizeError):
+            self.logger.error(f"Save failed - size error: {error}")
+            show_error("Error", f"Failed to save: {error}.\nNothing was written.")
+        elif isinstance(error, ValueError):
+            self.logger.error(f"Save failed - size error: {error}")
             show_error("Error", "Failed to save: The modified save data is too large.")
-        except Exception as e:
-            self.logger.error(f"Failed to save changes: {e}", exc_info=True)
-            show_error("Error", f"Failed to save changes: {e}")
+        else:
+            self.logger.error(f"Failed to save changes: {error}")
+            show_error("Error", f"Failed to save changes: {error}")
 
     def _on_close(self):
         """Handle application close event"""
         try:
-            if self.unsaved_label.cget("text") == "Unsaved Changes":
+            if self.has_unsaved_changes:
                 response = ask_question(
                     "Unsaved Changes",
                     "You have unsaved changes. Would you like to save before closing?"
                 )
                 
                 if response is True:
-                    self.save_changes()
-                    self.root.destroy()
+                    # Close once the background save has finished
+                    self.save_changes(on_complete=self._close_window)
                 else:  # False - don't save, just close
-                    self.root.destroy()
+                    self._close_window()
                 
             else:
-                self.root.destroy()
+                self._close_window()
                 
         except Exception as e:
             self.logger.error(f"Error during close: {e}", exc_info=True)
             self.root.destroy()    
     
-    def _create_backup(self):
-        """Create organized backup with character name and timestamp folders"""
+    def _close_window(self):
+        """Let an in-flight save finish, drop pending loads and close"""
+        self.watcher.stop()
+        # Closing without saving is deliberate; only a crash leaves the journal behind
+        self.recovery.discard()
+        self.worker.cancel("load")
+        self.library_worker.cancel("library_scan")
+        self.worker.shutdown(wait=True)
+        self.library_worker.shutdown(wait=True)
+        self.root.destroy()
+    
+    def _create_backup(self, character_name: str, files: Dict[str, bytes], folder: Path):
+        """Store the current save files ({file name: contents}) in the character's backup store"""
         try:
-            # Get character name from the save file
-            character_name = self._get_character_name()
-            
-            # Create timestamp for this save
-            timestamp = datetime.now().strftime("%m-%d-%Y_%I-%M-%S_%p")
-            
-            # Create the backup directory structure
-            # Save Backups/CharacterName/12-19-2024_02-30-45_PM/
-            backup_root = Path("Save Backups")
-            character_folder = backup_root / character_name
-            timestamp_folder = character_folder / timestamp
+            entry = self.backup_store.add(character_name, files)
+            self.logger.debug("Backup %s created for %s", entry['id'], character_name)
             
-            # Create all directories if they don't exist
-            timestamp_folder.mkdir(parents=True, exist_ok=True)
-            
-            # Create the backup file path
-            backup_file_path = timestamp_folder / self.file_path.name
-            
-            # Copy the current save file to the backup location
-            with open(self.file_path, 'rb') as src, open(backup_file_path, 'wb') as dst:
-                dst.write(src.read())
-            
-            self.logger.debug(f"Backup created: {backup_file_path}")
-            
-            # Optional: Clean up old backups (keep only last N backups)
-            self._cleanup_old_backups(character_folder)
+            # Keep only the last N backups; unreferenced blobs are dropped with them
+            self.backup_store.prune(character_name, self.config.max_backups_per_character)
             
         except Exception as e:
             self.logger.error(f"Error creating backup: {e}")
-            # Fallback to simple backup if organized backup fails
-            self._create_simple_backup()
+            # Fallback to simple backup if the backup store fails
+            self._create_simple_backup(folder, files)
 
     def _get_character_name(self):
         """Extract character name from the loaded save file"""
@@ -782,91 +1425,31 @@ class SaveEditor:
             return "Unknown"
 
     def _name_vec_to_string(self, name_vec):
-        """Convert name vector to readable string (same as in stats_manager)"""
-        try:
-            if not name_vec or not name_vec.startswith("Count("):
-                return ""
-            
-            parts = name_vec.split(") ")
-            if len(parts) < 2:
-                return ""
-            
-            values = parts[1].rstrip(";").split(";")
-            name = "".join(chr(int(val)) for val in values if val)
-            return name
-        except Exception as e:
-            self.logger.error(f"Error converting name vector: {str(e)}")
-            return ""
+        """Convert name vector to readable string (shared with stats_manager and the save probe)"""
+        return name_vec_to_string(name_vec)
 
     def _sanitize_folder_name(self, name):
-        """Clean character name for use as folder name"""
-        # Remove or replace invalid characters for folder names
-        invalid_chars = '<>:"/\\|?*'
-        sanitized = name
-        
-        for char in invalid_chars:
-            sanitized = sanitized.replace(char, '_')
-        
-        # Remove leading/trailing spaces and dots
-        sanitized = sanitized.strip(' .')
-        
-        # Ensure it's not empty
-        if not sanitized:
-            sanitized = "Unknown"
-        
-        # Limit length to avoid filesystem issues
-        if len(sanitized) > 50:
-            sanitized = sanitized[:50]
-        
-        return sanitized
+        """Clean character name for use as folder name (shared with the command line tools)"""
+        return character_folder_name(name)
 
-    def _cleanup_old_backups(self, character_folder, max_backups=10):
-        """Keep only the most recent N backups for a character"""
-        try:
-            if not character_folder.exists():
-                return
-            
-            # Get all timestamp folders
-            timestamp_folders = [f for f in character_folder.iterdir() if f.is_dir()]
-            
-            # Sort by modification time (newest first)
-            timestamp_folders.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-            
-            # Remove oldest backups if we have more than max_backups
-            if len(timestamp_folders) > max_backups:
-                folders_to_delete = timestamp_folders[max_backups:]
-                
-                for folder in folders_to_delete:
-                    try:
-                        # Remove all files in the folder
-                        for file in folder.iterdir():
-                            file.unlink()
-                        # Remove the folder
-                        folder.rmdir()
-                        self.logger.debug(f"Cleaned up old backup: {folder}")
-                    except Exception as e:
-                        self.logger.warning(f"Could not remove old backup {folder}: {e}")
-                        
-        except Exception as e:
-            self.logger.error(f"Error during backup cleanup: {e}")
-
-    def _create_simple_backup(self):
+    def _create_simple_backup(self, folder: Path, files: Dict[str, bytes]):
         """Fallback simple backup method"""
         try:
-            backup_path = self.file_path.with_suffix(self.file_path.suffix + self.config.backup_suffix)
-            with open(self.file_path, 'rb') as src, open(backup_path, 'wb') as dst:
-                dst.write(src.read())
-            self.logger.debug(f"Simple backup created: {backup_path}")
+            for name, data in files.items():
+                backup_path = folder / (name + self.config.backup_suffix)
+                with open(backup_path, 'wb') as dst:
+                    dst.write(data)
+                self.logger.debug(f"Simple backup created: {backup_path}")
         except Exception as e:
             self.logger.error(f"Error creating simple backup: {e}")
     
     def _process_manager_updates(self):
-        """Process updates from all managers"""
-        # Get stats updates and apply to XML
-        if 'stats' in self.managers:
-            self._apply_stats_updates()
+        """Process updates from the managers that changed something"""
+        # Stats edits live in the widgets until now; only differing values are written
+        if 'stats' in self.managers and self._apply_stats_updates():
+            self.mark_dirty('stats', 'PlayerProfile')
         
-        # Save changes from all other managers
+        # Save changes from the other dirty managers
         save_methods = {
             'territory': 'save_territory_changes',
             'pandora_pedia': 'save_pandora_pedia_changes', 
@@ -881,94 +1464,112 @@ class SaveEditor:
             'checkpoints': 'save_checkpoints_changes'
         }
         
-        for manager_key, method_name in save_methods.items():
+        for manager_key in list(self.dirty_sections):
+            method_name = save_methods.get(manager_key)
+            if method_name is None:
+                continue
             try:
                 manager = self.managers.get(manager_key)
                 if manager and hasattr(manager, method_name):
                     method = getattr(manager, method_name)
-                    result = method(self.tree)
+                    with span(f"{manager_key}.{method_name}", category="manager"):
+                        result = method(self.tree)
                     if result is not None:  # Some methods return updated tree
                         self.tree = result
             except Exception as e:
                 self.logger.error(f"Error saving {manager_key} changes: {e}")
     
-    def _apply_stats_updates(self):
-        """Apply statistics updates to XML tree - FIXED VERSION"""
+    def _apply_stats_updates(self) -> bool:
+        """Apply statistics updates to XML tree; returns True if any attribute changed"""
         stats_manager = self.managers.get('stats')
         if not stats_manager:
-            return
+            return False
+        
+        changes = []
+        
+        def set_attr(element, key, value, label):
+            value = None if value is None else str(value)
+            if self.journal.set(element, key, value):
+                changes.append(label)
+                self.logger.debug(f"Updated {label} = {value}")
+        
+        def sub_element(parent, tag):
+            element = ET.Element(tag)
+            self.journal.append(parent, element)
+            changes.append(tag)
+            return element
         
         try:
-            root = self.tree.getroot()
-            stats_updates = stats_manager.get_stats_updates()
+            with self.journal.transaction("Edit stats", "stats", "PlayerProfile"):
+                root = self.tree.getroot()
+                stats_updates = stats_manager.get_stats_updates()
             
-            # Update PlayerProfile sections
-            profile = root.find("PlayerProfile")
-            if profile is None:
-                profile = ET.SubElement(root, "PlayerProfile")
+                # Update PlayerProfile sections
+                profile = root.find("PlayerProfile")
+                if profile is None:
+                    profile = sub_element(root, "PlayerProfile")
             
-            # UPDATE PlayerProfile attributes (like crc_LastLoadedPin)
-            if "PlayerProfile" in stats_updates and stats_updates["PlayerProfile"]:
-                for key, value in stats_updates["PlayerProfile"].items():
-                    if value is None:
-                        # Remove the attribute
-                        if key in profile.attrib:
-                            del profile.attrib[key]
-                            self.logger.debug(f"Removed PlayerProfile.{key}")
-                    else:
-                        profile.set(key, str(value))
-                        self.logger.debug(f"Updated PlayerProfile.{key} = {value}")
+                # UPDATE PlayerProfile attributes (like crc_LastLoadedPin)
+                if "PlayerProfile" in stats_updates and stats_updates["PlayerProfile"]:
+                    for key, value in stats_updates["PlayerProfile"].items():
+                        # None removes the attribute
+                        set_attr(profile, key, value, f"PlayerProfile.{key}")
             
-            # Update profile sections
-            profile_sections = ["BaseInfo", "XpInfo", "OptionsInfo", "TimeInfo"]
-            for section_name in profile_sections:
-                if section_name in stats_updates and stats_updates[section_name]:
-                    section = profile.find(section_name)
-                    if section is None:
-                        section = ET.SubElement(profile, section_name)
+                # Update profile sections
+                profile_sections = ["BaseInfo", "XpInfo", "OptionsInfo", "TimeInfo"]
+                for section_name in profile_sections:
+                    if section_name in stats_updates and stats_updates[section_name]:
+                        section = profile.find(section_name)
+                        if section is None:
+                            section = sub_element(profile, section_name)
                     
-                    for key, value in stats_updates[section_name].items():
-                        section.set(key, str(value))
-                        self.logger.debug(f"Updated {section_name}.{key} = {value}")
+                        for key, value in stats_updates[section_name].items():
+                            set_attr(section, key, value, f"{section_name}.{key}")
             
-            # Update Metagame section (outside PlayerProfile)
-            if "Metagame" in stats_updates and stats_updates["Metagame"]:
-                metagame = root.find("Metagame")
-                if metagame is None:
-                    metagame = ET.SubElement(root, "Metagame")
+                # Update Metagame section (outside PlayerProfile)
+                if "Metagame" in stats_updates and stats_updates["Metagame"]:
+                    metagame = root.find("Metagame")
+                    if metagame is None:
+                        metagame = sub_element(root, "Metagame")
                 
-                for key, value in stats_updates["Metagame"].items():
-                    metagame.set(key, str(value))
-                    self.logger.debug(f"Updated Metagame.{key} = {value}")
+                    for key, value in stats_updates["Metagame"].items():
+                        set_attr(metagame, key, value, f"Metagame.{key}")
             
-            # Update Player sections within Metagame
-            metagame = root.find("Metagame")
-            if metagame is not None:
-                for player_section in ["Player0", "Player1"]:
-                    if player_section in stats_updates and stats_updates[player_section]:
-                        player = metagame.find(player_section)
-                        if player is None:
-                            player = ET.SubElement(metagame, player_section)
+                # Update Player sections within Metagame
+                metagame = root.find("Metagame")
+                if metagame is not None:
+                    for player_section in ["Player0", "Player1"]:
+                        if player_section in stats_updates and stats_updates[player_section]:
+                            player = metagame.find(player_section)
+                            if player is None:
+                                player = sub_element(metagame, player_section)
                         
-                        for key, value in stats_updates[player_section].items():
-                            player.set(key, str(value))
-                            self.logger.debug(f"Updated {player_section}.{key} = {value}")
+                            for key, value in stats_updates[player_section].items():
+                                set_attr(player, key, value, f"{player_section}.{key}")
             
-            # Update RecoveryBits in the correct location
-            if "BaseInfo" in stats_updates and "RecoveryBits" in stats_updates["BaseInfo"]:
-                # Also check if it should be in Possessions_Recovery
-                recovery = profile.find("Possessions_Recovery")
-                if recovery is not None:
-                    recovery.set("RecoveryBits", stats_updates["BaseInfo"]["RecoveryBits"])
-                    self.logger.debug(f"Updated Possessions_Recovery.RecoveryBits")
+                # Update RecoveryBits in the correct location
+                if "BaseInfo" in stats_updates and "RecoveryBits" in stats_updates["BaseInfo"]:
+                    # Also check if it should be in Possessions_Recovery
+                    recovery = profile.find("Possessions_Recovery")
+                    if recovery is not None:
+                        set_attr(recovery, "RecoveryBits", stats_updates["BaseInfo"]["RecoveryBits"],
+                                 "Possessions_Recovery.RecoveryBits")
             
-            self.logger.debug("Stats updates applied successfully")
+                self.logger.debug("Stats updates applied successfully (%d changes)", len(changes))
             
         except Exception as e:
             self.logger.error(f"Error applying stats updates: {e}", exc_info=True)
+            changes.clear()  # The transaction rolled the edits back
+        
+        return bool(changes)
+
+def setup_logging(config: SaveEditorConfig) -> Optional[logging.handlers.QueueListener]:
+    """Configure application logging based on config settings.
 
-def setup_logging(config: SaveEditorConfig):
-    """Configure application logging based on config settings"""
+    Records are handed to a QueueHandler so the calling (UI) thread never does
+    file or console I/O; a QueueListener thread drains the queue into the real
+    handlers. Returns the listener so the caller can stop it on exit.
+    """
     handlers = []
     
     # Add file handler if enabled
@@ -981,19 +1582,37 @@ def setup_logging(config: SaveEditorConfig):
         console_handler = logging.StreamHandler()
         handlers.append(console_handler)
     
+    # Convert log level string to logging constant
+    log_level = getattr(logging, config.log_level.upper(), logging.INFO)
+    
+    # Apply per-logger overrides (XMLHandler, PS3XMLHandler, each manager...)
+    for logger_name, level_name in config.logger_levels.items():
+        level = getattr(logging, level_name.upper(), None)
+        if isinstance(level, int):
+            logging.getLogger(logger_name).setLevel(level)
+    
     # If no handlers are enabled, add a null handler to prevent errors
     if not handlers:
-        handlers.append(logging.NullHandler())
+        logging.basicConfig(level=log_level, handlers=[logging.NullHandler()], force=True)
+        return None
     
-    # Convert log level string to logging constant
-    log_level = getattr(logging, config.log_level.upper(), logging.INFO)
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
     
     logging.basicConfig(
         level=log_level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=handlers,
+        format='%(message)s',  # Real formatting happens on the listener side
+        handlers=[logging.handlers.QueueHandler(log_queue)],
         force=True  # Override any existing logging configuration
     )
+    
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
 
 
 def main():
@@ -1046,4 +1665,5 @@ def main():
                 pass
             
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Library rescans use a process pool
     main()
\ No newline at end of file
@@ -584,18 +584,19 @@ eKnown Value: {self._get_eknown_value(article_data['status'])}
         try:
             changes_made = False
             
-            for article_id, article_data in self.article_data.items():
-                if article_data['status'] == "Not Discovered":
-                    # Update data
-                    article_data['status'] = "Discovered | Not Seen"
-                    article_data['element'].set("eKnown", "1")
-                    changes_made = True
+            with self.main_window.journal.transaction("Discover all articles", "pandora_pedia", "AvatarPandorapediaDB_Status"):
+                for article_id, article_data in self.article_data.items():
+                    if article_data['status'] == "Not Discovered":
+                        # Update data
+                        article_data['status'] = "Discovered | Not Seen"
+                        self.main_window.journal.set(article_data['element'], "eKnown", "1")
+                        changes_made = True
             
             if changes_made:
                 # Update the tree display
                 self._apply_filter()  # Refresh the display
                 self._update_all_displays()
-                self.main_window.unsaved_label.config(text="Unsaved Changes")
+                self.main_window.mark_dirty("pandora_pedia", "AvatarPandorapediaDB_Status")
                 show_success("Success", "🔓 All articles have been discovered!")
             else:
                 show_info("Info", "ℹ️ All articles are already discovered!")
@@ -622,21 +623,22 @@ eKnown Value: {self._get_eknown_value(article_data['status'])}
         try:
             changes_made = False
             
-            for item in selected_items:
-                values = self.pandora_pedia_tree.item(item, "values")
-                article_id = values[1]  # ID is at index 1
+            with self.main_window.journal.transaction("Set article status", "pandora_pedia", "AvatarPandorapediaDB_Status"):
+                for item in selected_items:
+                    values = self.pandora_pedia_tree.item(item, "values")
+                    article_id = values[1]  # ID is at index 1
                 
-                if article_id in self.article_data:
-                    # Update data
-                    self.article_data[article_id]['status'] = status
-                    self.article_data[article_id]['element'].set("eKnown", eknown_value)
-                    changes_made = True
+                    if article_id in self.article_data:
+                        # Update data
+                        self.article_data[article_id]['status'] = status
+                        self.main_window.journal.set(self.article_data[article_id]['element'], "eKnown", eknown_value)
+                        changes_made = True
 
             if changes_made:
                 # Update the tree display
                 self._apply_filter()  # Refresh the display
                 self._update_all_displays()
-                self.main_window.unsaved_label.config(text="Unsaved Changes")
+                self.main_window.mark_dirty("pandora_pedia", "AvatarPandorapediaDB_Status")
                 
                 status_icons = {"Not Discovered": "❌", "Discovered | Not Seen": "📖", "Discovered | Has Seen": "✅"}
                 icon = status_icons.get(status, "📖")
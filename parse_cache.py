@@ -0,0 +1,107 @@
+import hashlib
+import os
+import pickle
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import logging
+
+
+class ParseCache:
+    """
+    On-disk cache of parsed saves, so reopening an unchanged save skips the
+    handlers' locate/decode/parse/checksum/index work.
+
+    An entry is keyed by (path, size, mtime, sha256) of every file the save is
+    made of, plus the platform. It stores the parsed root element and the
+    load-time layout (attribute index, region map) as a zlib-compressed pickle
+    in <root>/<key>.pkl.z. Hits touch the file's mtime; once the folder exceeds
+    max_bytes the least recently used entries are deleted.
+    """
+
+    CACHE_VERSION = 1
+    SUFFIX = ".pkl.z"
+
+    def __init__(self, root: Path, max_bytes: int):
+        self.logger = logging.getLogger('ParseCache')
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def make_key(self, game_version: str, digests: Dict[Path, str]) -> str:
+        """Cache key for the files of a save, given their sha256 digests"""
+        parts = [f"v{self.CACHE_VERSION}", game_version]
+        for path, digest in sorted(digests.items()):
+            stat = os.stat(path)
+            parts.append(f"{Path(path).resolve()}|{stat.st_size}|{stat.st_mtime_ns}|{digest}")
+        return hashlib.sha256("\n".join(parts).encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / f"{key}{self.SUFFIX}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'rb') as f:
+                entry = pickle.loads(zlib.decompress(f.read()))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning("Discarding unreadable cache entry %s: %s", entry_path.name, e)
+            entry_path.unlink(missing_ok=True)
+            return None
+
+        os.utime(entry_path)  # Mark as most recently used
+        self.logger.debug("Cache hit %s", key[:12])
+        return entry
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+        try:
+            payload = zlib.compress(pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL), 1)
+            if len(payload) > self.max_bytes:
+                return
+            self.root.mkdir(parents=True, exist_ok=True)
+            entry_path = self._entry_path(key)
+            temp_path = entry_path.with_suffix('.tmp')
+            with open(temp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(temp_path, entry_path)
+            self.logger.debug("Cached %s (%d bytes)", key[:12], len(payload))
+            self.evict()
+        except Exception as e:
+            self.logger.warning("Could not write cache entry: %s", e)
+
+    def _entries(self) -> List[tuple]:
+        if not self.root.exists():
+            return []
+        return [(path, path.stat()) for path in self.root.glob(f"*{self.SUFFIX}")]
+
+    def evict(self) -> int:
+        """Delete least recently used entries until the cache fits max_bytes"""
+        entries = sorted(self._entries(), key=lambda item: item[1].st_mtime_ns)
+        total = sum(stat.st_size for _, stat in entries)
+        removed = 0
+        for path, stat in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+            removed += 1
+        if removed:
+            self.logger.debug("Evicted %d cache entries", removed)
+        return removed
+
+    def clear(self) -> None:
+        for path, _ in self._entries():
+            path.unlink(missing_ok=True)
+
+    def usage(self) -> Dict[str, int]:
+        entries = self._entries()
+        return {'entries': len(entries), 'bytes': sum(stat.st_size for _, stat in entries)}
@@ -5,6 +5,8 @@ from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
 from io import BytesIO, StringIO
 import logging
+from timing import span
+from attribute_index import AttributeIndex
 
 class PCXMLHandler:
     """
@@ -31,8 +33,9 @@ class PCXMLHandler:
         logger.debug(f"Loading PC XML tree from file: {file_path}")
         
         try:
-            with open(file_path, 'rb') as f:
-                data = f.read()
+            with span("PCXMLHandler.read"):
+                with open(file_path, 'rb') as f:
+                    data = f.read()
                 
             # Get file size for reference
             file_size = len(data)
@@ -42,12 +45,13 @@ class PCXMLHandler:
             xml_start_markers = [b'<Savegame', b'<SaveGame', b'<savegame', b'<SaveData']
             xml_start = -1
             
-            for marker in xml_start_markers:
-                pos = data.find(marker)
-                if pos != -1:
-                    xml_start = pos
-                    logger.debug(f"Found XML start marker at position {xml_start}")
-                    break
+            with span("PCXMLHandler.locate"):
+                for marker in xml_start_markers:
+                    pos = data.find(marker)
+                    if pos != -1:
+                        xml_start = pos
+                        logger.debug("Found XML start marker at position %d", xml_start)
+                        break
             
             if xml_start == -1:
                 logger.warning("Could not find XML start marker, attempting direct parse")
@@ -62,12 +66,13 @@ class PCXMLHandler:
             xml_end_markers = [b'</Savegame>', b'</SaveGame>', b'</savegame>', b'</SaveData>']
             xml_end = -1
             
-            for marker in xml_end_markers:
-                pos = data.rfind(marker)
-                if pos != -1:
-                    xml_end = pos + len(marker)
-                    logger.debug(f"Found XML end marker at position {xml_end}")
-                    break
+            with span("PCXMLHandler.locate"):
+                for marker in xml_end_markers:
+                    pos = data.rfind(marker)
+                    if pos != -1:
+                        xml_end = pos + len(marker)
+                        logger.debug("Found XML end marker at position %d", xml_end)
+                        break
             
             if xml_end == -1:
                 # If no end marker found, try direct parsing
@@ -82,11 +87,13 @@ class PCXMLHandler:
             xml_content = data[xml_start:xml_end]
             
             # Decode to string
-            xml_string = xml_content.decode('utf-8', errors='ignore')
+            with span("PCXMLHandler.decode"):
+                xml_string = xml_content.decode('utf-8', errors='ignore')
             
             # Parse as XML
-            root = ET.fromstring(xml_string)
-            tree = ET.ElementTree(root)
+            with span("PCXMLHandler.parse"):
+                root = ET.fromstring(xml_string)
+                tree = ET.ElementTree(root)
             
             logger.debug(f"Successfully extracted and parsed PC XML, start: {xml_start}, end: {xml_end}")
             return tree, xml_start, file_size
@@ -118,6 +125,83 @@ class PCXMLHandler:
         logger.debug("PC save format - skipping checksum verification")
         return True
     
+    @staticmethod
+    def build_output(tree: ET.ElementTree, original_data: bytes) -> bytes:
+        """
+        Build the complete file contents for the tree, preserving any binary
+        header and footer found in the original file.
+        """
+        logger = PCXMLHandler.get_logger()
+        
+        # Find the XML section boundaries in the original file
+        xml_start = -1
+        xml_start_marker = None
+        xml_start_markers = [b'<Savegame', b'<SaveGame', b'<savegame', b'<SaveData']
+        
+        for marker in xml_start_markers:
+            pos = original_data.find(marker)
+            if pos != -1:
+                xml_start = pos
+                xml_start_marker = marker
+                logger.debug(f"Found XML start marker '{marker.decode('utf-8')}' at position {xml_start}")
+                break
+        
+        # Find the end marker in original file
+        xml_end = -1
+        xml_end_markers = [b'</Savegame>', b'</SaveGame>', b'</savegame>', b'</SaveData>']
+        
+        for marker in xml_end_markers:
+            pos = original_data.rfind(marker)
+            if pos != -1:
+                xml_end = pos + len(marker)
+                logger.debug(f"Found XML end marker '{marker.decode('utf-8')}' at position {xml_end}")
+                break
+        
+        # Get the root tag name from the start marker if found
+        root_tag = None
+        if xml_start_marker is not None:
+            root_tag = xml_start_marker.decode('utf-8').strip('<')
+            logger.debug(f"Detected root tag name: {root_tag}")
+        
+        # Generate new XML content
+        root = tree.getroot()
+        
+        # Ensure the root tag matches what was found in the original file
+        if root_tag is not None and root.tag != root_tag:
+            logger.debug(f"Changing root tag from '{root.tag}' to '{root_tag}' to match original file")
+            root.tag = root_tag
+        
+        # Generate XML content
+        xml_buffer = BytesIO()
+        tree.write(xml_buffer, encoding='utf-8', xml_declaration=False)
+        new_xml = xml_buffer.getvalue()
+        
+        # Check if we need to preserve binary header and footer
+        if xml_start > 0 and xml_end > 0 and xml_end < len(original_data):
+            # Preserve header and footer
+            logger.debug(f"Preserving binary header ({xml_start} bytes) and footer ({len(original_data) - xml_end} bytes)")
+            return original_data[:xml_start] + new_xml + original_data[xml_end:]
+        elif xml_start > 0:
+            # Preserve header only
+            logger.debug(f"Preserving binary header (first {xml_start} bytes)")
+            return original_data[:xml_start] + new_xml
+        else:
+            # No header or footer to preserve, write XML directly
+            logger.debug("No binary header detected, writing XML directly")
+            return b'<?xml version="1.0" encoding="utf-8"?>\n' + new_xml
+
+    @staticmethod
+    def patch_output(original_data: bytes, patches: list) -> bytes:
+        """Apply same-length byte patches (from AttributeIndex.diff); PC saves carry no checksum"""
+        PCXMLHandler.get_logger().debug("Patched %d attribute values in place", len(patches))
+        return AttributeIndex.apply(original_data, patches)
+
+    @staticmethod
+    def write_output(file_path: Path, output_data: bytes) -> None:
+        """Write file contents produced by build_output"""
+        with open(file_path, 'wb') as f:
+            f.write(output_data)
+
     @staticmethod
     def save_xml_tree(tree: ET.ElementTree, file_path: Path, create_backup: bool = True) -> None:
         """
@@ -144,86 +228,7 @@ class PCXMLHandler:
                     with open(backup_path, 'wb') as dst:
                         dst.write(original_data)
             
-            # Find the XML section boundaries in the original file
-            xml_start = -1
-            xml_start_marker = None
-            xml_start_markers = [b'<Savegame', b'<SaveGame', b'<savegame', b'<SaveData']
-            
-            for marker in xml_start_markers:
-                pos = original_data.find(marker)
-                if pos != -1:
-                    xml_start = pos
-                    xml_start_marker = marker
-                    logger.debug(f"Found XML start marker '{marker.decode('utf-8')}' at position {xml_start}")
-                    break
-            
-            # Find the end marker in original file
-            xml_end = -1
-            xml_end_marker = None
-            xml_end_markers = [b'</Savegame>', b'</SaveGame>', b'</savegame>', b'</SaveData>']
-            
-            for marker in xml_end_markers:
-                pos = original_data.rfind(marker)
-                if pos != -1:
-                    xml_end = pos + len(marker)
-                    xml_end_marker = marker
-                    logger.debug(f"Found XML end marker '{marker.decode('utf-8')}' at position {xml_end}")
-                    break
-            
-            # Get the root tag name from the start marker if found
-            root_tag = None
-            if xml_start_marker is not None:
-                root_tag = xml_start_marker.decode('utf-8').strip('<')
-                logger.debug(f"Detected root tag name: {root_tag}")
-            
-            # Generate new XML content
-            root = tree.getroot()
-            
-            # Ensure the root tag matches what was found in the original file
-            if root_tag is not None and root.tag != root_tag:
-                logger.debug(f"Changing root tag from '{root.tag}' to '{root_tag}' to match original file")
-                root.tag = root_tag
-            
-            # Generate XML content
-            xml_buffer = BytesIO()
-            tree.write(xml_buffer, encoding='utf-8', xml_declaration=False)
-            new_xml = xml_buffer.getvalue()
-            
-            # Check if we need to preserve binary header and footer
-            if xml_start > 0 and xml_end > 0 and xml_end < len(original_data):
-                # Preserve header and footer
-                logger.debug(f"Preserving binary header ({xml_start} bytes) and footer ({len(original_data) - xml_end} bytes)")
-                header = original_data[:xml_start]
-                footer = original_data[xml_end:] if xml_end < len(original_data) else b''
-                
-                # Create output data with preserved header and footer
-                output_data = header + new_xml + footer
-                
-                # Write combined file
-                with open(file_path, 'wb') as f:
-                    f.write(output_data)
-                
-                logger.debug(f"Successfully saved PC save with preserved binary header and footer")
-            elif xml_start > 0:
-                # Preserve header only
-                logger.debug(f"Preserving binary header (first {xml_start} bytes)")
-                header = original_data[:xml_start]
-                
-                # Create output data with preserved header
-                output_data = header + new_xml
-                
-                # Write combined file
-                with open(file_path, 'wb') as f:
-                    f.write(output_data)
-                
-                logger.debug(f"Successfully saved PC save with preserved binary header")
-            else:
-                # No header or footer to preserve, write XML directly
-                logger.debug("No binary header detected, writing XML directly")
-                with open(file_path, 'wb') as f:
-                    f.write(b'<?xml version="1.0" encoding="utf-8"?>\n')
-                    f.write(new_xml)
-                
+            PCXMLHandler.write_output(file_path, PCXMLHandler.build_output(tree, original_data))
             logger.debug("PC save file written successfully")
             
         except Exception as e:
@@ -2,6 +2,8 @@ import tkinter as tk
 from tkinter import ttk
 import xml.etree.ElementTree as ET
 from typing import Dict, Optional
+from task_scheduler import populate_treeview
+from game_data import PIN_LOCATION_NAMES
 import logging
 from custom_messagebox import MessageBoxManager, show_info, show_error, show_warning, ask_question, ask_ok_cancel, show_success
 
@@ -272,22 +274,23 @@ class PinsManager:
                 
             changes_made = False
             
-            for item in selected_items:
-                values = self.pins_tree.item(item, 'values')
-                # Extract pin ID from details column or find it in pins_data
-                pin_id = self._extract_pin_id_from_item(item)
+            with self.main_window.journal.transaction("Lock selected pins", "pins", "AvatarPinDB_Status"):
+                for item in selected_items:
+                    values = self.pins_tree.item(item, 'values')
+                    # Extract pin ID from details column or find it in pins_data
+                    pin_id = self._extract_pin_id_from_item(item)
                 
-                if pin_id and pin_id in self.pins_data:
-                    pin_info = self.pins_data[pin_id]
-                    current_status = pin_info['unlocked']
+                    if pin_id and pin_id in self.pins_data:
+                        pin_info = self.pins_data[pin_id]
+                        current_status = pin_info['unlocked']
                     
-                    if current_status != "0":
-                        pin_info['element'].set("eUnlocked", "0")
-                        pin_info['unlocked'] = "0"
-                        changes_made = True
+                        if current_status != "0":
+                            self.main_window.journal.set(pin_info['element'], "eUnlocked", "0")
+                            pin_info['unlocked'] = "0"
+                            changes_made = True
             
             if changes_made:
-                self.main_window.unsaved_label.config(text="Unsaved Changes")
+                self.main_window.mark_dirty("pins", "AvatarPinDB_Status")
                 self._update_all_displays()
                 show_success("Success", "🔒 Selected pins have been locked!")
             else:
@@ -396,17 +399,18 @@ class PinsManager:
                 
             changes_made = False
             
-            for pin_id, pin_info in self.pins_data.items():
-                pin_element = pin_info['element']
-                current_status = pin_info['unlocked']
+            with self.main_window.journal.transaction("Unlock all pins", "pins", "AvatarPinDB_Status"):
+                for pin_id, pin_info in self.pins_data.items():
+                    pin_element = pin_info['element']
+                    current_status = pin_info['unlocked']
                 
-                if current_status != "1":
-                    pin_element.set("eUnlocked", "1")
-                    pin_info['unlocked'] = "1"
-                    changes_made = True
+                    if current_status != "1":
+                        self.main_window.journal.set(pin_element, "eUnlocked", "1")
+                        pin_info['unlocked'] = "1"
+                        changes_made = True
             
             if changes_made:
-                self.main_window.unsaved_label.config(text="Unsaved Changes")
+                self.main_window.mark_dirty("pins", "AvatarPinDB_Status")
                 self._update_all_displays()
                 show_success("Success", "🔓 All pins have been unlocked!")
             else:
@@ -427,20 +431,21 @@ class PinsManager:
                 
             changes_made = False
             
-            for item in selected_items:
-                pin_id = self._extract_pin_id_from_item(item)
+            with self.main_window.journal.transaction("Unlock selected pins", "pins", "AvatarPinDB_Status"):
+                for item in selected_items:
+                    pin_id = self._extract_pin_id_from_item(item)
                 
-                if pin_id and pin_id in self.pins_data:
-                    pin_info = self.pins_data[pin_id]
-                    current_status = pin_info['unlocked']
+                    if pin_id and pin_id in self.pins_data:
+                        pin_info = self.pins_data[pin_id]
+                        current_status = pin_info['unlocked']
                     
-                    if current_status != "1":
-                        pin_info['element'].set("eUnlocked", "1") 
-                        pin_info['unlocked'] = "1"
-                        changes_made = True
+                        if current_status != "1":
+                            self.main_window.journal.set(pin_info['element'], "eUnlocked", "1")
+                            pin_info['unlocked'] = "1"
+                            changes_made = True
             
             if changes_made:
-                self.main_window.unsaved_label.config(text="Unsaved Changes")
+                self.main_window.mark_dirty("pins", "AvatarPinDB_Status")
                 self._update_all_displays()
                 show_success("Success", "🔓 Selected pins have been unlocked!")
             else:
@@ -466,16 +471,17 @@ class PinsManager:
                 
             changes_made = False
             
-            for pin_id, pin_info in self.pins_data.items():
-                current_status = pin_info['unlocked']
+            with self.main_window.journal.transaction("Reset all pins", "pins", "AvatarPinDB_Status"):
+                for pin_id, pin_info in self.pins_data.items():
+                    current_status = pin_info['unlocked']
                 
-                if current_status != "0":
-                    pin_info['element'].set("eUnlocked", "0")
-                    pin_info['unlocked'] = "0"
-                    changes_made = True
+                    if current_status != "0":
+                        self.main_window.journal.set(pin_info['element'], "eUnlocked", "0")
+                        pin_info['unlocked'] = "0"
+                        changes_made = True
             
             if changes_made:
-                self.main_window.unsaved_label.config(text="Unsaved Changes")
+                self.main_window.mark_dirty("pins", "AvatarPinDB_Status")
                 self._update_all_displays()
                 show_success("Success", "🔒 All pins have been reset to locked status!")
             else:
@@ -545,10 +551,6 @@ class PinsManager:
         """Load pins data with improved organization"""
         self.logger.debug("Loading pins with modern interface")
         try:
-            # Clear existing items
-            for item in self.pins_tree.get_children():
-                self.pins_tree.delete(item)
-            
             self.pins_data = {}
             pins = tree.findall(".//AvatarPinDB_Status/Pin")
             
@@ -559,7 +561,7 @@ class PinsManager:
             # Process and categorize pins
             categorized_pins = self._categorize_pins(pins)
             
-            # Add pins to tree in organized order
+            # Store pins in organized order; _update_all_displays fills the tree
             for category, pins_list in categorized_pins.items():
                 for pin in sorted(pins_list, key=lambda x: self._get_location_name(x.get("crc_id", ""))):
                     self._process_pin(pin)
@@ -593,7 +595,7 @@ class PinsManager:
         return categories
 
     def _process_pin(self, pin):
-        """Process a single pin with enhanced display"""
+        """Store a single pin's data and return its (values, tags) tree row"""
         try:
             pin_id = pin.get("crc_id", "")
             unlocked = pin.get("eUnlocked", "0")
@@ -621,17 +623,12 @@ class PinsManager:
             counters = len(pin.findall("CompletionCounter"))
             details_text = f"ID: {pin_id[-6:]}" if len(pin_id) > 6 else pin_id
             
-            # Insert into tree with enhanced data
-            self.pins_tree.insert("", tk.END, values=(
-                status_icon,
-                clean_location,
-                pin_type,
-                progress_text,
-                details_text
-            ), tags=(tag,))
+            # Tree row with enhanced data
+            return (status_icon, clean_location, pin_type, progress_text, details_text), (tag,)
             
         except Exception as e:
             self.logger.error(f"Error processing pin {pin_id}: {str(e)}", exc_info=True)
+            return None
 
     def _analyze_pin_type(self, location_name, unlocked):
         """Analyze pin type and return appropriate styling"""
@@ -692,17 +689,15 @@ class PinsManager:
         filter_value = self.filter_var.get()
         search_text = self.search_var.get().lower()
         
-        # Store current selection to restore after filtering
-        current_selection = self.pins_tree.selection()
-        
-        # Clear and repopulate based on filter
-        for item in self.pins_tree.get_children():
-            self.pins_tree.delete(item)
-        
-        # Re-add filtered items
-        for pin_id, pin_data in self.pins_data.items():
+        # Repopulate with the filtered items, inserted in time-sliced chunks
+        rows = []
+        for pin_id, pin_data in list(self.pins_data.items()):
             if self._should_show_pin(pin_id, pin_data, filter_value, search_text):
-                self._process_pin(pin_data['element'])
+                row = self._process_pin(pin_data['element'])
+                if row:
+                    rows.append(row)
+        
+        populate_treeview(getattr(self.main_window, 'scheduler', None), "pins.rows", self.pins_tree, rows)
 
     def _should_show_pin(self, pin_id, pin_data, filter_value, search_text):
         """Determine if pin should be shown based on filters"""
@@ -729,65 +724,7 @@ class PinsManager:
 
     def _get_location_name(self, pin_id):
         """Convert pin ID to human-readable location name"""
-        location_names = {
-            # SP MAPS
-            "3822194552": "HOMETREE",            
-            "1057194188": "VA'ERÄ RAMUNONG",
-            "1172651822": "THE FEBA",
-            "1847852653": "GRAVE'S BOG",
-            "2171723794": "THE HANGING GARDENS",
-            "2292208788": "SWOTULU",
-            "238707229":  "TORUKÄ NA'RìNG",
-            "2587251285": "NEEDLE HILLS",
-            "2752812145": "ECHO CHASM",
-            "2856892107": "KXANìA TAW",
-            "2961077726": "LOST CATHEDRAL",
-            "3409126972": "PLAINS OF GOLIATH (KAOLIÄ TEI)",
-            "355473279":  "BLUE LAGOON",
-            "2943222331": "IKNIMAYA",
-            "615754132":  "HELL'S GATE",
-            "837458676":  "TANTALUS (TA'NATASI)",
-            # MULTIPLAYER
-            "1437051617": "IKNIMAYA - MULTIPLAYER",
-            "902032528":  "NA'RìNG - MULTIPLAYER",
-            "1846881984": "FREYNA TARON - MULTIPLAYER",
-            "2427499480": "NO'ANI TEI - MULTIPLAYER",  
-            "4220570174": "KXANìA TAW - MULTIPLAYER",
-            "4168272830": "VA'ERÄ RAMUNONG - MULTIPLAYER",
-            "408444403":  "UNIL TUKRU - MULTIPLAYER",
-            "3575765971": "VUL NAWM - MULTIPLAYER",
-            "948986278":  "SWOTULU - MULTIPLAYER",
-            "2232107097": "FORT NAVARONE - MULTIPLAYER",
-            "3616200713": "STALKER'S VALLEY - MULTIPLAYER",
-            "2509501782": "HELL'S GATE - MULTIPLAYER",
-            # FIXME! PINS
-            "105239137":  "FIXME! 105239137",
-            "1504064473": "FIXME! 1504064473",
-            "1578821154": "FIXME! 1578821154",
-            "1628184437": "FIXME! 1628184437",
-            "1741938656": "FIXME! 1741938656",
-            "1771880106": "FIXME! 1771880106",
-            "1782610090": "FIXME! 1782610090",
-            "1865345760": "FIXME! 1865345760",
-            "194406935":  "FIXME! 194406935",
-            "2001468046": "FIXME! 2001468046",
-            "2169212369": "Dev Room: Animation Creatures",
-            "2185381138": "FIXME! 2185381138",
-            "2216033045": "FIXME! 2216033045",
-            "2353717556": "FIXME! 2353717556",
-            "2555792139": "FIXME! 2555792139",
-            "2672591835": "FIXME! 2672591835",
-            "3564339531": "FIXME! 3564339531",
-            "3586942544": "FIXME! 3586942544",
-            "3615918544": "FIXME! 3615918544",
-            "3903502716": "FIXME! 3903502716",
-            "3975313082": "Dev Room: Orouleau",
-            "4294730242": "FIXME! 4294730242",
-            "470159002":  "FIXME! 470159002",
-            "60855408":   "FIXME! 60855408",
-            "3852438644": "FIXME! 3852438644",
-        }        
-        return location_names.get(pin_id, f"Unreleased Location ({pin_id})")
+        return PIN_LOCATION_NAMES.get(pin_id, f"Unreleased Location ({pin_id})")
 
 
     def save_pin_changes(self, tree: ET.ElementTree) -> ET.ElementTree:
@@ -851,11 +788,12 @@ class PinsManager:
                 # Special status, cycle through 2 -> 1 -> 0 -> 2
                 new_status = "1" if current_status == "2" else "0"
             
-            pin_info['element'].set("eUnlocked", new_status)
+            self.main_window.journal.set(pin_info['element'], "eUnlocked", new_status,
+                                         "pins", "AvatarPinDB_Status")
             pin_info['unlocked'] = new_status
             
             # Update displays
-            self.main_window.unsaved_label.config(text="Unsaved Changes")
+            self.main_window.mark_dirty("pins", "AvatarPinDB_Status")
             self._update_all_displays()
             
         except Exception as e:
@@ -8,6 +8,7 @@ import logging
 import struct
 import binascii
 import re
+from timing import span
 
 class PS3XMLHandler:
     """
@@ -20,16 +21,19 @@ class PS3XMLHandler:
     
     @staticmethod
     def debug_file_structure(data: bytes, description: str = "File"):
-        """Debug helper to analyze file structure"""
+        """Debug helper to analyze file structure (no-op unless DEBUG is enabled)"""
         logger = PS3XMLHandler.get_logger()
-        logger.debug(f"\n=== {description} Analysis ===")
-        logger.debug(f"File size: {len(data)} bytes")
-        logger.debug(f"First 100 bytes (hex): {data[:100].hex()}")
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        
+        logger.debug("=== %s Analysis ===", description)
+        logger.debug("File size: %d bytes", len(data))
+        logger.debug("First 100 bytes (hex): %s", data[:100].hex())
         
         # Try to decode readable parts
         try:
             readable = data[:100].decode('utf-8', errors='ignore')
-            logger.debug(f"First 100 bytes (ascii): {readable}")
+            logger.debug("First 100 bytes (ascii): %s", readable)
         except:
             logger.debug("First 100 bytes not readable as ASCII")
         
@@ -38,9 +42,9 @@ class PS3XMLHandler:
         for marker in xml_markers:
             pos = data.find(marker)
             if pos != -1:
-                logger.debug(f"Found {marker} at position {pos}")
+                logger.debug("Found %r at position %d", marker, pos)
                 if pos > 0:
-                    logger.debug(f"20 bytes before XML: {data[max(0, pos-20):pos].hex()}")
+                    logger.debug("20 bytes before XML: %s", data[max(0, pos-20):pos].hex())
                 break
     
     @staticmethod
@@ -167,7 +171,7 @@ class PS3XMLHandler:
         if xml_end == -1:
             raise ValueError("No XML end marker found in data")
         
-        logger.debug(f"XML boundaries: {xml_start} to {xml_end} (length: {xml_end - xml_start})")
+        logger.debug("XML boundaries: %d to %d (length: %d)", xml_start, xml_end, xml_end - xml_start)
         
         # Validate boundaries
         if xml_start >= xml_end:
@@ -300,11 +304,12 @@ class PS3XMLHandler:
         logger.debug(f"Loading PS3 XML tree from file: {file_path}")
         
         try:
-            with open(file_path, 'rb') as f:
-                data = f.read()
+            with span("PS3XMLHandler.read"):
+                with open(file_path, 'rb') as f:
+                    data = f.read()
                 
             file_size = len(data)
-            logger.debug(f"Read {file_size} bytes from PS3 save file")
+            logger.debug("Read %d bytes from PS3 save file", file_size)
             
             # Debug original file structure
             PS3XMLHandler.debug_file_structure(data, "Original PS3 Save")
@@ -312,7 +317,8 @@ class PS3XMLHandler:
             # Try direct XML parsing first (for files that are pure XML)
             try:
                 logger.debug("Attempting direct XML parsing...")
-                tree = ET.parse(file_path)
+                with span("PS3XMLHandler.parse", mode="direct"):
+                    tree = ET.parse(file_path)
                 logger.debug("Direct XML parsing successful")
                 # Clean up any duplicate attributes
                 PS3XMLHandler.clean_duplicate_attributes(tree)
@@ -322,7 +328,8 @@ class PS3XMLHandler:
             
             # Find XML boundaries in binary data
             try:
-                xml_start, xml_end = PS3XMLHandler.find_xml_boundaries(data)
+                with span("PS3XMLHandler.locate"):
+                    xml_start, xml_end = PS3XMLHandler.find_xml_boundaries(data)
             except ValueError as e:
                 logger.error(f"Could not find XML boundaries: {e}")
                 raise ValueError(f"Could not find valid XML in PS3 save file: {e}")
@@ -332,15 +339,17 @@ class PS3XMLHandler:
             logger.debug(f"Extracted XML content length: {len(xml_content)}")
             
             # Clean the XML content
-            clean_xml = PS3XMLHandler.clean_xml_content(xml_content)
+            with span("PS3XMLHandler.decode"):
+                clean_xml = PS3XMLHandler.clean_xml_content(xml_content)
             
             if not clean_xml:
                 raise ValueError("No valid XML content found after cleaning")
             
             # Parse as XML
             try:
-                root = ET.fromstring(clean_xml)
-                tree = ET.ElementTree(root)
+                with span("PS3XMLHandler.parse"):
+                    root = ET.fromstring(clean_xml)
+                    tree = ET.ElementTree(root)
                 logger.debug("Successfully parsed PS3 XML tree")
             except ET.ParseError as e:
                 logger.error(f"XML parsing failed: {e}")
@@ -397,6 +406,115 @@ class PS3XMLHandler:
         logger.debug("PS3 save file contains XML content")
         return True
     
+    @staticmethod
+    def build_output(tree: ET.ElementTree, original_data: bytes) -> bytes:
+        """
+        Build the complete contents of one PS3 save file for the tree, preserving
+        the binary wrapper around the XML exactly.
+        """
+        logger = PS3XMLHandler.get_logger()
+        
+        # Clean up duplicate attributes before saving
+        PS3XMLHandler.clean_duplicate_attributes(tree)
+        
+        original_size = len(original_data)
+        logger.debug(f"Original file size: {original_size} bytes")
+        
+        # Debug original file
+        PS3XMLHandler.debug_file_structure(original_data, "Original File Before Save")
+        
+        # Check if this is a pure XML file or contains binary wrapper
+        try:
+            # Try to parse the original file directly
+            ET.fromstring(original_data)
+            is_pure_xml = True
+            logger.debug("File is pure XML")
+        except ET.ParseError:
+            is_pure_xml = False
+            logger.debug("File contains binary wrapper around XML")
+        
+        if is_pure_xml:
+            # For pure XML files, just write the XML directly
+            xml_buffer = BytesIO()
+            tree.write(xml_buffer, encoding='utf-8', xml_declaration=True)
+            return xml_buffer.getvalue()
+        
+        # For binary-wrapped XML files, preserve the wrapper
+        try:
+            xml_start, xml_end = PS3XMLHandler.find_xml_boundaries(original_data)
+        except ValueError as e:
+            logger.error(f"Cannot find XML boundaries: {e}")
+            raise
+        
+        # Validate boundaries
+        if xml_start >= xml_end:
+            raise ValueError(f"Invalid XML boundaries: start={xml_start}, end={xml_end}")
+        
+        if xml_start < 0 or xml_end > len(original_data):
+            raise ValueError(f"XML boundaries out of range: start={xml_start}, end={xml_end}, file_size={len(original_data)}")
+        
+        # Generate new XML content
+        xml_buffer = BytesIO()
+        tree.write(xml_buffer, encoding='utf-8', xml_declaration=False)
+        new_xml = xml_buffer.getvalue()
+        
+        logger.debug(f"Generated new XML content: {len(new_xml)} bytes")
+        
+        # Validate the new XML by parsing it
+        try:
+            test_root = ET.fromstring(new_xml.decode('utf-8'))
+            logger.debug("New XML validates successfully")
+        except Exception as e:
+            logger.error(f"Generated XML is invalid: {e}")
+            raise ValueError(f"Generated invalid XML: {e}")
+        
+        # Preserve header and footer EXACTLY
+        header = original_data[:xml_start]
+        footer = original_data[xml_end:] if xml_end < len(original_data) else b''
+        
+        logger.debug("Header size: %d bytes", len(header))
+        logger.debug("Footer size: %d bytes", len(footer))
+        logger.debug("Original XML size: %d bytes", xml_end - xml_start)
+        logger.debug("New XML size: %d bytes", len(new_xml))
+        
+        # Create output data
+        output_data = header + new_xml + footer
+        new_size = len(output_data)
+        
+        logger.debug("Final output size: %d bytes (change: %+d)", new_size, new_size - original_size)
+        
+        # Debug output structure
+        PS3XMLHandler.debug_file_structure(output_data, "Output File Before Write")
+        
+        # Verify the output has valid XML
+        try:
+            test_start, test_end = PS3XMLHandler.find_xml_boundaries(output_data)
+            test_xml = output_data[test_start:test_end]
+            clean_test_xml = PS3XMLHandler.clean_xml_content(test_xml)
+            test_root = ET.fromstring(clean_test_xml)
+            logger.debug("Output file XML validates successfully")
+        except Exception as e:
+            logger.error(f"Output file would have invalid XML: {e}")
+            raise ValueError(f"Output file validation failed: {e}")
+        
+        return output_data
+    
+    @staticmethod
+    def write_output(file_path: Path, output_data: bytes) -> None:
+        """Write file contents produced by build_output and verify them on disk"""
+        with open(file_path, 'wb') as f:
+            f.write(output_data)
+        
+        # Verify the written file
+        with open(file_path, 'rb') as f:
+            written_data = f.read()
+        
+        if len(written_data) != len(output_data):
+            raise ValueError(f"File write failed: expected {len(output_data)} bytes, got {len(written_data)} bytes")
+        
+        if written_data != output_data:
+            raise ValueError("File write failed: written data doesn't match expected data")
+    
     @staticmethod
     def _save_single_file(tree: ET.ElementTree, file_path: Path, create_backup: bool = True) -> None:
         """
@@ -406,19 +524,10 @@ class PS3XMLHandler:
         logger.debug(f"Saving PS3 XML tree to file: {file_path}")
         
         try:
-            # Clean up duplicate attributes before saving
-            PS3XMLHandler.clean_duplicate_attributes(tree)
-            
             # Read original file
             with open(file_path, 'rb') as f:
                 original_data = f.read()
             
-            original_size = len(original_data)
-            logger.debug(f"Original file size: {original_size} bytes")
-            
-            # Debug original file
-            PS3XMLHandler.debug_file_structure(original_data, "Original File Before Save")
-            
             # Create backup if needed
             if create_backup:
                 backup_path = file_path.with_suffix(file_path.suffix + ".backup")
@@ -429,95 +538,10 @@ class PS3XMLHandler:
                 else:
                     logger.debug(f"Backup already exists at {backup_path}")
             
-            # Check if this is a pure XML file or contains binary wrapper
-            try:
-                # Try to parse the original file directly
-                ET.parse(file_path)
-                is_pure_xml = True
-                logger.debug("File is pure XML")
-            except ET.ParseError:
-                is_pure_xml = False
-                logger.debug("File contains binary wrapper around XML")
-            
-            if is_pure_xml:
-                # For pure XML files, just write the XML directly
-                tree.write(file_path, encoding='utf-8', xml_declaration=True)
-                logger.debug("Pure XML file saved successfully")
-                return
-            
-            # For binary-wrapped XML files, preserve the wrapper
-            try:
-                xml_start, xml_end = PS3XMLHandler.find_xml_boundaries(original_data)
-            except ValueError as e:
-                logger.error(f"Cannot find XML boundaries: {e}")
-                raise
-            
-            # Validate boundaries
-            if xml_start >= xml_end:
-                raise ValueError(f"Invalid XML boundaries: start={xml_start}, end={xml_end}")
-            
-            if xml_start < 0 or xml_end > len(original_data):
-                raise ValueError(f"XML boundaries out of range: start={xml_start}, end={xml_end}, file_size={len(original_data)}")
-            
-            # Generate new XML content
-            xml_buffer = BytesIO()
-            tree.write(xml_buffer, encoding='utf-8', xml_declaration=False)
-            new_xml = xml_buffer.getvalue()
-            
-            logger.debug(f"Generated new XML content: {len(new_xml)} bytes")
-            
-            # Validate the new XML by parsing it
-            try:
-                test_root = ET.fromstring(new_xml.decode('utf-8'))
-                logger.debug("New XML validates successfully")
-            except Exception as e:
-                logger.error(f"Generated XML is invalid: {e}")
-                raise ValueError(f"Generated invalid XML: {e}")
-            
-            # Preserve header and footer EXACTLY
-            header = original_data[:xml_start]
-            footer = original_data[xml_end:] if xml_end < len(original_data) else b''
-            
-            logger.debug(f"Header size: {len(header)} bytes")
-            logger.debug(f"Footer size: {len(footer)} bytes")
-            logger.debug(f"Original XML size: {xml_end - xml_start} bytes")
-            logger.debug(f"New XML size: {len(new_xml)} bytes")
-            
-            # Create output data
-            output_data = header + new_xml + footer
-            new_size = len(output_data)
-            
-            logger.debug(f"Final output size: {new_size} bytes (change: {new_size - original_size:+d})")
-            
-            # Debug output structure
-            PS3XMLHandler.debug_file_structure(output_data, "Output File Before Write")
-            
-            # Verify the output has valid XML
-            try:
-                test_start, test_end = PS3XMLHandler.find_xml_boundaries(output_data)
-                test_xml = output_data[test_start:test_end]
-                clean_test_xml = PS3XMLHandler.clean_xml_content(test_xml)
-                test_root = ET.fromstring(clean_test_xml)
-                logger.debug("Output file XML validates successfully")
-            except Exception as e:
-                logger.error(f"Output file would have invalid XML: {e}")
-                raise ValueError(f"Output file validation failed: {e}")
-            
-            # Write the file
-            with open(file_path, 'wb') as f:
-                f.write(output_data)
-            
-            # Verify the written file
-            with open(file_path, 'rb') as f:
-                written_data = f.read()
-            
-            if len(written_data) != len(output_data):
-                raise ValueError(f"File write failed: expected {len(output_data)} bytes, got {len(written_data)} bytes")
-            
-            if written_data != output_data:
-                raise ValueError("File write failed: written data doesn't match expected data")
+            output_data = PS3XMLHandler.build_output(tree, original_data)
+            PS3XMLHandler.write_output(file_path, output_data)
             
-            logger.debug(f"PS3 save file written successfully. Size: {original_size} -> {new_size} bytes")
+            logger.debug(f"PS3 save file written successfully. Size: {len(original_data)} -> {len(output_data)} bytes")
             
         except Exception as e:
             logger.error(f"Error saving PS3 XML tree to {file_path}: {str(e)}", exc_info=True)
@@ -0,0 +1,274 @@
+import json
+import os
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import logging
+
+from edit_journal import SET, TEXT, INSERT, CHILDREN
+
+
+class RecoveryJournal:
+    """
+    Append-only journal of the edits made since the save was last loaded or
+    written, kept next to the save so they survive a crash.
+
+    The first line holds the sha256 digests of the save files the edits apply
+    to; every following line is one operation in the order it was applied:
+        ["m", manager_key, section, label]     the operations below belong to this edit
+        ["s", path, name, value]               set an attribute (null value: delete it)
+        ["t", path, text]                      set an element's text
+        ["i", parent_path, index, [xml, tail]] insert a new element
+        ["r", parent_path, index]              remove a child
+        ["c", parent_path, [index | [xml, tail], ...]]  replace the children; indexes
+                                               refer to the children before the change
+    Paths are child index lists from the root. Lines are buffered and written
+    with one fsync per flush, every interval_ms or after max_buffered lines.
+    """
+
+    VERSION = 1
+    SUFFIX = ".recovery"
+    FOLDER_NAME = "AvatarSaveEditor.recovery"  # PS3 saves are opened as folders
+
+    def __init__(self, widget, interval_ms: int = 1000, max_buffered: int = 256):
+        self.logger = logging.getLogger('RecoveryJournal')
+        self.widget = widget
+        self.interval_ms = interval_ms
+        self.max_buffered = max_buffered
+        self.path: Optional[Path] = None
+        self.root: Optional[ET.Element] = None
+        self._file = None
+        self._buffer: List[str] = []
+        self._after_id = None
+        self._transaction = None
+        self._parents: Dict[int, ET.Element] = {}
+        self._session = 0  # Bumped by start(), so marks of an earlier journal are recognised
+        self._written = 0  # Lines in the file, header included
+
+    @property
+    def enabled(self) -> bool:
+        return self.interval_ms > 0
+
+    @classmethod
+    def path_for(cls, file_path: Path) -> Path:
+        file_path = Path(file_path)
+        if file_path.is_dir():
+            return file_path / cls.FOLDER_NAME
+        return file_path.with_name(file_path.name + cls.SUFFIX)
+
+    # ----------------------------------------------------------------- lifecycle
+
+    def pending(self, file_path: Path, digests: Dict[Path, str]) -> List[list]:
+        """Operations left by a previous session for exactly these save contents"""
+        path = self.path_for(file_path)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                header = json.loads(f.readline())
+                if header.get('version') != self.VERSION or header.get('base') != self._base(digests):
+                    return []
+                records = []
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        break  # Torn last line from the crash
+                return records
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError) as e:
+            self.logger.warning("Ignoring unreadable recovery journal %s: %s", path, e)
+            return []
+
+    @staticmethod
+    def _base(digests: Dict[Path, str]) -> Dict[str, str]:
+        return {Path(path).name: digest for path, digest in sorted(digests.items())}
+
+    def mark(self) -> Optional[Tuple[int, int]]:
+        """Position of the next record, for start(since=...) once a snapshot of the tree taken now is saved"""
+        if self._file is None:
+            return None
+        self.flush()
+        self._transaction = None  # The next record starts with its transaction line again
+        return self._session, self._written
+
+    def start(self, file_path: Path, digests: Dict[Path, str], root: ET.Element, keep: bool = False,
+              since: Optional[Tuple[int, int]] = None) -> None:
+        """
+        Journal the edits to root, a tree of the save with these digests. With keep,
+        the existing journal (already replayed onto root) is continued instead. With
+        since, a mark() of the current journal, the records made after the mark are
+        carried over: they are the edits the saved snapshot does not contain.
+        """
+        carried = []
+        if since is not None and since[0] == self._session and self._file is not None:
+            self.flush()
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    carried = [line.rstrip("\n") for line in f][since[1]:]
+            except OSError as e:
+                self.logger.warning("Could not carry over recovery records from %s: %s", self.path, e)
+        self.close()
+        self._session += 1
+        if not self.enabled:
+            return
+        self.path = self.path_for(file_path)
+        self.root = root
+        self._parents = {}
+        self._transaction = None
+        try:
+            if keep and self.path.exists():
+                self._file = open(self.path, 'a', encoding='utf-8')
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._written = sum(1 for _ in f)
+            else:
+                self._file = open(self.path, 'w', encoding='utf-8')
+                self._written = 0
+                self._buffer.append(json.dumps({
+                    'version': self.VERSION, 'base': self._base(digests),
+                    'created': datetime.now().isoformat(timespec='seconds')}))
+                self._buffer.extend(carried)
+                if carried:
+                    self.flush()
+        except OSError as e:
+            self.logger.warning("Recovery journal disabled, could not open %s: %s", self.path, e)
+            self._file = None
+
+    def flush(self) -> None:
+        """Write the buffered lines and fsync them"""
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+        if not self._buffer or self._file is None:
+            self._buffer.clear()
+            return
+        try:
+            self._file.write("\n".join(self._buffer) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._written += len(self._buffer)
+        except OSError as e:
+            self.logger.error("Could not write recovery journal %s: %s", self.path, e)
+        self._buffer.clear()
+
+    def close(self) -> None:
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.root = None
+
+    def discard(self) -> None:
+        """Close and delete the journal, e.g. when the edits were saved or deliberately dropped"""
+        path = self.path
+        self._buffer.clear()
+        self.close()
+        if path is not None:
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as e:
+                self.logger.warning("Could not delete recovery journal %s: %s", path, e)
+        self.path = None
+
+    # ----------------------------------------------------------------- recording
+
+    def _walk_up(self, element: ET.Element) -> List[int]:
+        path = []
+        while element is not self.root:
+            parent = self._parents[id(element)]
+            path.append(next(i for i, child in enumerate(parent) if child is element))
+            element = parent
+        return path[::-1]
+
+    def _path_of(self, element: ET.Element) -> List[int]:
+        try:
+            return self._walk_up(element)
+        except (KeyError, StopIteration):
+            # New or moved element: rebuild the parent map
+            self._parents = {id(child): parent for parent in self.root.iter() for child in parent}
+            return self._walk_up(element)
+
+    @staticmethod
+    def _element_record(element: ET.Element) -> list:
+        tail, element.tail = element.tail, None
+        try:
+            return [ET.tostring(element, encoding='unicode'), tail]
+        finally:
+            element.tail = tail
+
+    def record(self, transaction, op: tuple, forward: bool) -> None:
+        """EditJournal listener: journal one applied operation"""
+        if self._file is None:
+            return
+        if transaction is not self._transaction:
+            self._transaction = transaction
+            self._buffer.append(json.dumps(["m", transaction.manager_key, transaction.section, transaction.label]))
+
+        code = op[0]
+        if code == SET:
+            _, element, name, old, new = op
+            line = ["s", self._path_of(element), name, new if forward else old]
+        elif code == TEXT:
+            _, element, old, new = op
+            line = ["t", self._path_of(element), new if forward else old]
+        elif code == CHILDREN:
+            _, parent, old, new = op
+            before, after = (old, new) if forward else (new, old)
+            positions = {id(child): index for index, child in enumerate(before)}
+            children = [positions[id(child)] if id(child) in positions else self._element_record(child)
+                        for child in after]
+            line = ["c", self._path_of(parent), children]
+            self._parents = {}
+        else:
+            _, parent, index, child = op
+            if (code == INSERT) == forward:
+                line = ["i", self._path_of(parent), index, self._element_record(child)]
+            else:
+                line = ["r", self._path_of(parent), index]
+            self._parents = {}
+        self._buffer.append(json.dumps(line))
+
+        if len(self._buffer) >= self.max_buffered:
+            self.flush()
+        elif self._after_id is None:
+            self._after_id = self.widget.after(self.interval_ms, self.flush)
+
+    # ------------------------------------------------------------------- replay
+
+    @staticmethod
+    def replay(root: ET.Element, records: List[list]) -> List[Tuple[str, str]]:
+        """Apply journaled operations to a freshly loaded tree; returns the (manager_key, section) edited"""
+        def resolve(path):
+            element = root
+            for index in path:
+                element = element[index]
+            return element
+
+        def build(record):
+            xml, tail = record
+            element = ET.fromstring(xml)
+            element.tail = tail
+            return element
+
+        edited = []
+        for record in records:
+            code = record[0]
+            if code == "m":
+                edited.append((record[1], record[2]))
+            elif code == "s":
+                element = resolve(record[1])
+                if record[3] is None:
+                    element.attrib.pop(record[2], None)
+                else:
+                    element.set(record[2], record[3])
+            elif code == "t":
+                resolve(record[1]).text = record[2]
+            elif code == "i":
+                resolve(record[1]).insert(record[2], build(record[3]))
+            elif code == "r":
+                del resolve(record[1])[record[2]]
+            elif code == "c":
+                parent = resolve(record[1])
+                before = list(parent)
+                parent[:] = [before[item] if isinstance(item, int) else build(item) for item in record[2]]
+        return edited
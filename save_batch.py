@@ -0,0 +1,149 @@
+import os
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import logging
+
+from backup_store import BackupStore
+from pc_xml_handler import PCXMLHandler
+from ps3_xml_handler import PS3XMLHandler
+from save_library import detect_platform
+from save_probe import character_folder_name, probe_save
+from xml_handler import XMLHandler, SaveRegionMap
+
+
+HANDLERS = {'xbox': XMLHandler, 'pc': PCXMLHandler, 'ps3': PS3XMLHandler}
+
+
+def get_logger():
+    return logging.getLogger('SaveBatch')
+
+
+class SaveDocument:
+    """
+    A save opened without the GUI: its platform, the files writing it replaces
+    (SAVEDATA.000 and PADDING.000 for PS3) and the parsed tree. The platform is
+    detected from the file the way the save library does it.
+    """
+
+    def __init__(self, path: Path, platform: Optional[str] = None):
+        self.path = Path(path)
+        files = PS3XMLHandler.get_all_save_files(self.path) if self.path.is_dir() else [self.path]
+        if not files:
+            raise ValueError(f"No save files found in {self.path}")
+        self.originals: Dict[Path, bytes] = {}
+        for file_path in files:
+            with open(file_path, 'rb') as f:
+                self.originals[file_path] = f.read()
+        self.primary = files[0]
+        self.platform = platform or detect_platform(self.primary.name, self.originals[self.primary])
+        self.handler = HANDLERS[self.platform]
+        self.tree: ET.ElementTree = self.handler.load_xml_tree(self.primary)[0]
+
+    @property
+    def root(self) -> ET.Element:
+        return self.tree.getroot()
+
+    def build_outputs(self) -> Dict[Path, bytes]:
+        """
+        New contents of the files whose bytes change. An Xbox save whose header
+        checksum was valid gets it recomputed, as XMLHandler.patch_output does.
+        """
+        outputs = {}
+        for file_path, original_data in self.originals.items():
+            if self.platform == 'xbox':
+                region_map = SaveRegionMap.scan(original_data)
+                output_data = self.handler.build_output(self.tree, original_data, region_map)
+                if region_map.checksum_valid:
+                    output_data = self.handler.update_checksum(output_data)
+            else:
+                output_data = self.handler.build_output(self.tree, original_data)
+            if output_data != original_data:
+                outputs[file_path] = output_data
+        return outputs
+
+    def character_name(self) -> str:
+        """Backup store folder of the save: the character name as stored on disk, else the save's name"""
+        try:
+            name = probe_save(self.primary).character_name
+        except (OSError, ValueError):
+            name = ""
+        return character_folder_name(name) if name else self.path.stem
+
+    def back_up(self, backup_store: BackupStore, max_backups: int = 0) -> None:
+        """Store the files as loaded in the backup store, as the editor does before it writes"""
+        character = self.character_name()
+        entry = backup_store.add(character, {path.name: data for path, data in self.originals.items()})
+        get_logger().debug("Backup %s created for %s", entry['id'], character)
+        if max_backups > 0:
+            backup_store.prune(character, max_backups)
+
+    def write(self, backup_store: Optional[BackupStore] = None, max_backups: int = 0) -> List[Path]:
+        """
+        Write the tree back through the platform handler; returns the files that
+        changed. Each file is written to a temporary file next to it and swapped
+        in with os.replace, so a failed or interrupted write leaves the old file
+        whole; PS3 pairs are swapped only once both files are written. With a
+        backup store, the files as loaded are backed up into it first (keeping
+        the newest max_backups entries of the character, if given).
+        """
+        outputs = self.build_outputs()
+        if outputs and backup_store is not None:
+            self.back_up(backup_store, max_backups)
+        temp_paths = {}
+        try:
+            for file_path, output_data in outputs.items():
+                temp_path = temp_paths[file_path] = file_path.with_name(file_path.name + ".tmp")
+                self.handler.write_output(temp_path, output_data)
+                with open(temp_path, 'rb+') as f:
+                    os.fsync(f.fileno())
+            for file_path, temp_path in temp_paths.items():
+                os.replace(temp_path, file_path)
+                self.originals[file_path] = outputs[file_path]
+        finally:
+            for temp_path in temp_paths.values():
+                if temp_path.exists():
+                    temp_path.unlink()
+        get_logger().debug("Wrote %d of %d files of %s", len(outputs), len(self.originals), self.path)
+        return list(outputs)
+
+
+def save_paths(sources: Iterable[Path]) -> List[Path]:
+    """The saves among the given files and folders: .sav files, and PS3 save folders as a whole"""
+    paths = []
+    for source in map(Path, sources):
+        if not source.is_dir() or PS3XMLHandler.is_ps3_save(source):
+            paths.append(source)
+            continue
+        for path in sorted(source.rglob("*")):
+            if path.is_file() and path.suffix.lower() == ".sav":
+                paths.append(path)
+            elif path.is_dir() and (path / "SAVEDATA.000").exists():
+                paths.append(path)
+    return paths
+
+
+def run_batch(paths: List[Path], func: Callable[[Path], object],
+              workers: Optional[int] = None) -> Iterator[Tuple[Path, object, Optional[Exception]]]:
+    """
+    Call func(path) for every save, on a process pool unless there is only one
+    save or workers is 1; yields (path, result, error) in the order of paths.
+    func must be picklable (a module-level function or a functools.partial of one).
+    """
+    if len(paths) <= 1 or workers == 1:
+        for path in paths:
+            try:
+                yield path, func(path), None
+            except Exception as e:
+                get_logger().warning("Batch failed on %s: %s", path, e)
+                yield path, None, e
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(func, path) for path in paths]
+        for path, future in zip(paths, futures):
+            try:
+                yield path, future.result(), None
+            except Exception as e:
+                get_logger().warning("Batch failed on %s: %s", path, e)
+                yield path, None, e
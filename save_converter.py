@@ -0,0 +1,108 @@
+import os
+import shutil
+from functools import partial
+from pathlib import Path
+from typing import Dict, List, Optional
+import logging
+
+from backup_store import BackupStore
+from ps3_xml_handler import PS3XMLHandler
+from save_batch import SaveDocument, run_batch
+from save_library import detect_platform
+
+
+def get_logger():
+    return logging.getLogger('SaveConverter')
+
+
+class SaveContainer:
+    """
+    A save of the target platform whose container a converted save is wrapped
+    in: the Xbox header, padding and footer, the PC header, or a PS3 save
+    folder with its PARAM.SFO. Only the XML inside the template is replaced.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        primary = PS3XMLHandler.get_primary_save_file(self.path)
+        with open(primary, 'rb') as f:
+            self.platform = detect_platform(primary.name, f.read())
+
+    def output_name(self, source: Path) -> str:
+        """Name of the converted save: the source's name, with the template's extension for files"""
+        stem = source.name if source.is_dir() else source.stem
+        return stem if self.path.is_dir() else stem + self.path.suffix
+
+    def convert(self, source: Path, output: Path, overwrite: bool = False,
+                backup_store: Optional[BackupStore] = None, max_backups: int = 0) -> Path:
+        """
+        Write source, a save of any platform, to output in this container. The
+        template is copied next to output, rewritten through the platform
+        handler and moved into place, so a failed conversion leaves nothing
+        behind. An Xbox checksum is recomputed if the template's was valid.
+        A save overwritten at output is backed up into backup_store first.
+        """
+        source, output = Path(source), Path(output)
+        if output.exists() and not overwrite:
+            raise FileExistsError(f"{output} already exists")
+        tree = SaveDocument(source).tree
+        if output.exists() and backup_store is not None:
+            SaveDocument(output).back_up(backup_store, max_backups)
+
+        staging = output.with_name(output.name + ".converting")
+        self._remove(staging)
+        try:
+            if self.path.is_dir():
+                shutil.copytree(self.path, staging)
+            else:
+                shutil.copyfile(self.path, staging)
+            document = SaveDocument(staging, self.platform)
+            document.tree = tree
+            document.write()
+            if output.is_dir():
+                shutil.rmtree(output)
+            os.replace(staging, output)
+        finally:
+            self._remove(staging)
+        get_logger().debug("Converted %s to %s (%s)", source, output, self.platform)
+        return output
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        if path.is_dir():
+            shutil.rmtree(path)
+        elif path.exists():
+            path.unlink()
+
+
+def plan_outputs(paths: List[Path], container: SaveContainer, output_folder: Path) -> Dict[Path, Path]:
+    """Output path of every save; raises ValueError when two saves would get the same name"""
+    outputs = {}
+    sources = {}
+    for path in paths:
+        output = Path(output_folder) / container.output_name(path)
+        if output in sources:
+            raise ValueError(f"{path} and {sources[output]} would both be converted to {output}")
+        if output.resolve() in (path.resolve(), container.path.resolve()):
+            raise ValueError(f"Converting {path} would overwrite {output}")
+        sources[output] = path
+        outputs[path] = output
+    return outputs
+
+
+def _convert_one(container: SaveContainer, outputs: Dict[Path, Path], overwrite: bool,
+                 backup_store: Optional[BackupStore], max_backups: int, path: Path) -> Path:
+    return container.convert(path, outputs[path], overwrite, backup_store, max_backups)
+
+
+def convert_saves(paths: List[Path], template: Path, output_folder: Path, overwrite: bool = False,
+                  workers: Optional[int] = None, backup_store: Optional[BackupStore] = None, max_backups: int = 0):
+    """
+    Convert every save to the template's platform, on a process pool for more
+    than one save; yields (path, output, error) like run_batch.
+    """
+    container = SaveContainer(template)
+    outputs = plan_outputs(paths, container, output_folder)
+    Path(output_folder).mkdir(parents=True, exist_ok=True)
+    yield from run_batch(paths, partial(_convert_one, container, outputs, overwrite, backup_store, max_backups),
+                         workers)
@@ -0,0 +1,133 @@
+import hashlib
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from save_library import xml_bounds
+
+
+# Attributes that identify an element among its repeated siblings, in order of preference
+KEY_ATTRIBUTES = ("crc_id", "crc_ID", "EntityID", "Index")
+
+CHANGE_SYMBOLS = {'attribute': "~", 'text': "~", 'added': "+", 'removed': "-"}
+
+
+@dataclass(frozen=True)
+class Change:
+    """One difference between two saves, at an XPath-style path of the new save"""
+    kind: str  # attribute, text, added or removed
+    path: str
+    name: Optional[str] = None  # Attribute name for attribute changes
+    old: Optional[str] = None  # None: attribute absent
+    new: Optional[str] = None
+    # Element of the old tree the change is at (the parent, for added elements)
+    element: Optional[ET.Element] = field(default=None, compare=False, repr=False)
+
+    def __str__(self) -> str:
+        symbol = CHANGE_SYMBOLS[self.kind]
+        if self.kind == 'attribute':
+            return f"{symbol} {self.path}/@{self.name}: {self.old!r} -> {self.new!r}"
+        if self.kind == 'text':
+            return f"{symbol} {self.path}/text(): {self.old!r} -> {self.new!r}"
+        return f"{symbol} {self.path}"
+
+
+def parse_save_xml(data: bytes) -> ET.Element:
+    """Root element of the XML inside a save file of any platform"""
+    start, end = xml_bounds(data)
+    return ET.fromstring(data[start:end])
+
+
+def _text(element: ET.Element) -> str:
+    # Pretty-printed and raw saves differ only in whitespace
+    return (element.text or "").strip()
+
+
+def subtree_hashes(root: ET.Element) -> Dict[int, bytes]:
+    """Digest of every subtree (tag, attributes, text and children), bottom-up, by id(element)"""
+    hashes = {}
+
+    def visit(element: ET.Element) -> bytes:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(element.tag.encode('utf-8'))
+        for name, value in sorted(element.attrib.items()):
+            digest.update(b'\x00' + name.encode('utf-8') + b'=' + value.encode('utf-8'))
+        digest.update(b'\x01' + _text(element).encode('utf-8'))
+        for child in element:
+            digest.update(visit(child))
+        hashes[id(element)] = result = digest.digest()
+        return result
+
+    visit(root)
+    return hashes
+
+
+def _keyed_children(parent: ET.Element) -> Dict[tuple, Tuple[str, ET.Element]]:
+    """{alignment key: (path segment, child)} in document order"""
+    totals: Dict[tuple, int] = {}
+    bases = []
+    for child in parent:
+        attribute = next((name for name in KEY_ATTRIBUTES if name in child.attrib), None)
+        base = (child.tag, attribute, child.attrib[attribute] if attribute else None)
+        bases.append((base, child))
+        totals[base] = totals.get(base, 0) + 1
+
+    children = {}
+    seen: Dict[tuple, int] = {}
+    for base, child in bases:
+        number = seen.get(base, 0)
+        seen[base] = number + 1
+        tag, attribute, value = base
+        segment = f"{tag}[@{attribute}='{value}']" if attribute else tag
+        if totals[base] > 1:
+            segment += f"[{number + 1}]"
+        children[base + (number,)] = (segment, child)
+    return children
+
+
+def diff_trees(old_root: ET.Element, new_root: ET.Element) -> List[Change]:
+    """
+    Attribute, text and element changes from old_root to new_root. Identical
+    subtrees are skipped by comparing their digests; repeated children are
+    matched by their key attribute, or by position among equal siblings.
+    """
+    old_hashes = subtree_hashes(old_root)
+    new_hashes = subtree_hashes(new_root)
+    changes: List[Change] = []
+
+    def compare(old: ET.Element, new: ET.Element, path: str) -> None:
+        if old_hashes[id(old)] == new_hashes[id(new)]:
+            return
+        for name in sorted(old.attrib.keys() | new.attrib.keys()):
+            old_value, new_value = old.attrib.get(name), new.attrib.get(name)
+            if old_value != new_value:
+                changes.append(Change('attribute', path, name, old_value, new_value, old))
+        if _text(old) != _text(new):
+            changes.append(Change('text', path, None, _text(old), _text(new), old))
+
+        old_children = _keyed_children(old)
+        for key, (segment, new_child) in _keyed_children(new).items():
+            matched = old_children.pop(key, None)
+            if matched is None:
+                changes.append(Change('added', f"{path}/{segment}", element=old))
+            else:
+                compare(matched[1], new_child, f"{path}/{segment}")
+        for segment, old_child in old_children.values():
+            changes.append(Change('removed', f"{path}/{segment}", element=old_child))
+
+    if old_root.tag != new_root.tag:
+        return [Change('removed', f"/{old_root.tag}", element=old_root), Change('added', f"/{new_root.tag}")]
+    compare(old_root, new_root, f"/{old_root.tag}")
+    return changes
+
+
+def diff_saves(old_data: bytes, new_data: bytes) -> List[Change]:
+    """Changes between the contents of two save files (any platform)"""
+    return diff_trees(parse_save_xml(old_data), parse_save_xml(new_data))
+
+
+def count_changes(changes: List[Change]) -> Dict[str, int]:
+    counts = {kind: 0 for kind in CHANGE_SYMBOLS}
+    for change in changes:
+        counts[change.kind] += 1
+    return counts
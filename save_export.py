@@ -0,0 +1,284 @@
+import csv
+import json
+import sqlite3
+import sys
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import logging
+
+from game_data import ACHIEVEMENTS, ITEM_NAMES, MISSION_NAMES, PIN_LOCATION_NAMES, SKILLS
+from ps3_xml_handler import PS3XMLHandler
+from save_library import END_MARKERS
+from save_probe import FACTION_NAMES, START_MARKERS
+
+
+def get_logger():
+    return logging.getLogger('SaveExport')
+
+
+class SaveXMLReader:
+    """
+    File-like view of the XML document inside a save file, for ET.iterparse:
+    the binary header is skipped and reading ends at the document's end tag
+    (Xbox saves continue with NUL padding and a footer). The file is read in
+    chunks, so only the parser's current element path stays in memory.
+    """
+
+    OVERLAP = max(len(marker) for marker in START_MARKERS + END_MARKERS) - 1
+
+    def __init__(self, f, chunk_size: int = 64 * 1024):
+        self._chunks = self._xml_chunks(f, chunk_size)
+        self._buffer = b''
+
+    @classmethod
+    def _xml_chunks(cls, f, chunk_size: int) -> Iterator[bytes]:
+        buffer = b''
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                raise ValueError("No XML found in save file")
+            buffer += chunk
+            positions = [pos for pos in (buffer.find(marker) for marker in START_MARKERS) if pos != -1]
+            if positions:
+                buffer = buffer[min(positions):]
+                break
+            buffer = buffer[-cls.OVERLAP:]
+
+        while True:
+            for marker in END_MARKERS:
+                end = buffer.find(marker)
+                if end != -1:
+                    yield buffer[:end + len(marker)]
+                    return
+            if len(buffer) > cls.OVERLAP:
+                yield buffer[:-cls.OVERLAP]
+                buffer = buffer[-cls.OVERLAP:]
+            chunk = f.read(chunk_size)
+            if not chunk:
+                raise ValueError("No end of XML found in save file")
+            buffer += chunk
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+# ----------------------------------------------------------------------- records
+# Each takes the finished element and the tags of its ancestors
+
+def _territory(element: ET.Element, ancestors: List[str]) -> Dict:
+    free_units = element.find("FreeUnits")
+    units = free_units.attrib if free_units is not None else {}
+    faction = element.get("Faction", "0")
+    return {
+        'id': element.get("crc_ID"), 'faction': FACTION_NAMES.get(faction, faction),
+        'base_units': element.get("BaseUnits"), 'troops': units.get("Troops"), 'ground': units.get("Ground"),
+        'air': units.get("Air"), 'home_base': element.get("HomeBase"), 'factory': element.get("SecondaryBase"),
+        'defense_flags': element.get("DefenseFlags"), 'active': element.get("Active"),
+    }
+
+
+def _achievement(element: ET.Element, ancestors: List[str]) -> Dict:
+    info = ACHIEVEMENTS.get(element.get("crc_id", ""), {})
+    count = int(element.get("count") or 0)
+    return {
+        'id': element.get("crc_id"), 'name': info.get('name'), 'category': info.get('category'),
+        'count': count, 'max': info.get('max'), 'completed': 'max' in info and count >= info['max'],
+    }
+
+
+def _pin(element: ET.Element, ancestors: List[str]) -> Dict:
+    return {
+        'id': element.get("crc_id"), 'name': PIN_LOCATION_NAMES.get(element.get("crc_id", "")),
+        'unlocked': element.get("eUnlocked") == "1", 'fow': element.get("fFoWcurrent"),
+    }
+
+
+def _possession(element: ET.Element, ancestors: List[str]) -> Dict:
+    owner = next((tag for tag in reversed(ancestors) if tag.startswith("Possessions_")), "")
+    return {
+        'owner': owner[len("Possessions_"):], 'index': element.get("Index"), 'id': element.get("crc_ItemID"),
+        'name': ITEM_NAMES.get(element.get("crc_ItemID", "")), 'stack': element.get("NbInStack"),
+        'clip': element.get("NbInClip"), 'ammo_type': element.get("crc_AmmoType"),
+    }
+
+
+MISSION_STATUS = {"Mission_NotStarted": "Not Started", "Mission_InProgress": "In Progress",
+                  "Mission_Completed": "Completed"}
+
+
+def _mission(element: ET.Element, ancestors: List[str]) -> Dict:
+    return {
+        'id': element.get("crc_id"), 'name': MISSION_NAMES.get(element.get("crc_id", "")),
+        'status': MISSION_STATUS[element.tag], 'step': element.get("iCurrentStepIndex"),
+        'objectives': len(element.findall("Objective")),
+    }
+
+
+SKILL_STATUS = {"0": "Unlocked", "1": "Locked", "2": "Special"}
+
+
+def _skill(element: ET.Element, ancestors: List[str]) -> Dict:
+    info = SKILLS.get(element.get("crc_id", ""), {})
+    locked = element.get("eLocked", "0")
+    return {
+        'id': element.get("crc_id"), 'name': info.get('name'), 'category': info.get('category'),
+        'status': SKILL_STATUS.get(locked, locked),
+    }
+
+
+@dataclass(frozen=True)
+class ExportSection:
+    tags: Tuple[str, ...]  # Elements that each give one record
+    columns: Tuple[str, ...]
+    record: Callable[[ET.Element, List[str]], Dict]
+
+
+EXPORT_SECTIONS = {
+    'territories': ExportSection(
+        ("Territory",),
+        ("id", "faction", "base_units", "troops", "ground", "air", "home_base", "factory", "defense_flags", "active"),
+        _territory),
+    'achievements': ExportSection(("AchievementCounter",), ("id", "name", "category", "count", "max", "completed"),
+                                  _achievement),
+    'pins': ExportSection(("Pin",), ("id", "name", "unlocked", "fow"), _pin),
+    'possessions': ExportSection(("Poss",), ("owner", "index", "id", "name", "stack", "clip", "ammo_type"),
+                                 _possession),
+    'missions': ExportSection(tuple(MISSION_STATUS), ("id", "name", "status", "step", "objectives"), _mission),
+    'skills': ExportSection(("Skill",), ("id", "name", "category", "status"), _skill),
+}
+
+
+def iter_records(path: Path, sections: Iterable[str] = EXPORT_SECTIONS) -> Iterator[Tuple[str, Dict]]:
+    """
+    (section, record) for every exported element of one save file or PS3 save
+    folder, in document order. Elements are cleared once recorded, and every
+    top-level element once parsed, so memory stays flat whatever the save size.
+    """
+    path = Path(path)
+    file_path = PS3XMLHandler.get_primary_save_file(path) if path.is_dir() else path
+    by_tag = {tag: name for name in sections for tag in EXPORT_SECTIONS[name].tags}
+    ancestors: List[str] = []
+    with open(file_path, 'rb') as f:
+        for event, element in ET.iterparse(SaveXMLReader(f), events=("start", "end")):
+            if event == "start":
+                ancestors.append(element.tag)
+                continue
+            ancestors.pop()
+            name = by_tag.get(element.tag)
+            if name is not None:
+                yield name, EXPORT_SECTIONS[name].record(element, ancestors)
+                element.clear()
+            elif len(ancestors) == 1:
+                element.clear()
+
+
+# ----------------------------------------------------------------------- writers
+# Every record is written with the save it came from in a leading "save" column
+
+class JsonLinesWriter:
+    """One JSON object per line, with the section name, to a file or stdout"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self._file = open(path, 'w', encoding='utf-8') if path else sys.stdout
+
+    def write(self, save: str, section: str, record: Dict) -> None:
+        self._file.write(json.dumps({'save': save, 'section': section, **record}, ensure_ascii=False) + "\n")
+
+    def close(self) -> None:
+        if self._file is not sys.stdout:
+            self._file.close()
+
+
+class CsvWriter:
+    """One <section>.csv per exported section in a folder"""
+
+    def __init__(self, folder: Path):
+        self.folder = Path(folder)
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self._files = {}
+        self._writers = {}
+
+    def write(self, save: str, section: str, record: Dict) -> None:
+        writer = self._writers.get(section)
+        if writer is None:
+            self._files[section] = open(self.folder / f"{section}.csv", 'w', encoding='utf-8', newline='')
+            writer = self._writers[section] = csv.writer(self._files[section])
+            writer.writerow(("save",) + EXPORT_SECTIONS[section].columns)
+        writer.writerow([save] + [record.get(column) for column in EXPORT_SECTIONS[section].columns])
+
+    def close(self) -> None:
+        for f in self._files.values():
+            f.close()
+
+
+class SqliteWriter:
+    """One table per section, filled with batched executemany inserts, one transaction per batch"""
+
+    def __init__(self, db_path: Path, batch_size: int = 1000):
+        self.connection = sqlite3.connect(str(db_path))
+        self.batch_size = batch_size
+        self._pending: Dict[str, List[tuple]] = {}
+        for section, export in EXPORT_SECTIONS.items():
+            columns = ", ".join(f'"{column}"' for column in ("save",) + export.columns)
+            self.connection.execute(f"CREATE TABLE IF NOT EXISTS {section} ({columns})")
+            self.connection.execute(f"CREATE INDEX IF NOT EXISTS {section}_save ON {section} (save)")
+        self.connection.commit()
+
+    def write(self, save: str, section: str, record: Dict) -> None:
+        rows = self._pending.setdefault(section, [])
+        rows.append((save,) + tuple(record.get(column) for column in EXPORT_SECTIONS[section].columns))
+        if len(rows) >= self.batch_size:
+            self._flush(section)
+
+    def _flush(self, section: str) -> None:
+        rows = self._pending.pop(section, [])
+        if not rows:
+            return
+        placeholders = ", ".join("?" * (len(EXPORT_SECTIONS[section].columns) + 1))
+        with self.connection:
+            self.connection.executemany(f"INSERT INTO {section} VALUES ({placeholders})", rows)
+
+    def replace_save(self, save: str) -> None:
+        """Drop the rows of an earlier export of the same save"""
+        for section in list(self._pending):
+            self._flush(section)
+        with self.connection:
+            for section in EXPORT_SECTIONS:
+                self.connection.execute(f"DELETE FROM {section} WHERE save = ?", (save,))
+
+    def close(self) -> None:
+        for section in list(self._pending):
+            self._flush(section)
+        self.connection.close()
+
+
+WRITERS = {'jsonl': JsonLinesWriter, 'csv': CsvWriter, 'sqlite': SqliteWriter}
+
+
+def export_saves(paths: Iterable[Path], writer, sections: Iterable[str] = EXPORT_SECTIONS) -> Dict[str, int]:
+    """Stream the records of every save to writer, one save at a time; returns record counts per section"""
+    sections = list(sections)
+    counts = {section: 0 for section in sections}
+    for path in paths:
+        save = str(path)
+        if hasattr(writer, 'replace_save'):
+            writer.replace_save(save)
+        try:
+            for section, record in iter_records(path, sections):
+                writer.write(save, section, record)
+                counts[section] += 1
+        except (OSError, ValueError, ET.ParseError) as e:
+            get_logger().error("Could not export %s: %s", path, e)
+            counts.setdefault('failed', 0)
+            counts['failed'] += 1
+    return counts
@@ -0,0 +1,352 @@
+import hashlib
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from xml.parsers import expat
+import logging
+
+from save_probe import FACTION_NAMES, START_MARKERS, name_vec_to_string
+
+
+SAVE_FILE_NAMES = ("SAVEDATA.000",)
+SAVE_SUFFIXES = (".sav",)
+XBOX_FILE_SIZES = (454656, 448000)
+END_MARKERS = [b'</Savegame>', b'</SaveGame>', b'</savegame>', b'</SaveData>']
+
+
+def get_logger():
+    return logging.getLogger('SaveLibrary')
+
+
+def is_save_file(path: Path) -> bool:
+    return path.name in SAVE_FILE_NAMES or path.suffix.lower() in SAVE_SUFFIXES
+
+
+def detect_platform(name: str, data: bytes) -> str:
+    """xbox, pc or ps3, from the file name and where the XML starts"""
+    if name in SAVE_FILE_NAMES:
+        return "ps3"
+    if len(data) in XBOX_FILE_SIZES and not data.lstrip()[:1] == b'<':
+        return "xbox"
+    return "pc"
+
+
+def xml_bounds(data: bytes) -> Tuple[int, int]:
+    """Start and end offsets of the save's XML document inside the file"""
+    positions = [pos for pos in (data.find(marker) for marker in START_MARKERS) if pos != -1]
+    if not positions:
+        raise ValueError("No XML found in save file")
+    start = min(positions)
+    for marker in END_MARKERS:
+        end = data.find(marker, start)
+        if end != -1:
+            return start, end + len(marker)
+    raise ValueError("No end of XML found in save file")
+
+
+def summarize_save(data: bytes) -> Dict[str, object]:
+    """
+    Profile values and completion counts of a save, in one streaming pass over its XML.
+    Keys match the columns of the library's saves table.
+    """
+    summary = {
+        'character_name': "", 'level': None, 'faction': "Undecided", 'total_ep': None, 'eps': None,
+        'played_time': None, 'territories': 0, 'territories_owned': 0,
+        'achievements_total': 0, 'achievements_started': 0, 'pins_total': 0, 'pins_unlocked': 0,
+        'pedia_total': 0, 'pedia_known': 0,
+    }
+    start, end = xml_bounds(data)
+
+    stack = []
+    territory_factions = []
+    player_faction = "0"
+
+    def to_int(value):
+        try:
+            return int(float(value)) if value is not None else None
+        except ValueError:
+            return None
+
+    def start_element(tag, attrib):
+        nonlocal player_faction
+        stack.append(tag)
+        parent = stack[-2] if len(stack) > 1 else None
+        if tag == "BaseInfo" and parent == "PlayerProfile":
+            summary['character_name'] = name_vec_to_string(attrib.get("namevec", ""))
+            summary['total_ep'] = to_int(attrib.get("TotalEP"))
+        elif tag == "XpInfo" and parent == "PlayerProfile":
+            summary['level'] = to_int(attrib.get("Level"))
+        elif tag == "TimeInfo" and parent == "PlayerProfile":
+            summary['played_time'] = to_int(attrib.get("PlayedTime"))
+        elif tag == "Metagame":
+            player_faction = attrib.get("PlayerFaction", "0")
+            summary['faction'] = FACTION_NAMES.get(player_faction, "Undecided")
+        elif tag == "Player0" and parent == "Metagame":
+            summary['eps'] = to_int(attrib.get("EPs"))
+        elif tag == "Territory" and parent == "Metagame":
+            territory_factions.append(attrib.get("Faction", "0"))
+        elif tag == "AchievementCounter":
+            summary['achievements_total'] += 1
+            summary['achievements_started'] += (to_int(attrib.get("count")) or 0) > 0
+        elif tag == "Pin" and parent == "AvatarPinDB_Status":
+            summary['pins_total'] += 1
+            summary['pins_unlocked'] += attrib.get("eUnlocked", "0") != "0"
+        elif tag == "Article" and parent == "AvatarPandorapediaDB_Status":
+            summary['pedia_total'] += 1
+            summary['pedia_known'] += attrib.get("eKnown", "0") != "0"
+
+    def end_element(tag):
+        stack.pop()
+
+    parser = expat.ParserCreate()
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.Parse(data[start:end], True)
+
+    summary['territories'] = len(territory_factions)
+    if player_faction != "0":
+        summary['territories_owned'] = territory_factions.count(player_faction)
+    return summary
+
+
+def index_file(path: str) -> Dict[str, object]:
+    """Worker-pool entry point: stat, hash and summarize one save file"""
+    stat = os.stat(path)
+    with open(path, 'rb') as f:
+        data = f.read()
+    record = {
+        'path': path, 'platform': detect_platform(os.path.basename(path), data),
+        'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'digest': hashlib.sha256(data).hexdigest(),
+        'error': None,
+    }
+    try:
+        record.update(summarize_save(data))
+    except (ValueError, expat.ExpatError) as e:
+        record['error'] = str(e)
+    return record
+
+
+class SaveLibrary:
+    """
+    SQLite index of saves across folders, platforms and the backup store.
+
+    Each file is stored with its stat signature (size, mtime_ns) and digest, so
+    a rescan only re-reads files whose signature changed; changed files are
+    summarized on a process pool. Backup store entries are indexed under
+    backup://<store root>/<character>/<entry id>/<file name>, keyed by blob digest.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS saves (
+            path TEXT PRIMARY KEY,
+            root TEXT NOT NULL,
+            platform TEXT NOT NULL,
+            size INTEGER,
+            mtime_ns INTEGER,
+            digest TEXT,
+            is_backup INTEGER NOT NULL DEFAULT 0,
+            character_name TEXT,
+            level INTEGER,
+            faction TEXT,
+            total_ep INTEGER,
+            eps INTEGER,
+            played_time INTEGER,
+            territories INTEGER,
+            territories_owned INTEGER,
+            achievements_total INTEGER,
+            achievements_started INTEGER,
+            pins_total INTEGER,
+            pins_unlocked INTEGER,
+            pedia_total INTEGER,
+            pedia_known INTEGER,
+            error TEXT,
+            indexed_at REAL
+        );
+        CREATE INDEX IF NOT EXISTS saves_character ON saves (character_name);
+        CREATE INDEX IF NOT EXISTS saves_faction_level ON saves (faction, level);
+        CREATE INDEX IF NOT EXISTS saves_root ON saves (root);
+    """
+    COLUMNS = ("path", "root", "platform", "size", "mtime_ns", "digest", "is_backup", "character_name",
+               "level", "faction", "total_ep", "eps", "played_time", "territories", "territories_owned",
+               "achievements_total", "achievements_started", "pins_total", "pins_unlocked", "pedia_total",
+               "pedia_known", "error", "indexed_at")
+    BACKUP_PREFIX = "backup://"
+    ORDERINGS = ("character_name, level DESC", "level DESC", "played_time DESC", "path")
+
+    def __init__(self, db_path: Path):
+        self.logger = get_logger()
+        self.db_path = Path(db_path)
+        self.connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(self.SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def _upsert(self, records: Iterable[Dict[str, object]]) -> None:
+        placeholders = ", ".join("?" for _ in self.COLUMNS)
+        rows = [tuple(record.get(column) for column in self.COLUMNS) for record in records]
+        with self.connection:
+            self.connection.executemany(
+                f"INSERT OR REPLACE INTO saves ({', '.join(self.COLUMNS)}) VALUES ({placeholders})", rows)
+
+    # --------------------------------------------------------------------- scans
+
+    def scan(self, roots: Iterable[Path], workers: Optional[int] = None,
+             progress: Optional[Callable[[float, str], None]] = None) -> Dict[str, int]:
+        """
+        Bring the index up to date with the save files under roots. A file under
+        several roots belongs to the innermost one, so nested roots don't trade
+        their files back and forth between scans.
+        """
+        progress = progress or (lambda fraction, text: None)
+        stats = {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 0, 'failed': 0}
+        roots = sorted({str(Path(root).resolve()) for root in roots})
+
+        for root in roots:
+            progress(0.0, f"Scanning {root}")
+            nested = {other for other in roots if other.startswith(os.path.join(root, ""))}
+            known = {row['path']: (row['size'], row['mtime_ns']) for row in self.connection.execute(
+                "SELECT path, size, mtime_ns FROM saves WHERE root = ?", (root,))}
+
+            found, changed = set(), []
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = [name for name in dirnames if os.path.join(dirpath, name) not in nested]
+                for filename in filenames:
+                    path = os.path.join(dirpath, filename)
+                    if not is_save_file(Path(path)):
+                        continue
+                    found.add(path)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    if known.get(path) == (stat.st_size, stat.st_mtime_ns):
+                        stats['unchanged'] += 1
+                    else:
+                        changed.append(path)
+
+            records = []
+            indexed = self._index_files(changed, workers)
+            try:
+                for done, record in enumerate(indexed, 1):
+                    progress(done / max(len(changed), 1), f"Indexed {done}/{len(changed)}")
+                    if record is None:
+                        stats['failed'] += 1
+                        continue
+                    stats['updated' if record['path'] in known else 'added'] += 1
+                    record.update(root=root, is_backup=0, indexed_at=time.time())
+                    records.append(record)
+            finally:
+                indexed.close()  # A cancelled scan (progress raising) stops the pool right away
+            self._upsert(records)
+
+            removed = [path for path in known if path not in found]
+            with self.connection:
+                self.connection.executemany("DELETE FROM saves WHERE path = ?", [(path,) for path in removed])
+            stats['removed'] += len(removed)
+
+        self.logger.debug("Library scan: %s", stats)
+        return stats
+
+    def _index_files(self, paths: List[str], workers: Optional[int]):
+        if not paths:
+            return
+        if len(paths) == 1 or workers == 1:
+            for path in paths:
+                yield self._index_safely(path)
+            return
+        pool = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = [pool.submit(index_file, path) for path in paths]
+            for path, future in zip(paths, futures):
+                try:
+                    yield future.result()
+                except Exception as e:
+                    self.logger.warning("Could not index %s: %s", path, e)
+                    yield None
+        finally:
+            # Files not yet started are dropped if the scan stops early
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _index_safely(self, path: str) -> Optional[Dict[str, object]]:
+        try:
+            return index_file(path)
+        except OSError as e:
+            self.logger.warning("Could not index %s: %s", path, e)
+            return None
+
+    def scan_backups(self, backup_store) -> Dict[str, int]:
+        """Index every entry of a BackupStore; blobs already indexed by digest are not re-read"""
+        stats = {'added': 0, 'unchanged': 0, 'removed': 0, 'failed': 0}
+        root = self.BACKUP_PREFIX + str(Path(backup_store.root).resolve())
+        known = {row['path']: row['digest'] for row in self.connection.execute(
+            "SELECT path, digest FROM saves WHERE root = ?", (root,))}
+
+        found, records = set(), []
+        for character in backup_store.characters():
+            manifest = backup_store.load_manifest(character)
+            for entry in manifest['entries']:
+                for name, digest in entry['files'].items():
+                    if not is_save_file(Path(name)):
+                        continue
+                    path = f"{root}/{character}/{entry['id']}/{name}"
+                    found.add(path)
+                    if known.get(path) == digest:
+                        stats['unchanged'] += 1
+                        continue
+                    try:
+                        data = backup_store.read_blob(character, digest, manifest)
+                        record = {'path': path, 'platform': detect_platform(name, data), 'size': len(data),
+                                  'mtime_ns': None, 'digest': digest, 'error': None}
+                        record.update(summarize_save(data))
+                    except Exception as e:
+                        self.logger.warning("Could not index backup %s: %s", path, e)
+                        stats['failed'] += 1
+                        continue
+                    record.update(root=root, is_backup=1, indexed_at=time.time())
+                    records.append(record)
+                    stats['added'] += 1
+        self._upsert(records)
+
+        removed = [path for path in known if path not in found]
+        with self.connection:
+            self.connection.executemany("DELETE FROM saves WHERE path = ?", [(path,) for path in removed])
+        stats['removed'] = len(removed)
+        return stats
+
+    # ------------------------------------------------------------------- queries
+
+    def query(self, character: Optional[str] = None, faction: Optional[str] = None,
+              min_level: Optional[int] = None, max_level: Optional[int] = None,
+              platform: Optional[str] = None, include_backups: bool = True,
+              order_by: str = "character_name, level DESC") -> List[sqlite3.Row]:
+        """Indexed saves matching every given filter (character is a case-insensitive substring)"""
+        clauses, params = ["error IS NULL"], []
+        if character:
+            clauses.append("character_name LIKE ?")
+            params.append(f"%{character}%")
+        if faction:
+            clauses.append("faction = ?")
+            params.append(faction)
+        if min_level is not None:
+            clauses.append("level >= ?")
+            params.append(min_level)
+        if max_level is not None:
+            clauses.append("level <= ?")
+            params.append(max_level)
+        if platform:
+            clauses.append("platform = ?")
+            params.append(platform)
+        if not include_backups:
+            clauses.append("is_backup = 0")
+        if order_by not in self.ORDERINGS:
+            order_by = "character_name, level DESC"
+        sql = f"SELECT * FROM saves WHERE {' AND '.join(clauses)} ORDER BY {order_by}"
+        return self.connection.execute(sql, params).fetchall()
+
+    def count(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM saves").fetchone()[0]
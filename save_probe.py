@@ -0,0 +1,175 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional
+from xml.parsers import expat
+import logging
+
+from ps3_xml_handler import PS3XMLHandler
+
+
+FACTION_NAMES = {"0": "Undecided", "1": "Na'vi", "2": "RDA"}
+
+START_MARKERS = [b'<Savegame', b'<SaveGame', b'<savegame', b'<SaveData']
+PROFILE_ELEMENTS = ("BaseInfo", "XpInfo", "TimeInfo")
+METAGAME_MARKER = b'<Metagame'
+
+
+def get_logger():
+    return logging.getLogger('SaveProbe')
+
+
+def name_vec_to_string(name_vec: str) -> str:
+    """Convert a BaseInfo/@namevec value ("Count(3) 74;97;107;") to the character name"""
+    try:
+        if not name_vec or not name_vec.startswith("Count("):
+            return ""
+
+        parts = name_vec.split(") ")
+        if len(parts) < 2:
+            return ""
+
+        values = parts[1].rstrip(";").split(";")
+        return "".join(chr(int(val)) for val in values if val)
+    except Exception as e:
+        get_logger().error(f"Error converting name vector: {str(e)}")
+        return ""
+
+
+def character_folder_name(name: str) -> str:
+    """Character name made safe as a folder name, as the backup store files saves under"""
+    for char in '<>:"/\\|?*':
+        name = name.replace(char, '_')
+    # No leading/trailing spaces and dots, no empty names, and a length filesystems accept
+    return name.strip(' .')[:50] or "Unknown"
+
+
+@dataclass
+class SaveSummary:
+    """Profile header of a save, as read by probe_save"""
+    path: Path
+    character_name: str = ""
+    level: Optional[int] = None
+    xp: Optional[int] = None
+    total_ep: Optional[int] = None
+    faction: str = "Undecided"
+    played_time: Optional[int] = None
+    game_time: Optional[int] = None
+    bytes_read: int = 0
+    complete: bool = False
+    attributes: Dict[str, Dict[str, str]] = field(default_factory=dict)
+
+
+class _ProbeDone(Exception):
+    pass
+
+
+def _to_int(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _read_metagame_tag(buffer: bytes, start: int) -> Optional[Dict[str, str]]:
+    """Attributes of the <Metagame ...> start tag at buffer[start:], None if it isn't complete yet"""
+    end = buffer.find(b'>', start)
+    if end == -1:
+        return None
+    tag = buffer[start:end].rstrip(b'/') + b'/>'
+    attributes = {}
+
+    def start_element(name, attrib):
+        attributes.update(attrib)
+
+    parser = expat.ParserCreate()
+    parser.StartElementHandler = start_element
+    parser.Parse(tag, True)
+    return attributes
+
+
+def probe_save(file_path: Path, chunk_size: int = 4096, max_bytes: int = 4 * 1024 * 1024) -> SaveSummary:
+    """
+    Read a save's character name, level, EP, faction and played time without loading it.
+
+    The file is read in chunks and fed to an incremental expat parser from the
+    XML start marker on. Once BaseInfo, XpInfo and TimeInfo of the PlayerProfile
+    have been seen, the rest of the profile is skipped by scanning for the
+    <Metagame> start tag, and reading stops as soon as its attributes are known.
+    A PS3 save folder is probed through its SAVEDATA.000. Raises OSError if the
+    file can't be read and ValueError if no profile data was found in it.
+    """
+    summary = SaveSummary(path=Path(file_path))
+    if summary.path.is_dir():
+        file_path = PS3XMLHandler.get_primary_save_file(summary.path)
+    stack = []
+
+    def start_element(tag, attrib):
+        stack.append(tag)
+        if len(stack) == 3 and stack[1] == "PlayerProfile" and tag in PROFILE_ELEMENTS:
+            summary.attributes[tag] = attrib
+        elif len(stack) == 2 and tag == "Metagame":
+            summary.attributes[tag] = attrib
+            raise _ProbeDone()
+
+    def end_element(tag):
+        stack.pop()
+
+    parser = expat.ParserCreate()
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+
+    buffer = b''
+    xml_found = skipping = False
+    try:
+        with open(file_path, 'rb') as f:
+            while summary.bytes_read < max_bytes:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                summary.bytes_read += len(chunk)
+
+                if not xml_found:
+                    buffer += chunk
+                    positions = [pos for pos in (buffer.find(marker) for marker in START_MARKERS) if pos != -1]
+                    if not positions:
+                        continue
+                    xml_found = True
+                    chunk, buffer = buffer[min(positions):], b''
+
+                if skipping:
+                    buffer += chunk
+                    start = buffer.find(METAGAME_MARKER)
+                    if start == -1:
+                        # Keep enough of the buffer for a marker split across chunks
+                        buffer = buffer[-len(METAGAME_MARKER):]
+                        continue
+                    attributes = _read_metagame_tag(buffer, start)
+                    if attributes is not None:
+                        summary.attributes["Metagame"] = attributes
+                        raise _ProbeDone()
+                    continue
+
+                parser.Parse(chunk, False)
+                if all(name in summary.attributes for name in PROFILE_ELEMENTS):
+                    # The parser may hold the start of <Metagame from this chunk
+                    skipping, buffer = True, chunk
+    except _ProbeDone:
+        summary.complete = True
+    except expat.ExpatError as e:
+        get_logger().debug("Probe of %s stopped early: %s", file_path, e)
+    if not summary.attributes:
+        raise ValueError(f"No save data found in {file_path}" if xml_found else f"No XML found in {file_path}")
+
+    base_info = summary.attributes.get("BaseInfo", {})
+    xp_info = summary.attributes.get("XpInfo", {})
+    time_info = summary.attributes.get("TimeInfo", {})
+    metagame = summary.attributes.get("Metagame", {})
+
+    summary.character_name = name_vec_to_string(base_info.get("namevec", ""))
+    summary.total_ep = _to_int(base_info.get("TotalEP"))
+    summary.level = _to_int(xp_info.get("Level"))
+    summary.xp = _to_int(xp_info.get("XP"))
+    summary.played_time = _to_int(time_info.get("PlayedTime"))
+    summary.game_time = _to_int(time_info.get("GameTime"))
+    summary.faction = FACTION_NAMES.get(metagame.get("PlayerFaction", "0"), "Undecided")
+    return summary
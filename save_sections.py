@@ -0,0 +1,111 @@
+import hashlib
+import xml.etree.ElementTree as ET
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+# XML sections each editor tab reads, by element tag (found anywhere in the document)
+MANAGER_SECTIONS = {
+    'stats': ("PlayerProfile", "Metagame"),
+    'territory': ("Metagame",),
+    'achievements': ("AchievementCounter",),
+    'maps': ("AvatarFogOfWarDB_Status",),
+    'checkpoints': ("VisitedCheckpoints",),
+    'pandora_pedia': ("AvatarPandorapediaDB_Status",),
+    'missions': ("Mission_NotStarted", "Mission_InProgress", "Mission_Completed"),
+    'pins': ("AvatarPinDB_Status",),
+    'sounds': ("SoundKnowledge",),
+    'tutorial': ("AvatarTutorialDB_Status",),
+    'vehicle': ("BarkKnowledge",),
+    'skills': ("AvatarSkillDB_Status",),
+}
+
+SECTION_TAGS = frozenset(tag for tags in MANAGER_SECTIONS.values() for tag in tags)
+
+# (tag, occurrence number) identifies a section element within a document
+SectionKey = Tuple[str, int]
+
+
+def index_sections(root: ET.Element, tags: Iterable[str] = SECTION_TAGS) -> Dict[str, List[ET.Element]]:
+    """All elements with a section tag, by tag, in document order (one walk over the tree)"""
+    tags = frozenset(tags)
+    sections: Dict[str, List[ET.Element]] = {}
+    for element in root.iter():
+        if element.tag in tags:
+            sections.setdefault(element.tag, []).append(element)
+    return sections
+
+
+def managers_for_tags(tags: Iterable[str]) -> Set[str]:
+    tags = set(tags)
+    return {key for key, manager_tags in MANAGER_SECTIONS.items() if tags.intersection(manager_tags)}
+
+
+def _update_digest(digest, element: ET.Element, tags: frozenset, top: bool) -> None:
+    if not top and element.tag in tags:
+        # Nested sections are hashed on their own; only their position counts here
+        digest.update(b'\x01' + element.tag.encode('utf-8'))
+        return
+    digest.update(b'\x02' + element.tag.encode('utf-8'))
+    for name, value in sorted(element.attrib.items()):
+        digest.update(b'\x03' + name.encode('utf-8') + b'=' + value.encode('utf-8'))
+    digest.update(b'\x04' + (element.text or "").encode('utf-8'))
+    for child in element:
+        _update_digest(digest, child, tags, False)
+        digest.update(b'\x05' + (child.tail or "").encode('utf-8'))
+    digest.update(b'\x06')
+
+
+def section_digests(root: ET.Element, tags: Iterable[str] = SECTION_TAGS) -> Dict[SectionKey, str]:
+    """
+    Digest of every section element, excluding the contents of sections nested in it,
+    plus the root's own digest under ("", 0) for everything outside the sections.
+    """
+    tags = frozenset(tags)
+    digests = {}
+    for tag, elements in index_sections(root, tags).items():
+        for number, element in enumerate(elements):
+            digest = hashlib.sha1()
+            _update_digest(digest, element, tags, True)
+            digests[(tag, number)] = digest.hexdigest()
+    digest = hashlib.sha1()
+    _update_digest(digest, root, tags, True)
+    digests[("", 0)] = digest.hexdigest()
+    return digests
+
+
+def changed_sections(old: Dict[SectionKey, str], new: Dict[SectionKey, str]) -> Optional[Set[SectionKey]]:
+    """Section keys whose digest differs, or None if the documents differ outside the sections"""
+    if old.keys() != new.keys() or old[("", 0)] != new[("", 0)]:
+        return None
+    return {key for key in old if old[key] != new[key]}
+
+
+def _adopt(new_parent: ET.Element, new_to_old: Dict[int, ET.Element]) -> None:
+    """Put the old section elements in place of the new ones below new_parent"""
+    for position, child in enumerate(list(new_parent)):
+        old_section = new_to_old.get(id(child))
+        if old_section is not None:
+            old_section.tail = child.tail
+            new_parent[position] = old_section
+        else:
+            _adopt(child, new_to_old)
+
+
+def apply_section_changes(old_root: ET.Element, new_root: ET.Element, changed: Set[SectionKey]) -> None:
+    """
+    Make old_root equal to new_root by copying only the changed sections over.
+    Section elements keep their identity, so references into unchanged sections
+    (held by the managers) stay valid.
+    """
+    old_sections = index_sections(old_root)
+    new_sections = index_sections(new_root)
+    new_to_old = {id(new_element): old_sections[tag][number]
+                  for tag, elements in new_sections.items() for number, new_element in enumerate(elements)}
+
+    for tag, number in changed:
+        old_element, new_element = old_sections[tag][number], new_sections[tag][number]
+        _adopt(new_element, new_to_old)
+        old_element.attrib.clear()
+        old_element.attrib.update(new_element.attrib)
+        old_element.text = new_element.text
+        old_element[:] = list(new_element)
@@ -0,0 +1,77 @@
+import os
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+import logging
+
+
+class SaveWatcher:
+    """
+    Polls the stat signatures (size, mtime_ns) of the open save's files on a
+    Tk after() timer and reports when they change on disk.
+
+    A change is only reported once the signatures have been stable for one more
+    poll, so a save still being written by the game is not read half-way.
+    Call acknowledge() after writing the files yourself.
+    """
+
+    def __init__(self, widget, on_change: Callable[[List[Path]], None], interval_ms: int = 2000,
+                 paused: Optional[Callable[[], bool]] = None):
+        self.logger = logging.getLogger('SaveWatcher')
+        self.widget = widget
+        self.on_change = on_change
+        self.interval_ms = interval_ms
+        self.paused = paused or (lambda: False)
+        self.paths: List[Path] = []
+        self._signatures: Dict[Path, Optional[Tuple[int, int]]] = {}
+        self._pending: Optional[Dict[Path, Optional[Tuple[int, int]]]] = None
+        self._after_id = None
+
+    @staticmethod
+    def _stat(path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def _snapshot(self) -> Dict[Path, Optional[Tuple[int, int]]]:
+        return {path: self._stat(path) for path in self.paths}
+
+    def watch(self, paths: List[Path]) -> None:
+        """Start watching the given files, taking their current state as known"""
+        self.paths = list(paths)
+        self.acknowledge()
+        if self._after_id is None and self.interval_ms > 0:
+            self._after_id = self.widget.after(self.interval_ms, self._poll)
+        self.logger.debug("Watching %s", ", ".join(path.name for path in self.paths))
+
+    def acknowledge(self) -> None:
+        """Accept the files' current state, e.g. after the editor wrote them"""
+        self._signatures = self._snapshot()
+        self._pending = None
+
+    def stop(self) -> None:
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+        self.paths = []
+
+    def _poll(self) -> None:
+        self._after_id = None
+        try:
+            if self.paths and not self.paused():
+                current = self._snapshot()
+                if current == self._signatures:
+                    self._pending = None
+                elif current != self._pending:
+                    self._pending = current  # Changed: wait one poll for the writer to finish
+                else:
+                    changed = [path for path in self.paths if current[path] != self._signatures.get(path)]
+                    self._signatures, self._pending = current, None
+                    self.logger.debug("Changed on disk: %s", ", ".join(path.name for path in changed))
+                    self.on_change(changed)
+        except Exception as e:
+            self.logger.error("Watcher poll failed: %s", e, exc_info=True)
+        finally:
+            if self.paths:
+                self._after_id = self.widget.after(self.interval_ms, self._poll)
@@ -3,9 +3,11 @@ from tkinter import ttk
 import xml.etree.ElementTree as ET
 from typing import Dict, Optional
 from ui_components import LabeledInput, block_combobox_mousewheel
+from game_data import ITEM_NAMES
 import os
 from PIL import Image, ImageTk
 from Face_Image_Window import FaceImageWindow
+from save_probe import name_vec_to_string
 import logging
 from custom_messagebox import MessageBoxManager, show_info, show_error, show_warning, ask_question, ask_ok_cancel, show_success
 
@@ -193,17 +195,16 @@ class StatsManager:
                 # Update PlayerProfile element (this is where it should be)
                 if pin_id is None:
                     # Remove the attribute entirely
-                    if "crc_LastLoadedPin" in player_profile.attrib:
-                        del player_profile.attrib["crc_LastLoadedPin"]
+                    self.main_window.journal.set(player_profile, "crc_LastLoadedPin", None, "stats", "PlayerProfile")
                     self.logger.debug("Removed crc_LastLoadedPin from PlayerProfile")
                 else:
-                    player_profile.set("crc_LastLoadedPin", pin_id)
+                    self.main_window.journal.set(player_profile, "crc_LastLoadedPin", pin_id, "stats", "PlayerProfile")
                     self.logger.debug(f"Updated crc_LastLoadedPin in PlayerProfile to: {pin_id} ({selected_location})")
             else:
                 self.logger.error("PlayerProfile element not found!")
 
             # Mark changes as unsaved
-            self.main_window.unsaved_label.config(text="Unsaved Changes")
+            self.main_window.mark_dirty("stats", "PlayerProfile")
             
         except Exception as e:
             self.logger.error(f"Error in current location selection: {str(e)}")
@@ -663,7 +664,8 @@ class StatsManager:
         selected_skill = combo.get()
         
         if selected_skill == "-Empty-":
-            self._update_skill_slot(slot_index, None, is_navi=False)
+            with self._profile_transaction("Change skill"):
+                self._update_skill_slot(slot_index, None, is_navi=False)
             return
         
         # Check if it's an unknown skill ID display
@@ -679,8 +681,9 @@ class StatsManager:
                     break
         
         if skill_id:
-            self._update_skill_slot(slot_index, skill_id, is_navi=False)
-            self.main_window.unsaved_label.config(text="Unsaved Changes")
+            with self._profile_transaction("Change skill"):
+                self._update_skill_slot(slot_index, skill_id, is_navi=False)
+            self.main_window.mark_dirty("stats", "PlayerProfile")
 
     def _on_navi_skill_selected(self, event, slot_index):
         """Handle Na'vi skill selection"""
@@ -693,7 +696,8 @@ class StatsManager:
         selected_skill = combo.get()
         
         if selected_skill == "-Empty-":
-            self._update_skill_slot(slot_index, None, is_navi=True)
+            with self._profile_transaction("Change skill"):
+                self._update_skill_slot(slot_index, None, is_navi=True)
             return
         
         # Check if it's an unknown skill ID display
@@ -709,8 +713,9 @@ class StatsManager:
                     break
         
         if skill_id:
-            self._update_skill_slot(slot_index, skill_id, is_navi=True)
-            self.main_window.unsaved_label.config(text="Unsaved Changes")
+            with self._profile_transaction("Change skill"):
+                self._update_skill_slot(slot_index, skill_id, is_navi=True)
+            self.main_window.mark_dirty("stats", "PlayerProfile")
 
     def _update_skill_slot(self, slot_index, skill_id, is_navi=False):
         """Update a skill slot in the XML"""
@@ -1185,7 +1190,9 @@ class StatsManager:
             current = metagame.get("PlayerFaction")
             if current != faction_value:
                 print(f"DEBUG: Fixing faction reset. Changed from {current} to {faction_value}")
-                metagame.set("PlayerFaction", faction_value)
+                # Metagame is outside the watched PlayerProfile, so record the change explicitly
+                self.main_window.journal.set(metagame, "PlayerFaction", faction_value, "stats", "Metagame")
+                self.main_window.mark_dirty("stats", "Metagame")
                 
                 # Also update the UI dropdown to match
                 faction_map = {"0": "Undecided", "1": "Na'vi", "2": "RDA"}
@@ -1235,387 +1242,7 @@ class StatsManager:
 
     def _create_item_mappings(self):
         """Create mappings for item IDs to their actual names"""
-        self.item_mappings = {
-
-            #############################################
-
-            # RDA Weapons
-
-            # Dual Wasp Pistol
-            "1042188764": "Dual Wasp Pistol I",
-            "815885611": "Dual Wasp Pistol II",
-            "760079057": "Dual Wasp Pistol III",
-            "999316102": "Dual Wasp Pistol IV",
-            
-            # DLC Dual Wasp Pistols
-            "3859060838": "DLC WARLOCK Dual Wasp Pistol I",
-            "3904601233": "DLC WARLOCK Dual Wasp Pistol II",
-            "102867538": "DLC WARLOCK Dual Wasp Pistol III", 
-            "749353518": "DLC WARLOCK Dual Wasp Pistol IV",
-
-            # Standard Issue Rifle
-            "1130814347": "Standard Issue Rifle TERRA I",
-            "1306083196": "Standard Issue Rifle EURYS II",
-            "3628031700": "Standard Issue Rifle SOLARIS III",
-            "1146928137": "Standard Issue Rifle SOLARIS IV",
-            
-            # DLC Standard Issue Rifles
-            "2850329205": "DLC ARGO Standard Issue Rifle I",
-            "2807789186": "DLC ARGO Standard Issue Rifle II",
-            "2194670470": "DLC ARGO Standard Issue Rifle III",
-            "324172685": "DLC ARGO Standard Issue Rifle IV",
-
-            # Combat Shotgun
-            "2313824646": "Combat Shotgun PHALANX I",
-            "2270547313": "Combat Shotgun PHALANX II",
-            "2789519003": "Combat Shotgun PHALANX III",
-            "1919695864": "Combat Shotgun PHALANX IV",
-            
-            # DLC Combat Shotguns
-            "2664450350": "DLC SIGNET Combat Shotgun I",
-            "2423238105": "DLC SIGNET Combat Shotgun II",
-            "2120138529": "DLC SIGNET Combat Shotgun III",
-            "4289908838": "DLC SIGNET Combat Shotgun IV",
-
-            # Assault Rifle
-            "2397981034": "Assault Rifle TERRA I",
-            "2152836509": "Assault Rifle EURYS II",
-            "268371112": "Assault Rifle SOLARIS III",
-            "466145020": "Assault Rifle SOLARIS IV",
-            
-            # DLC Assault Rifles
-            "3655372526": "DLC BARRO Assault Rifle I",
-            "3613354521": "DLC BARRO Assault Rifle II",
-            "3850194262": "DLC BARRO Assault Rifle III",
-            "2109370248": "DLC BARRO Assault Rifle IV",
-
-            # M60 Machine Gun
-            "85991974": "BANISHER M60 Machine Gun I",
-            "195020497": "BANISHER M60 Machine Gun II",
-            "1881065336": "BANISHER M60 Machine Gun III",
-            "1796958374": "BANISHER M60 Machine Gun IV",
-            
-            # DLC Machine Guns
-            "2015914953": "DLC STELLAR M60 Machine Gun I",
-            "1989644094": "DLC STELLAR M60 Machine Gun II",
-            "1087779032": "DLC STELLAR M60 Machine Gun III",
-            "1691104809": "DLC STELLAR M60 Machine Gun IV",
-
-            # Grenade Launcher
-            "94681171": "Grenade Launcher M222 - I",
-            "186342564": "Grenade Launcher M222 - II",
-            "1349633617": "Grenade Launcher M222 - III",
-            "4018216358": "Grenade Launcher M222 - IV",
-            
-            # DLC Grenade Launchers
-            "2157668310": "DLC CRUSHER Grenade Launcher I",
-            "2384757537": "DLC CRUSHER Grenade Launcher II",
-            "3441856033": "DLC CRUSHER Grenade Launcher III",
-            "3043901684": "DLC CRUSHER Grenade Launcher IV",
-
-            # Flamethrower
-            "2529862352": "Flamethrower VESUPYRE I",
-            "2557822503": "Flamethrower STERILATOR II",
-            "609450705": "Flamethrower BUSHBOSS III",
-            "2288255787": "Flamethrower BUSHBOSS IV",
-            
-            # DLC Flamethrowers
-            "3250873684": "DLC BUDDY Flamethrower I",
-            "3480977827": "DLC BUDDY Flamethrower II",
-            "3469816623": "DLC BUDDY Flamethrower III",
-            "3994460767": "DLC BUDDY Flamethrower IV",
-
-            # Nail Gun
-            "2548581230": "Nail Gun HAMMER I",
-            "2572658585": "Nail Gun HAMMER II",
-            "143378107": "Nail Gun HAMMER III",
-            "1911864170": "Nail Gun HAMMER IV",
-            
-            # DLC Nail Guns
-            "2161255366": "DLC DENT Nail Gun I",
-            "2389559089": "DLC DENT Nail Gun II",
-            "3499218689": "DLC DENT Nail Gun III",
-            "4230631668": "DLC DENT Nail Gun IV",
-
-            # RDA Ammo
-            "4029490973": "Rifle Ammo",
-            "2220072441": "Shotgun Ammo",
-            "3183424835": "SMG Ammo",
-            "3227899887": "Grenade Ammo",
-            "4198025789": "Rocket Ammo",
-            "2442117335": "LMG Ammo",
-            "3819023512": "Heavy Ammo",
-
-            #############################################
-
-            # RDA Armor Sets
-
-            # E3 Exotant Armor Set
-            "666504347":  "E3 Exotant Head",     
-            "531856612":  "E3 Exotant Torso",       
-            "1234921930": "E3 Exotant Legs", 
-
-            # Tusk Armor set
-            "2800661647": "Tusk Head",
-            "2024422324": "Tusk Torso",
-            "1949228588": "Tusk Legs",
-
-            # Titan Armor Set
-            "4082430736": "Titan Head", 
-            "205852157":  "Titan Torso",
-            "1052486966": "Titan Legs",
-        
-            # Militum Armor Set
-            "149499402":  "Militum Head",  
-            "4160278759": "Militum Torso",    
-            "3305533484": "Militum Legs",   
-
-            # Kodiak Armor Set
-            "1593826001": "Kodiak Head",          
-            "2716738620": "Kodiak Torso",        
-            "2467333367": "Kodiak Legs",      
-
-            # Exotant Armor Set
-            "3527939275": "Exotant Head",     
-            "1193780569": "Exotant Torso",       
-            "1379870057": "Exotant Legs",         
-
-            # Centauri Armor Set
-            "403319592":  "Centauri Head",     
-            "3877361093": "Centauri Torso",   
-            "3588584718": "Centauri Legs",        
-
-            # Hydra Armor Set
-            "3753317026": "Hydra Head",      
-            "1851965193": "Hydra Torso",        
-            "2428117146": "Hydra Legs",   
-
-            # Warthog Armor Set
-            "2823901304": "Warthog Head",         
-            "1981144899": "Warthog Torso",          
-            "2056338139": "Warthog Legs",    
-
-            # Viper Armor Set
-            "3980056687": "Viper Head",
-            "3574042272": "Viper Torso",
-            "1417888964": "Viper Legs",
-
-            # DLC BRASHER I Armor Set
-            "3005472419": "DLC BRASHER I Head",
-            "730661330": "DLC BRASHER I Torso",
-            "3718956374": "DLC BRASHER I Legs",
-
-            # DLC BRASHER IV Armor Set
-            "3064631211": "DLC BRASHER II Head",
-            "2822640242": "DLC BRASHER II Torso",
-            "2398239326": "DLC BRASHER II Legs",
-
-            # DLC BRASHER III Armor Set
-            "3228789267": "DLC BRASHER III Head",
-            "1063425278": "DLC BRASHER III Troso",
-            "228340789": "DLC BRASHER III Legs",
-            
-            # DLC BRASHER IV Armor Set
-            "3818917462": "DLC BRASHER IV Head",
-            "1993326532": "DLC BRASHER IV Torso",
-            "1675050996": "DLC BRASHER IV Legs",
-
-            # DLC MISHETICA I Armor Set
-            "1563279247": "DLC MISHETICA I Head",
-            "3313721598": "DLC MISHETICA I Torso",
-            "866428026": "DLC MISHETICA I Legs",
-
-            # DLC MISHETICA II Armor Set
-            "4103047382": "DLC MISHETICA II Head",
-            "3927643407": "DLC MISHETICA II Torso",
-            "3436657955": "DLC MISHETICA II Legs",
-
-            # DLC MISHETICA III Armor Set
-            "4001710741": "DLC MISHETICA III Head",
-            "294960248": "DLC MISHETICA III Torso",
-            "594156723": "DLC MISHETICA III Legs",
-
-            # DLC MISHETICA IV Armor Set
-            "1950293887": "DLC MISHETICA IV Head",
-            "3780161261": "DLC MISHETICA IV Torso", 
-            "4098371293": "DLC MISHETICA IV Legs",
-
-            # Default RDA Armor Set
-            "433486271":  "Default RDA Head",
-            "2818823188": "Default RDA Torso",
-            "1457212295": "Default RDA Legs",
-            
-
-
-
-            #############################################
-
-
-
-            # Na'vi Weapons
-
-            # Dual Blade
-            "2740507591": "Ikranä Syal Dual Blade I",
-            "2917611312": "'Angtsìkä Zawng Dual Blade II",
-            "2813685095": "Palulukanä Srew Dual Blade III",
-            "2948460035": "Torukä Way Dual Blade IV",
-            
-            # DLC Dual Blade
-            "2285146948": "DLC Tanhì Dual Blade I",
-            "2257287091": "DLC Tanhì Dual Blade II",
-            "3543126973": "DLC Tanhì Dual Blade III",
-            "2007498681": "DLC Tanhì Dual Balde IV",
-            
-            # Crossbow
-            "1662469074": "Taronyu Crossbow I", 
-            "1839769381": "Tsamsiyu Crossbow II",
-            "3400058396": "Kyktan Crossbow III",
-            "1514231420": "Nawm Crossbow IV",
-
-            # DLC Crossbow
-            "3138212456": "DLC PXI Crossbow I",
-            "2486913109": "DLC PXI Crossbow II", 
-            "2589205711": "DLC PXI Crossbow III",
-            "1886472672": "DLC PXI Crossbow IV",
-
-            # M30 Machine Gun
-            "1304439874": "AVR-M30 Machine Gun I",
-            "1132447925": "AVR-M30 Machine Gun II",
-            "982090295": "AVR-M30 Machine Gun III",
-            "958613249": "AVR-M30 Machine Gun IV",
-
-            # ELITE M30 Machine Gun
-            "1048019290": "ELITE AVR-M30 II",
-            "172062103": "ELITE AVR-M30 III",
-            "921966990": "ELITE AVR-M30 IV",   
-
-            # Club
-            "4093397293": "Taronyu Club I",
-            "4249071066": "Tsamsiyu Club II",
-            "3879387803": "Eyktan Club III",
-            "240531571": "Nawm Club IV",
-
-            # DLC Axe
-            "1958996617": "DLC Ikran Axe 'Eko",
-            "2689671946": "DLC Ikran Axe Kurakx",
-            "1639187137": "DLC Ikran Axe Tsmukan",
-            "2934884349": "DLC Ikran Axe 'Ampi",
-            
-            # Fighting Staff
-            "2255793432": "Ikranä Zawng Fighting Staff I",
-            "2295024111": "Pa'liä Tìtxur Fighting Staff II",
-            "2986118748": "Palulukanä Tìtakuk Fighting Staff III",
-            "3960574385": "Torukä Tirea Fighting Staff IV",
-            
-            # DLC Fighting Staff
-            "1828119782": "DLC Hufwe Fighting Staff I",
-            "1648951313": "DLC Hufwe Fighting Staff II",
-            "3943944974": "DLC Hufwe Fighting Staff III",
-            "3139393077": "DLC Hufwe Fighting Staff IV",
-
-            # Bow
-            "291262189": "DLC Taronyu Tsko Bow I",
-            "371977402": "Tsko Nawm Bow IV",
-            "2092736556": "Tsko Kyktan Bow III", 
-            "535013914": "Tasmsiyu Tsko Bow II",
-
-            # DLC Bow
-            "1817446146": "DLC RAWKE Bow I",
-            "1659626485": "DLC RAWKE Bow II",
-            "1282693004": "DLC RAWKE Bow III",
-            "435991093": "DLC RAWKE Bow IV",
-
-            # Na'vi Ammo
-            "1042656528": "Arrow Ammo",  
-            "435601722": "Spear Ammo",   
-            "3069972540": "Poison Ammo", 
-
-            #############################################
-
-            # Na'vi Armor   
-            
-            
-            # RDA-Issue Avatar Gear
-            "236713729": "RDA-Issue Avatar Head",
-            "2228061969": "RDA-Issue Avatar Torso",
-            "753645081": "RDA-Issue Avatar Legs",
-
-            # TSAMSIYU Armor Set
-            "3705555217":"TSAMSIYU Head",
-            "1869067530":"TSAMSIYU Torso",
-            "780789927":"TSAMSIYU Legs",
-
-            # NAWM Armor III
-            "3363478556": "NAWM Head",  
-            "1118628876": "NAWM Torso",   
-            "3934969092": "NAWM Legs",
-
-            # EYKTAN Armor Set
-            "84098544": "EYKTAN Head",
-            "3666151432": "EYKTAN Torso",
-            "815973795": "EYKTAN Legs",
-
-            # KARYU Armor Set
-            "2070955956": "KARYU Head",
-            "1711646853": "KARYU Torso",
-            "2024863229": "KARYU Legs",
-
-            # NAWMA EYKTAN Armor Set
-            "1519513878": "NAWMA EYKTAN Head",
-            "2232927470": "NAWMA EYKTAN Torso",
-            "1865419077": "NAWMA EYKTAN Legs",
-
-            # NAWMA TARONYU Armor Set
-            "3932154789": "NAWMA TARONYU Head",
-            "884530381": "NAWMA TARONYU Torso",
-            "3480671099": "NAWMA TARONYU Legs",
-
-            # NAWMA TSAMSIYU Armor Set
-            "25166328": "NAWMA TSAMSIYU Head",
-            "3724948480": "NAWMA TSAMSIYU Torso",
-            "874641835": "NAWMA TSAMSIYU Legs",
-
-            # TIREA Armor Set
-            "985254384": "TIREA Head",
-            "386149755": "TIREA Torso",
-            "216177023": "TIREA Legs",
-
-            # 'AWVEA TSAMSIYU Armor Set   
-            "3529616870": "'AWVEA TSAMSIYU Head",   
-            "1641566717": "'AWVEA TSAMSIYU Torso",   
-            "540413008": "'AWVEA TSAMSIYU Legs", 
-
-            # TSTEU II Armor Set 
-            "1336514870": "DLC TSTEU II Head",
-            "904822394": "DLC TSTEU II Torso",
-            "848846039": "DLC TSTEU II Legs",
-
-            # TSTEU III Armor Set 
-            "1312065276": "DLC TSTEU III Head",
-            "824495264": "DLC TSTEU III Torso",
-            "2571396567": "DLC TSTEU III Legs",             
-
-            # TSTEU IV Armor Set 
-            "1500118218": "DLC TSTEU IV Head",
-            "1960056897": "DLC TSTSU IV Torso",
-            "1865591877": "DLC TSTEU IV legs",   
-
-            # TARONYU II Armor Set
-            "3240533717": "DLC TARONYU II Head",
-            "3143727513": "DLC TARONYU II Torso",
-            "3155647284": "DLC TARONYU II Legs",
-
-            # TARONYU III Armor Set
-            "2008660537": "DLC TARONYU III Head",
-            "145354853": "DLC TARONYU III Torso",
-            "2697550098": "DLC TARONYU III Legs",
-
-            # TARONYU IV Armor Set
-            "1753343575": "DLC TARONYU IV Head",
-            "1161560796": "DLC TARONYU IV Torso",
-            "1591391960": "DLC TARONYU IV Legs",                 
-                        
-        }
+        self.item_mappings = ITEM_NAMES
 
     def _get_item_name(self, item_id: str) -> str:
         """Convert an item ID to its readable name"""
@@ -1868,7 +1495,7 @@ class StatsManager:
                     self.face_image_label.image = photo  # Keep a reference
                     
                     # Mark as unsaved changes
-                    self.main_window.unsaved_label.config(text="Unsaved Changes")
+                    self.main_window.mark_dirty("stats", "PlayerProfile")
             else:
                 if self.face_image_label:
                     self.face_image_label.configure(image='', text="No Image\nFound")
@@ -1888,10 +1515,15 @@ class StatsManager:
                     return "break"
                 return
                 
-            self.main_window.unsaved_label.config(text="Unsaved Changes")
+            self.main_window.mark_dirty("stats", "PlayerProfile")
         except Exception as e:
             self.logger.error(f"Error marking unsaved changes: {str(e)}", exc_info=True)
 
+    def _profile_transaction(self, label):
+        """Record the PlayerProfile edits made in the with-block as one undo step"""
+        profile = self.main_window.tree.getroot().find("PlayerProfile")
+        return self.main_window.journal.transaction(label, "stats", "PlayerProfile", watch=profile)
+
     def _max_out_level(self):
         """Max out the experience based on selected faction"""
         try:
@@ -1922,7 +1554,7 @@ class StatsManager:
             if self.main_window.tree is not None:
                 base_info = self.main_window.tree.getroot().find(".//BaseInfo")
                 if base_info is not None:
-                    base_info.set("TotalEP", str(max_ep))
+                    self.main_window.journal.set(base_info, "TotalEP", str(max_ep), "stats", "PlayerProfile")
             
             # Mark changes as unsaved
             self._mark_unsaved_changes()
@@ -1961,7 +1593,7 @@ class StatsManager:
             # Update XML value for TotalEP
             base_info = self.main_window.tree.getroot().find(".//BaseInfo")
             if base_info is not None:
-                base_info.set("TotalEP", "0")
+                self.main_window.journal.set(base_info, "TotalEP", "0", "stats", "PlayerProfile")
 
             # Mark changes as unsaved
             self._mark_unsaved_changes()
@@ -2004,7 +1636,7 @@ class StatsManager:
                 ep_widget.insert(0, f"{current_ep}/{max_ep} (Max EP)")
             
             # Mark changes as unsaved
-            self.main_window.unsaved_label.config(text="Unsaved Changes")
+            self.main_window.mark_dirty("stats", "Metagame")
         except Exception as e:
             self.logger.error(f"Error in faction selection: {str(e)}")
             show_error("Error", f"Failed to change faction: {str(e)}")
@@ -2035,8 +1667,9 @@ class StatsManager:
         # Update the XML
         profile = self.main_window.tree.getroot().find("PlayerProfile")
         if profile is not None:
-            self._update_weapon(profile, slot_index, weapon_id, is_navi=False)
-            self.main_window.unsaved_label.config(text="Unsaved Changes")
+            with self._profile_transaction("Change weapon"):
+                self._update_weapon(profile, slot_index, weapon_id, is_navi=False)
+            self.main_window.mark_dirty("stats", "PlayerProfile")
 
     def _on_navi_weapon_selected(self, event, slot_index):
         """Handle weapon selection for Na'vi"""
@@ -2064,8 +1697,9 @@ class StatsManager:
         # Update the XML
         profile = self.main_window.tree.getroot().find("PlayerProfile")
         if profile is not None:
-            self._update_weapon(profile, slot_index, weapon_id, is_navi=True)
-            self.main_window.unsaved_label.config(text="Unsaved Changes")
+            with self._profile_transaction("Change weapon"):
+                self._update_weapon(profile, slot_index, weapon_id, is_navi=True)
+            self.main_window.mark_dirty("stats", "PlayerProfile")
 
     def _on_armor_selected(self, event, slot_type):
         """Handle armor selection for RDA"""
@@ -2081,10 +1715,11 @@ class StatsManager:
         if profile is None:
             return
             
-        success = self._update_armor(profile, slot_type, selected_armor, is_navi=False)
+        with self._profile_transaction("Change armor"):
+            success = self._update_armor(profile, slot_type, selected_armor, is_navi=False)
         
         if success:
-            self.main_window.unsaved_label.config(text="Unsaved Changes")
+            self.main_window.mark_dirty("stats", "PlayerProfile")
 
     def _on_navi_armor_selected(self, event, slot_type):
         """Handle armor selection for Na'vi"""
@@ -2100,10 +1735,11 @@ class StatsManager:
         if profile is None:
             return
             
-        success = self._update_armor(profile, slot_type, selected_armor, is_navi=True)
+        with self._profile_transaction("Change armor"):
+            success = self._update_armor(profile, slot_type, selected_armor, is_navi=True)
         
         if success:
-            self.main_window.unsaved_label.config(text="Unsaved Changes")
+            self.main_window.mark_dirty("stats", "PlayerProfile")
 
     def _toggle_infinite_ammo(self, event, slot_index, is_navi=False):
         """Handle toggling infinite ammo for a weapon"""
@@ -2187,13 +1823,14 @@ class StatsManager:
                         
                     current_ammo_type = weapon_poss.get("crc_AmmoType", "4294967295")
                     
-                    if infinite_enabled:
-                        weapon_poss.set("crc_AmmoType", "4294967295")
-                        weapon_poss.set("NbInClip", "999999")
-                    else:
-                        correct_ammo_type = self._get_ammo_type_for_weapon(weapon_id)
-                        weapon_poss.set("crc_AmmoType", correct_ammo_type)
-                        weapon_poss.set("NbInClip", "500")
+                    with self._profile_transaction("Toggle infinite ammo"):
+                        if infinite_enabled:
+                            weapon_poss.set("crc_AmmoType", "4294967295")
+                            weapon_poss.set("NbInClip", "999999")
+                        else:
+                            correct_ammo_type = self._get_ammo_type_for_weapon(weapon_id)
+                            weapon_poss.set("crc_AmmoType", correct_ammo_type)
+                            weapon_poss.set("NbInClip", "500")
                     
                     # Update UI
                     ammo_entry = slot_data["ammo_entry"]
@@ -2206,7 +1843,7 @@ class StatsManager:
                         ammo_entry.insert(0, "500")
                         ammo_entry.configure(state="normal")
                     
-                    self.main_window.unsaved_label.config(text="Unsaved Changes")
+                    self.main_window.mark_dirty("stats", "PlayerProfile")
         
         except Exception as e:
             self.logger.error(f"Error applying infinite ammo: {str(e)}", exc_info=True)
@@ -2236,8 +1873,9 @@ class StatsManager:
             # Update the XML
             profile = self.main_window.tree.getroot().find("PlayerProfile")
             if profile is not None:
-                self._update_ammo_directly(profile, is_navi, slot_index, new_ammo)
-                self.main_window.unsaved_label.config(text="Unsaved Changes")
+                with self._profile_transaction("Change ammo"):
+                    self._update_ammo_directly(profile, is_navi, slot_index, new_ammo)
+                self.main_window.mark_dirty("stats", "PlayerProfile")
                 
         except Exception as e:
             show_error("Error", f"Failed to update ammo value: {str(e)}")
@@ -2251,7 +1889,7 @@ class StatsManager:
         try:
             # Implementation would go here - simplified for space
             show_info("Reset Complete", "Weapon ammo types have been reset.")
-            self.main_window.unsaved_label.config(text="Unsaved Changes")
+            self.main_window.mark_dirty("stats", "PlayerProfile")
         except Exception as e:
             show_error("Error", f"Failed to reset weapon ammo: {str(e)}")
 
@@ -2264,7 +1902,7 @@ class StatsManager:
         try:
             # Implementation would go here - simplified for space
             show_info("Duplicates Removed", "Duplicate items have been removed from inventory.")
-            self.main_window.unsaved_label.config(text="Unsaved Changes")
+            self.main_window.mark_dirty("stats", "PlayerProfile")
         except Exception as e:
             show_error("Error", f"Failed to remove duplicates: {str(e)}")
 
@@ -2339,34 +1977,35 @@ class StatsManager:
             items_added = 0
             
             # Add each DLC item if it doesn't already exist
-            for item_id in rda_dlc_items:
-                if item_id not in existing_items:
-                    # Create new possession
-                    new_poss = ET.SubElement(possessions, "Poss")
-                    new_poss.set("Index", str(next_index))
-                    new_poss.set("crc_ItemID", item_id)
-                    new_poss.set("NbInStack", "1")
-                    new_poss.set("NbInClip", "0")
+            with self._profile_transaction("Add RDA DLC items"):
+                for item_id in rda_dlc_items:
+                    if item_id not in existing_items:
+                        # Create new possession
+                        new_poss = ET.SubElement(possessions, "Poss")
+                        new_poss.set("Index", str(next_index))
+                        new_poss.set("crc_ItemID", item_id)
+                        new_poss.set("NbInStack", "1")
+                        new_poss.set("NbInClip", "0")
                     
-                    # Set appropriate ammo type
-                    ammo_type = self._get_ammo_type_for_weapon(item_id)
-                    new_poss.set("crc_AmmoType", ammo_type)
-                    new_poss.set("NoveltyState", "2")
+                        # Set appropriate ammo type
+                        ammo_type = self._get_ammo_type_for_weapon(item_id)
+                        new_poss.set("crc_AmmoType", ammo_type)
+                        new_poss.set("NoveltyState", "2")
                     
-                    # Copy formatting from existing items
-                    other_poss = possessions.find("Poss")
-                    if other_poss is not None and hasattr(other_poss, 'tail'):
-                        new_poss.tail = other_poss.tail
+                        # Copy formatting from existing items
+                        other_poss = possessions.find("Poss")
+                        if other_poss is not None and hasattr(other_poss, 'tail'):
+                            new_poss.tail = other_poss.tail
                     
-                    self.logger.debug(f"Added RDA DLC item: {self._get_item_name(item_id)} (ID: {item_id})")
-                    items_added += 1
-                    next_index += 1
+                        self.logger.debug(f"Added RDA DLC item: {self._get_item_name(item_id)} (ID: {item_id})")
+                        items_added += 1
+                        next_index += 1
                     
-                    # Update existing items set
-                    existing_items.add(item_id)
+                        # Update existing items set
+                        existing_items.add(item_id)
             
             # Mark changes as unsaved
-            self.main_window.unsaved_label.config(text="Unsaved Changes")
+            self.main_window.mark_dirty("stats", "PlayerProfile")
             
             if items_added > 0:
                 show_success("DLC Items Added", f"Successfully added {items_added} RDA DLC items to inventory.")
@@ -2438,34 +2077,35 @@ class StatsManager:
             items_added = 0
             
             # Add each DLC item if it doesn't already exist
-            for item_id in navi_dlc_items:
-                if item_id not in existing_items:
-                    # Create new possession
-                    new_poss = ET.SubElement(possessions, "Poss")
-                    new_poss.set("Index", str(next_index))
-                    new_poss.set("crc_ItemID", item_id)
-                    new_poss.set("NbInStack", "1")
-                    new_poss.set("NbInClip", "0")
+            with self._profile_transaction("Add Na'vi DLC items"):
+                for item_id in navi_dlc_items:
+                    if item_id not in existing_items:
+                        # Create new possession
+                        new_poss = ET.SubElement(possessions, "Poss")
+                        new_poss.set("Index", str(next_index))
+                        new_poss.set("crc_ItemID", item_id)
+                        new_poss.set("NbInStack", "1")
+                        new_poss.set("NbInClip", "0")
                     
-                    # Set appropriate ammo type
-                    ammo_type = self._get_ammo_type_for_weapon(item_id)
-                    new_poss.set("crc_AmmoType", ammo_type)
-                    new_poss.set("NoveltyState", "2")
+                        # Set appropriate ammo type
+                        ammo_type = self._get_ammo_type_for_weapon(item_id)
+                        new_poss.set("crc_AmmoType", ammo_type)
+                        new_poss.set("NoveltyState", "2")
                     
-                    # Copy formatting from existing items
-                    other_poss = possessions.find("Poss")
-                    if other_poss is not None and hasattr(other_poss, 'tail'):
-                        new_poss.tail = other_poss.tail
+                        # Copy formatting from existing items
+                        other_poss = possessions.find("Poss")
+                        if other_poss is not None and hasattr(other_poss, 'tail'):
+                            new_poss.tail = other_poss.tail
                     
-                    self.logger.debug(f"Added Na'vi DLC item: {self._get_item_name(item_id)} (ID: {item_id})")
-                    items_added += 1
-                    next_index += 1
+                        self.logger.debug(f"Added Na'vi DLC item: {self._get_item_name(item_id)} (ID: {item_id})")
+                        items_added += 1
+                        next_index += 1
                     
-                    # Update existing items set
-                    existing_items.add(item_id)
+                        # Update existing items set
+                        existing_items.add(item_id)
             
             # Mark changes as unsaved
-            self.main_window.unsaved_label.config(text="Unsaved Changes")
+            self.main_window.mark_dirty("stats", "PlayerProfile")
             
             if items_added > 0:
                 show_success("DLC Items Added", f"Successfully added {items_added} Na'vi DLC items to inventory.")
@@ -3716,20 +3356,7 @@ class StatsManager:
 
     def _name_vec_to_string(self, name_vec):
         """Convert name vector to readable string"""
-        try:
-            if not name_vec or not name_vec.startswith("Count("):
-                return ""
-            
-            parts = name_vec.split(") ")
-            if len(parts) < 2:
-                return ""
-            
-            values = parts[1].rstrip(";").split(";")
-            name = "".join(chr(int(val)) for val in values if val)
-            return name
-        except Exception as e:
-            self.logger.error(f"Error converting name vector: {str(e)}")
-            return ""
+        return name_vec_to_string(name_vec)
 
     def get_stats_updates(self) -> Dict[str, Dict[str, str]]:
         """Get all stats updates for saving - COMPLETE IMPLEMENTATION"""
@@ -3858,8 +3485,8 @@ class StatsManager:
                 env_time_raw = target_env_time
                 
                 # Mark as unsaved changes since we modified the XML
-                if hasattr(self.main_window, 'unsaved_label'):
-                    self.main_window.unsaved_label.config(text="Unsaved Changes")
+                if hasattr(self.main_window, 'mark_dirty'):
+                    self.main_window.mark_dirty("stats", "PlayerProfile")
                     self.logger.debug("Marked save as having unsaved changes due to EnvTime auto-fix")
             else:
                 self.logger.debug(f"EnvTime already correct: {env_time_raw}")
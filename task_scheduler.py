@@ -0,0 +1,127 @@
+import heapq
+import itertools
+import time
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Dict, Generator, Iterable, Optional
+import logging
+
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+
+class _Task:
+    def __init__(self, key: str, generator: Generator, priority: int, on_done: Optional[Callable[[], None]]):
+        self.key = key
+        self.generator = generator
+        self.priority = priority
+        self.on_done = on_done
+        self.cancelled = False
+
+
+class TaskScheduler:
+    """
+    Cooperative scheduler for long UI builds on top of Tk's after().
+
+    A task is a generator that yields after each small unit of work (typically
+    one Treeview insert). Each tick runs the highest-priority task for at most
+    slice_ms, then hands control back to the event loop so input is handled
+    between chunks. Submitting a task under an existing key cancels the old one.
+    """
+
+    def __init__(self, widget: tk.Misc, slice_ms: float = 8.0, gap_ms: int = 1):
+        self.logger = logging.getLogger('TaskScheduler')
+        self.widget = widget
+        self.slice_s = slice_ms / 1000
+        self.gap_ms = gap_ms
+        self._heap = []
+        self._tasks: Dict[str, _Task] = {}
+        self._counter = itertools.count()
+        self._after_id = None
+
+    def submit(self, key: str, generator: Generator, priority: int = PRIORITY_NORMAL,
+               on_done: Optional[Callable[[], None]] = None) -> None:
+        """Schedule a generator task, replacing any pending task with the same key"""
+        self.cancel(key)
+        task = _Task(key, generator, priority, on_done)
+        self._tasks[key] = task
+        heapq.heappush(self._heap, (priority, next(self._counter), task))
+        if self._after_id is None:
+            self._after_id = self.widget.after_idle(self._tick)
+
+    def cancel(self, key: str) -> bool:
+        task = self._tasks.pop(key, None)
+        if task is None:
+            return False
+        task.cancelled = True
+        task.generator.close()
+        self.logger.debug("Cancelled task %s", key)
+        return True
+
+    def cancel_all(self) -> None:
+        for key in list(self._tasks):
+            self.cancel(key)
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _complete(self, task: _Task) -> None:
+        if self._tasks.get(task.key) is task:
+            del self._tasks[task.key]
+        task.cancelled = True  # Drops its stale heap entry
+        if task.on_done:
+            task.on_done()
+
+    def _tick(self) -> None:
+        self._after_id = None
+        deadline = time.perf_counter() + self.slice_s
+
+        while self._heap and time.perf_counter() < deadline:
+            _, _, task = self._heap[0]
+            if task.cancelled:
+                heapq.heappop(self._heap)
+                continue
+            try:
+                next(task.generator)
+            except StopIteration:
+                heapq.heappop(self._heap)
+                self._complete(task)
+            except Exception as e:
+                heapq.heappop(self._heap)
+                self._tasks.pop(task.key, None)
+                task.cancelled = True
+                self.logger.error("Task %s failed: %s", task.key, e, exc_info=True)
+
+        if self._heap:
+            self._after_id = self.widget.after(self.gap_ms, self._tick)
+
+
+def run_task(scheduler: Optional[TaskScheduler], key: str, generator: Generator,
+             priority: int = PRIORITY_NORMAL, on_done: Optional[Callable[[], None]] = None) -> None:
+    """Schedule a task, or run it synchronously when no scheduler is available"""
+    if scheduler is not None:
+        scheduler.submit(key, generator, priority, on_done)
+        return
+    for _ in generator:
+        pass
+    if on_done:
+        on_done()
+
+
+def iter_insert_rows(treeview: ttk.Treeview, rows: Iterable[tuple]) -> Generator:
+    """Insert (values, tags) rows at the end of a Treeview, yielding after each one"""
+    for values, tags in rows:
+        treeview.insert("", tk.END, values=values, tags=tags)
+        yield
+
+
+def populate_treeview(scheduler: Optional[TaskScheduler], key: str, treeview: ttk.Treeview,
+                      rows: Iterable[tuple], priority: int = PRIORITY_NORMAL,
+                      on_done: Optional[Callable[[], None]] = None) -> None:
+    """Replace a Treeview's rows, inserting them in time-sliced chunks"""
+    if scheduler is not None:
+        scheduler.cancel(key)
+    treeview.delete(*treeview.get_children())
+    run_task(scheduler, key, iter_insert_rows(treeview, list(rows)), priority, on_done)
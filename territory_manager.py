@@ -4,6 +4,7 @@ import xml.etree.ElementTree as ET
 from typing import Dict, Optional
 from ui_components import EnhancedTooltip
 from xml_handler import XMLHandler
+from task_scheduler import populate_treeview, PRIORITY_HIGH
 import logging
 from custom_messagebox import MessageBoxManager, show_info, show_error, show_warning, ask_question, ask_ok_cancel, show_success
 
@@ -324,20 +325,17 @@ class TerritoryManager:
         try:
             # Clear existing data
             self.territory_data = {}
-            
-            # Clear existing items in treeview
-            for item in self.territory_tree.get_children():
-                self.territory_tree.delete(item)
+            rows = []
 
             territories = tree.findall(".//Territory")
-            self.logger.debug(f"Found {len(territories)} territories")
+            self.logger.debug("Found %d territories", len(territories))
             
             for territory in territories:
                 try:
                     territory_id = territory.get("crc_ID", "")
                     faction = territory.get("Faction", "0")
                     
-                    self.logger.debug(f"Processing territory ID: '{territory_id}' (type: {type(territory_id)})")
+                    self.logger.debug("Processing territory ID: '%s'", territory_id)
                     
                     # Get free units data
                     free_units = territory.find("FreeUnits")
@@ -365,7 +363,7 @@ class TerritoryManager:
                         'element': territory
                     }
                     
-                    self.logger.debug(f"Stored territory data with key: '{territory_key}'")
+                    self.logger.debug("Stored territory data with key: '%s'", territory_key)
                     
                     # Determine faction icon and tag
                     faction_icon, tag = self._get_faction_display_info(faction)
@@ -382,16 +380,18 @@ class TerritoryManager:
                         "Yes" if territory.get("Active", "0") == "1" else "No"
                     )
                     
-                    self.territory_tree.insert("", tk.END, values=values, tags=(tag,))
-                    
-                    self.logger.debug(f"Successfully added territory {territory_key} to tree")
+                    rows.append((values, (tag,)))
                 
                 except Exception as e:
-                    self.logger.error(f"Error processing individual territory: {str(e)}", exc_info=True)
+                    self.logger.error("Error processing individual territory: %s", e, exc_info=True)
+
+            # Rows are inserted in time-sliced chunks so the window stays responsive
+            self._populate_territory_tree(rows)
 
             # Log summary of loaded data
-            self.logger.debug(f"Loaded {len(self.territory_data)} territories total")
-            self.logger.debug(f"Sample territory keys: {list(self.territory_data.keys())[:3]}...")
+            self.logger.debug("Loaded %d territories total", len(self.territory_data))
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Sample territory keys: %s...", list(self.territory_data.keys())[:3])
             
             # Reset editors after loading data
             self._reset_territory_editors()
@@ -411,13 +411,14 @@ class TerritoryManager:
         }
         return faction_mapping.get(str(faction).strip(), ("⚪", "neutral"))
 
+    def _populate_territory_tree(self, rows):
+        """Replace the territory rows via the main window's scheduler (synchronously without one)"""
+        scheduler = getattr(self.main_window, 'scheduler', None)
+        populate_treeview(scheduler, "territory.rows", self.territory_tree, rows, PRIORITY_HIGH)
+
     def _refresh_territory_display(self):
         """Refresh the territory display after changes"""
-        # Clear and repopulate tree
-        for item in self.territory_tree.get_children():
-            self.territory_tree.delete(item)
-        
-        # Re-add all items
+        rows = []
         for territory_id, territory_data in self.territory_data.items():
             faction_icon, tag = self._get_faction_display_info(territory_data['faction'])
             
@@ -434,7 +435,9 @@ class TerritoryManager:
                 "Yes" if territory_data['active'] == "1" else "No"
             )
             
-            self.territory_tree.insert("", tk.END, values=values, tags=(tag,))
+            rows.append((values, (tag,)))
+        
+        self._populate_territory_tree(rows)
 
     def _on_territory_select(self, event) -> None:
         """Handle territory selection - FIXED VERSION"""
@@ -832,29 +835,31 @@ class TerritoryManager:
 
             # Update the XML tree if available
             if self.main_window and self.main_window.tree:
-                territory_element = territory_data['element']
+                with self.main_window.journal.transaction("Edit territory", "territory", "Metagame"):
+                    territory_element = territory_data['element']
                 
-                # Update territory attributes
-                territory_element.set("Faction", faction_code)
-                territory_element.set("BaseUnits", territory_data['base_units'])
-                territory_element.set("HomeBase", territory_data['home_base'])
-                territory_element.set("SecondaryBase", territory_data['factory'])
-                territory_element.set("DefenseFlags", territory_data['defense_flags'])
-                territory_element.set("Active", territory_data['active'])
+                    # Update territory attributes
+                    self.main_window.journal.set(territory_element, "Faction", faction_code)
+                    self.main_window.journal.set(territory_element, "BaseUnits", territory_data['base_units'])
+                    self.main_window.journal.set(territory_element, "HomeBase", territory_data['home_base'])
+                    self.main_window.journal.set(territory_element, "SecondaryBase", territory_data['factory'])
+                    self.main_window.journal.set(territory_element, "DefenseFlags", territory_data['defense_flags'])
+                    self.main_window.journal.set(territory_element, "Active", territory_data['active'])
 
-                # Update or create FreeUnits element
-                free_units = territory_element.find("FreeUnits")
-                if free_units is None:
-                    free_units = ET.SubElement(territory_element, "FreeUnits")
+                    # Update or create FreeUnits element
+                    free_units = territory_element.find("FreeUnits")
+                    if free_units is None:
+                        free_units = ET.Element("FreeUnits")
+                        self.main_window.journal.append(territory_element, free_units)
                 
-                free_units.set("Troops", territory_data['troops'])
-                free_units.set("Ground", territory_data['ground'])
-                free_units.set("Air", territory_data['air'])
+                    self.main_window.journal.set(free_units, "Troops", territory_data['troops'])
+                    self.main_window.journal.set(free_units, "Ground", territory_data['ground'])
+                    self.main_window.journal.set(free_units, "Air", territory_data['air'])
 
                 self.logger.debug("Updated XML tree with territory changes")
 
                 # Mark as having unsaved changes
-                self.main_window.unsaved_label.config(text="Unsaved Changes")
+                self.main_window.mark_dirty("territory", "Metagame")
 
             self.logger.debug("Territory changes applied successfully")
             show_success("Success", "✅ Territory updated successfully!")
@@ -947,49 +952,51 @@ class TerritoryManager:
             # Apply boosts to all territories of the opposing faction
             territories_modified = 0
             
-            for territory_id, territory_data in self.territory_data.items():
-                territory_faction = territory_data['faction']
+            with self.main_window.journal.transaction("Apply Hard Mode", "territory", "Metagame"):
+                for territory_id, territory_data in self.territory_data.items():
+                    territory_faction = territory_data['faction']
                 
-                # Debug each territory being examined
-                self.logger.debug(f"Checking territory ID: {territory_id}, Faction: {territory_faction}")
+                    # Debug each territory being examined
+                    self.logger.debug("Checking territory ID: %s, Faction: %s", territory_id, territory_faction)
                 
-                # Only modify territories of the OPPOSING faction
-                if territory_faction == opponent_faction:
-                    # Get current values and add boosts
-                    current_troops = int(territory_data['troops'] or 0)
-                    current_ground = int(territory_data['ground'] or 0)
-                    current_air = int(territory_data['air'] or 0)
+                    # Only modify territories of the OPPOSING faction
+                    if territory_faction == opponent_faction:
+                        # Get current values and add boosts
+                        current_troops = int(territory_data['troops'] or 0)
+                        current_ground = int(territory_data['ground'] or 0)
+                        current_air = int(territory_data['air'] or 0)
                     
-                    new_troops = current_troops + troop_boost
-                    new_ground = current_ground + ground_boost
-                    new_air = current_air + air_boost
+                        new_troops = current_troops + troop_boost
+                        new_ground = current_ground + ground_boost
+                        new_air = current_air + air_boost
                     
-                    self.logger.debug(f"Modifying territory {territory_id} - Adding Troops: {troop_boost}, Ground: {ground_boost}, Air: {air_boost}")
-                    self.logger.debug(f"Setting defense flags to {defense_flags_value} and factory to {factory_value}")
+                        self.logger.debug(f"Modifying territory {territory_id} - Adding Troops: {troop_boost}, Ground: {ground_boost}, Air: {air_boost}")
+                        self.logger.debug(f"Setting defense flags to {defense_flags_value} and factory to {factory_value}")
                     
-                    # Update territory data
-                    territory_data['troops'] = str(new_troops)
-                    territory_data['ground'] = str(new_ground)
-                    territory_data['air'] = str(new_air)
-                    territory_data['factory'] = factory_value
-                    territory_data['defense_flags'] = str(defense_flags_value)
+                        # Update territory data
+                        territory_data['troops'] = str(new_troops)
+                        territory_data['ground'] = str(new_ground)
+                        territory_data['air'] = str(new_air)
+                        territory_data['factory'] = factory_value
+                        territory_data['defense_flags'] = str(defense_flags_value)
                     
-                    # Update XML element
-                    territory_element = territory_data['element']
-                    territory_element.set("SecondaryBase", factory_value)
-                    territory_element.set("DefenseFlags", str(defense_flags_value))
+                        # Update XML element
+                        territory_element = territory_data['element']
+                        self.main_window.journal.set(territory_element, "SecondaryBase", factory_value)
+                        self.main_window.journal.set(territory_element, "DefenseFlags", str(defense_flags_value))
                     
-                    # Update or create FreeUnits element
-                    free_units = territory_element.find("FreeUnits")
-                    if free_units is None:
-                        free_units = ET.SubElement(territory_element, "FreeUnits")
+                        # Update or create FreeUnits element
+                        free_units = territory_element.find("FreeUnits")
+                        if free_units is None:
+                            free_units = ET.Element("FreeUnits")
+                            self.main_window.journal.append(territory_element, free_units)
                     
-                    free_units.set("Troops", str(new_troops))
-                    free_units.set("Ground", str(new_ground))
-                    free_units.set("Air", str(new_air))
+                        self.main_window.journal.set(free_units, "Troops", str(new_troops))
+                        self.main_window.journal.set(free_units, "Ground", str(new_ground))
+                        self.main_window.journal.set(free_units, "Air", str(new_air))
                     
-                    territories_modified += 1
-                    self.logger.debug(f"Updated territory {territory_id} for Hard Mode")
+                        territories_modified += 1
+                        self.logger.debug(f"Updated territory {territory_id} for Hard Mode")
             
             if territories_modified == 0:
                 self.logger.warning(f"No territories found with faction {opponent_faction} to modify")
@@ -1001,7 +1008,7 @@ class TerritoryManager:
             
             # Mark as having unsaved changes
             if self.main_window:
-                self.main_window.unsaved_label.config(text="Unsaved Changes")
+                self.main_window.mark_dirty("territory", "Metagame")
             
             faction_names = {"1": "Na'vi", "2": "RDA"}
             opponent_name = faction_names.get(opponent_faction, f"Faction {opponent_faction}")
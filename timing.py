@@ -0,0 +1,184 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import logging
+
+
+@dataclass
+class Span:
+    """A single timed region of the load/save pipeline"""
+    name: str
+    category: str
+    start_ns: int
+    thread_id: int
+    end_ns: Optional[int] = None
+    args: Dict[str, Any] = field(default_factory=dict)
+    children: List["Span"] = field(default_factory=list)
+
+    @property
+    def duration_ms(self) -> float:
+        end_ns = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return (end_ns - self.start_ns) / 1_000_000
+
+
+class Tracer:
+    """
+    Lightweight span recorder for the load/save pipeline.
+
+    Spans nest per thread; top-level spans opened with ``operation()`` are kept
+    (up to ``max_operations``) so the status bar can show the last operation and
+    the whole history can be exported as Chrome-trace or Speedscope JSON.
+    """
+
+    def __init__(self, max_operations: int = 50):
+        self.logger = logging.getLogger('Tracer')
+        self.max_operations = max_operations
+        self.operations: List[Span] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._epoch_ns = time.perf_counter_ns()
+
+    def _stack(self) -> List[Span]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def span(self, name: str, category: str = "editor", **args):
+        """Time a nested region; a span opened with no parent becomes an operation"""
+        stack = self._stack()
+        current = Span(name, category, time.perf_counter_ns(), threading.get_ident(), args=args)
+        if stack:
+            stack[-1].children.append(current)
+        else:
+            with self._lock:
+                self.operations.append(current)
+                del self.operations[:-self.max_operations]
+        stack.append(current)
+        try:
+            yield current
+        finally:
+            current.end_ns = time.perf_counter_ns()
+            stack.pop()
+            self.logger.debug("%s took %.1f ms", name, current.duration_ms)
+
+    @contextmanager
+    def resume(self, span: Span):
+        """Continue an existing span on this thread, e.g. an operation begun on another thread"""
+        stack = self._stack()
+        stack.append(span)
+        try:
+            yield span
+        finally:
+            span.end_ns = time.perf_counter_ns()
+            stack.pop()
+
+    def operation(self, name: str, **args):
+        """Start a top-level operation such as Load or Save"""
+        return self.span(name, category="operation", **args)
+
+    @property
+    def last_operation(self) -> Optional[Span]:
+        with self._lock:
+            return self.operations[-1] if self.operations else None
+
+    def summarize(self, span: Optional[Span] = None, max_children: int = 4) -> str:
+        """Format an operation and its slowest direct children for the status bar"""
+        span = span or self.last_operation
+        if span is None:
+            return ""
+        slowest = sorted(span.children, key=lambda child: child.duration_ms, reverse=True)[:max_children]
+        details = ", ".join(f"{child.name} {child.duration_ms:.0f}ms" for child in slowest)
+        summary = f"{span.name}: {span.duration_ms:.0f}ms"
+        return f"{summary} ({details})" if details else summary
+
+    def clear(self) -> None:
+        with self._lock:
+            self.operations.clear()
+
+    def _iter_spans(self, spans: List[Span]):
+        for span in spans:
+            yield span
+            yield from self._iter_spans(span.children)
+
+    def _to_us(self, ns: int) -> float:
+        return (ns - self._epoch_ns) / 1000
+
+    def export_chrome_trace(self, file_path: Path) -> None:
+        """Write all recorded operations in Chrome trace-event format (chrome://tracing, Perfetto)"""
+        with self._lock:
+            operations = list(self.operations)
+        events = []
+        for span in self._iter_spans(operations):
+            if span.end_ns is None:
+                continue
+            events.append({
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": self._to_us(span.start_ns),
+                "dur": (span.end_ns - span.start_ns) / 1000,
+                "pid": os.getpid(),
+                "tid": span.thread_id,
+                "args": {key: str(value) for key, value in span.args.items()},
+            })
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        self.logger.debug("Exported %d trace events to %s", len(events), file_path)
+
+    def export_speedscope(self, file_path: Path) -> None:
+        """Write all recorded operations as a Speedscope evented profile (one profile per thread)"""
+        with self._lock:
+            operations = [span for span in self.operations if span.end_ns is not None]
+        frames: List[Dict[str, str]] = []
+        frame_index: Dict[str, int] = {}
+        profiles: Dict[int, Dict[str, Any]] = {}
+
+        def emit(span: Span, events: List[Dict[str, Any]]) -> None:
+            if span.name not in frame_index:
+                frame_index[span.name] = len(frames)
+                frames.append({"name": span.name})
+            frame = frame_index[span.name]
+            events.append({"type": "O", "frame": frame, "at": self._to_us(span.start_ns)})
+            for child in span.children:
+                if child.end_ns is not None:
+                    emit(child, events)
+            events.append({"type": "C", "frame": frame, "at": self._to_us(span.end_ns)})
+
+        for operation in operations:
+            profile = profiles.setdefault(operation.thread_id, {
+                "type": "evented",
+                "name": f"Thread {operation.thread_id}",
+                "unit": "microseconds",
+                "startValue": self._to_us(operation.start_ns),
+                "endValue": self._to_us(operation.end_ns),
+                "events": [],
+            })
+            profile["endValue"] = max(profile["endValue"], self._to_us(operation.end_ns))
+            emit(operation, profile["events"])
+
+        document = {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": list(profiles.values()),
+            "name": "Avatar Save Editor",
+            "exporter": "Avatar Save Editor timing",
+        }
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(document, f)
+        self.logger.debug("Exported %d operations to Speedscope file %s", len(operations), file_path)
+
+
+# Shared tracer used by the handlers and the main window
+tracer = Tracer()
+
+
+def span(name: str, category: str = "editor", **args):
+    """Shortcut for ``tracer.span`` on the shared tracer"""
+    return tracer.span(name, category, **args)
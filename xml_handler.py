@@ -1,10 +1,121 @@
 import os
+import re
 import xml.etree.ElementTree as ET
 from xml.dom import minidom
 from pathlib import Path
 from typing import Dict, Any, Optional
+from dataclasses import dataclass
 from io import BytesIO, StringIO
 import logging
+from timing import span
+from attribute_index import AttributeIndex
+
+
+class SaveSizeError(ValueError):
+    """The new XML does not fit between the header and the footer of the save"""
+
+    def __init__(self, xml_length: int, capacity: int):
+        self.xml_length = xml_length
+        self.capacity = capacity
+        self.over_budget = xml_length - capacity
+        super().__init__(f"Save data is {self.over_budget} bytes over budget "
+                         f"(XML is {xml_length} bytes, {capacity} bytes available)")
+
+
+@dataclass(frozen=True)
+class SaveRegionMap:
+    """
+    Layout of an Xbox 360 save container, found in one pass over the file:
+
+        [0, xml_start)              header, with the checksum at bytes 8..12
+        [xml_start, xml_end)        XML section
+        [xml_end, padding_end)      NUL padding following the XML
+        [padding_end, file_size)    footer
+    """
+    file_size: int
+    xml_start: int
+    xml_end: int
+    padding_end: int
+    stored_checksum: int
+    calculated_checksum: Optional[int] = None
+
+    CHECKSUM_START = 8
+    CHECKSUM_END = 12
+    START_MARKERS = [b'<Savegame', b'<SaveGame', b'<savegame']
+    END_MARKERS = [b'</Savegame>', b'</SaveGame>', b'</savegame>']
+    NUL_RUN = re.compile(rb'\x00*')
+
+    @classmethod
+    def scan(cls, data: bytes, with_checksum: bool = True) -> "SaveRegionMap":
+        """Locate every region; with_checksum also runs the (slow) checksum pass"""
+        xml_start = -1
+        for marker in cls.START_MARKERS:
+            xml_start = data.find(marker)
+            if xml_start != -1:
+                break
+        if xml_start == -1:
+            raise ValueError("Could not find start of XML data in save file")
+
+        xml_end = -1
+        for marker in cls.END_MARKERS:
+            xml_end = data.find(marker, xml_start)
+            if xml_end != -1:
+                xml_end += len(marker)
+                break
+        if xml_end == -1:
+            raise ValueError("Could not find end of XML data in save file")
+
+        return cls(
+            file_size=len(data),
+            xml_start=xml_start,
+            xml_end=xml_end,
+            padding_end=cls.NUL_RUN.match(data, xml_end).end(),
+            stored_checksum=int.from_bytes(data[cls.CHECKSUM_START:cls.CHECKSUM_END], byteorder='little'),
+            calculated_checksum=XMLHandler.calculate_checksum(data) if with_checksum else None,
+        )
+
+    @property
+    def header(self) -> tuple[int, int]:
+        return 0, self.xml_start
+
+    @property
+    def checksum_field(self) -> tuple[int, int]:
+        return self.CHECKSUM_START, self.CHECKSUM_END
+
+    @property
+    def xml_span(self) -> tuple[int, int]:
+        return self.xml_start, self.xml_end
+
+    @property
+    def padding(self) -> tuple[int, int]:
+        return self.xml_end, self.padding_end
+
+    @property
+    def footer(self) -> tuple[int, int]:
+        return self.padding_end, self.file_size
+
+    @property
+    def xml_length(self) -> int:
+        return self.xml_end - self.xml_start
+
+    @property
+    def free_padding(self) -> int:
+        """Bytes the XML can grow by without moving the footer"""
+        return self.padding_end - self.xml_end
+
+    @property
+    def xml_capacity(self) -> int:
+        """Largest XML section that fits between the header and the footer"""
+        return self.padding_end - self.xml_start
+
+    @property
+    def checksum_valid(self) -> bool:
+        return self.stored_checksum == self.calculated_checksum
+
+    @property
+    def expected_size(self) -> bool:
+        return self.file_size == XMLHandler.EXPECTED_FILE_SIZE
+
 
 class XMLHandler:
     """Streamlined version of XMLHandler with unified format detection but preserving Xbox 360 logic"""
@@ -18,6 +129,8 @@ class XMLHandler:
         return logging.getLogger('XMLHandler')
     
     
+    WRITE_BLOCK_SIZE = 4096
+    
     # PRESERVING ORIGINAL XBOX METHODS EXACTLY AS THEY ARE
     @staticmethod
     def find_padding_sections(data: bytes) -> list[tuple[int, int]]:
@@ -99,14 +212,24 @@ class XMLHandler:
             raise
 
     @staticmethod
-    def load_xml_tree(file_path: Path) -> tuple[ET.ElementTree, int, int]:
+    def load_xml_tree(file_path: Path, region_map: Optional[SaveRegionMap] = None) -> tuple[ET.ElementTree, int, int]:
         logger = XMLHandler.get_logger()
-        logger.debug(f"Loading XML tree from file: {file_path}")
+        logger.debug("Loading XML tree from file: %s", file_path)
         
         try:
-            with open(file_path, 'rb') as f:
-                data = f.read()
-                logger.debug(f"Read {len(data)} bytes from file")
+            with span("XMLHandler.read"):
+                with open(file_path, 'rb') as f:
+                    data = f.read()
+                    logger.debug("Read %d bytes from file", len(data))
+            
+            # A region map from the loader already knows where the XML is
+            if region_map is not None and region_map.file_size == len(data):
+                try:
+                    with span("XMLHandler.parse"):
+                        root = ET.fromstring(data[region_map.xml_start:region_map.xml_end])
+                    return ET.ElementTree(root), region_map.xml_start, len(data)
+                except ET.ParseError as parse_error:
+                    logger.debug("Region map XML span did not parse: %s", parse_error)
             
             # Xbox 360 format extraction (existing code)
             # Try multiple decoding methods
@@ -115,27 +238,31 @@ class XMLHandler:
             for encoding in encoding_attempts:
                 try:
                     # Try to decode with current encoding
-                    decoded_data = data.decode(encoding, errors='ignore')
+                    with span("XMLHandler.decode", encoding=encoding):
+                        decoded_data = data.decode(encoding, errors='ignore')
                     
                     # Try to find XML markers more flexibly
                     start_markers = ['<Savegame', '<SaveGame', 'Savegame']
                     for marker in start_markers:
-                        start_pos = decoded_data.find(marker)
+                        with span("XMLHandler.locate"):
+                            start_pos = decoded_data.find(marker)
                         if start_pos != -1:
                             # Extract XML content
                             end_markers = ['</Savegame>', '</SaveGame>', 'Savegame>']
                             for end_marker in end_markers:
-                                end_pos = decoded_data.find(end_marker, start_pos)
+                                with span("XMLHandler.locate"):
+                                    end_pos = decoded_data.find(end_marker, start_pos)
                                 if end_pos != -1:
                                     xml_content = decoded_data[start_pos:end_pos + len(end_marker)]
                                     
                                     # Parse the XML
-                                    root = ET.fromstring(xml_content)
-                                    tree = ET.ElementTree(root)
+                                    with span("XMLHandler.parse"):
+                                        root = ET.fromstring(xml_content)
+                                        tree = ET.ElementTree(root)
                                     
                                     return tree, start_pos, len(data)
                 except Exception as parse_error:
-                    logger.debug(f"Failed to parse with {encoding} encoding: {parse_error}")
+                    logger.debug("Failed to parse with %s encoding: %s", encoding, parse_error)
                     continue
             
             # If all attempts fail, use the fallback extraction method
@@ -150,45 +277,36 @@ class XMLHandler:
     
     @staticmethod
     def calculate_checksum(data: bytes) -> int:
-        """Calculate checksum for the save data with extensive debugging and verification"""
+        """Calculate checksum for the save data (rotate-right-by-1 and add, skipping bytes 8..12)"""
         logger = XMLHandler.get_logger()
-        logger.debug("Calculating checksum with strict verification")
+        trace = logger.isEnabledFor(logging.DEBUG)
+        if trace:
+            logger.debug("Calculating checksum over %d bytes", len(data))
         try:
             # Initialize with specific seed value
             checksum = 0x14D
             
-            # Log the initial seed
-            logger.debug(f"Initial checksum seed: {hex(checksum)}")
-            
-            # Create a mutable copy of the checksum bytes
-            data_copy = bytearray(data)
-            
-            # Restore original checksum bytes to ensure exact reproduction
-            data_copy[8:12] = data[8:12]
-            
-            # Process all bytes except checksum bytes
-            for i in range(len(data_copy)):
-                if i < 8 or i >= 12:  # Skip checksum bytes
-                    # Rotate right by 1 and add byte value
-                    previous_checksum = checksum
-                    checksum = ((checksum >> 1) | (checksum << 31)) & 0xFFFFFFFF
-                    checksum = (checksum + data_copy[i]) & 0xFFFFFFFF
-                    
-                    # Log detailed transformations
-                    if i < 32:
-                        logger.debug(f"Byte {i}: Value {data_copy[i]} "
-                                    f"Previous Checksum {hex(previous_checksum)} "
-                                    f"New Checksum {hex(checksum)}")
+            # Process all bytes except checksum bytes (8-11)
+            for i, value in enumerate(data):
+                if 8 <= i < 12:
+                    continue
+                # Rotate right by 1 and add byte value
+                checksum = (((checksum >> 1) | (checksum << 31)) + value) & 0xFFFFFFFF
+                
+                # Log the first transformations only when DEBUG is actually enabled
+                if trace and i < 32:
+                    logger.debug("Byte %d: Value %d New Checksum %#x", i, value, checksum)
             
-            logger.debug(f"Final calculated checksum: {hex(checksum)}")
+            if trace:
+                logger.debug("Final calculated checksum: %#x", checksum)
             return checksum
             
         except Exception as e:
-            logger.error(f"Error calculating checksum: {str(e)}", exc_info=True)
+            logger.error("Error calculating checksum: %s", e, exc_info=True)
             raise
 
     @staticmethod
-    def verify_checksum(data: bytes) -> bool:
+    def verify_checksum(data: bytes, region_map: Optional[SaveRegionMap] = None) -> bool:
         """Verify if save file checksum is valid with comprehensive diagnostics"""
         logger = XMLHandler.get_logger()
         logger.debug("Verifying checksum")
@@ -207,11 +325,14 @@ class XMLHandler:
 
             original_checksum_bytes = data[8:12]
             original_checksum = int.from_bytes(original_checksum_bytes, byteorder='little')
-            logger.debug(f"Original checksum bytes (hex): {original_checksum_bytes.hex()}")
-            logger.debug(f"Original checksum (hex): {hex(original_checksum)}")
+            logger.debug("Original checksum bytes (hex): %s", original_checksum_bytes.hex())
+            logger.debug("Original checksum (hex): %#x", original_checksum)
 
-            # Calculate new checksum
-            calculated_checksum = XMLHandler.calculate_checksum(data)
+            # Calculate new checksum (already done if the region map was scanned)
+            if region_map is not None and region_map.calculated_checksum is not None:
+                calculated_checksum = region_map.calculated_checksum
+            else:
+                calculated_checksum = XMLHandler.calculate_checksum(data)
             
             # More detailed checksum comparison
             if original_checksum != calculated_checksum:
@@ -249,13 +370,109 @@ class XMLHandler:
             # Update checksum in header (bytes 8-11)
             updated_data[8:12] = new_checksum.to_bytes(4, byteorder='little')
             
-            logger.debug(f"Updated checksum to: {hex(new_checksum)}")
+            logger.debug("Updated checksum to: %#x", new_checksum)
             return bytes(updated_data)
                 
         except Exception as e:
             logger.error(f"Error updating checksum: {str(e)}", exc_info=True)
             raise
 
+    @staticmethod
+    def build_output(tree: ET.ElementTree, original_data: bytes,
+                     region_map: Optional[SaveRegionMap] = None) -> bytes:
+        """
+        Build the complete file contents for the tree, keeping the original
+        binary header and footer around the new XML section.
+        
+        The XML grows into (or shrinks back out of) the NUL padding after it, so
+        the file size and the footer offset never change. Raises SaveSizeError
+        when the XML no longer fits.
+        """
+        logger = XMLHandler.get_logger()
+        
+        # XML section boundaries, from the load-time region map when available
+        region_map = region_map or SaveRegionMap.scan(original_data, with_checksum=False)
+        xml_start, xml_end = region_map.xml_span
+        
+        # Generate new XML content
+        xml_buffer = BytesIO()
+        tree.write(xml_buffer, encoding='utf-8', xml_declaration=False)
+        new_xml = xml_buffer.getvalue()
+        
+        logger.debug("Original XML section: %d to %d, length %d", xml_start, xml_end, xml_end - xml_start)
+        logger.debug("New XML length: %d", len(new_xml))
+        
+        if len(new_xml) > region_map.xml_capacity:
+            raise SaveSizeError(len(new_xml), region_map.xml_capacity)
+        
+        # Preserve everything outside the XML section and its padding
+        header = original_data[:xml_start]
+        padding = b'\x00' * (region_map.xml_capacity - len(new_xml))
+        footer = original_data[region_map.padding_end:]
+        
+        # Create updated data with preserved header and footer
+        return header + new_xml + padding + footer
+
+    @staticmethod
+    def patch_output(original_data: bytes, patches: list[tuple[int, bytes]],
+                     region_map: Optional[SaveRegionMap] = None) -> bytes:
+        """
+        Apply same-length byte patches (from AttributeIndex.diff) to the original file.
+        The header checksum is recomputed only if the original one was valid.
+        """
+        logger = XMLHandler.get_logger()
+        
+        with span("XMLHandler.patch", patches=len(patches)):
+            updated_data = AttributeIndex.apply(original_data, patches)
+        
+        if region_map is None or region_map.calculated_checksum is None:
+            region_map = SaveRegionMap.scan(original_data)
+        with span("XMLHandler.checksum"):
+            checksum_was_valid = region_map.checksum_valid
+            if checksum_was_valid:
+                updated_data = XMLHandler.update_checksum(updated_data)
+        logger.debug("Patched %d attribute values in place (checksum %s)", len(patches),
+                     "updated" if checksum_was_valid else "left as is")
+        return updated_data
+
+    @staticmethod
+    def write_output(file_path: Path, output_data: bytes, original_data: Optional[bytes] = None) -> None:
+        """
+        Write file contents produced by build_output. When the file on disk still
+        holds original_data of the same size, only the blocks that differ are
+        rewritten in place.
+        """
+        logger = XMLHandler.get_logger()
+        
+        if original_data is None or len(original_data) != len(output_data):
+            with open(file_path, 'wb') as f:
+                f.write(output_data)
+            return
+        
+        ranges = XMLHandler.changed_ranges(original_data, output_data)
+        with open(file_path, 'r+b') as f:
+            for start, end in ranges:
+                f.seek(start)
+                f.write(output_data[start:end])
+        logger.debug("Rewrote %d bytes in %d range(s) of %s", sum(end - start for start, end in ranges),
+                     len(ranges), file_path.name)
+    
+    @staticmethod
+    def changed_ranges(original_data: bytes, output_data: bytes) -> list[tuple[int, int]]:
+        """Merged (start, end) ranges of the WRITE_BLOCK_SIZE blocks that differ"""
+        block = XMLHandler.WRITE_BLOCK_SIZE
+        original_view, output_view = memoryview(original_data), memoryview(output_data)
+        ranges = []
+        for start in range(0, len(output_data), block):
+            end = min(start + block, len(output_data))
+            if original_view[start:end] == output_view[start:end]:
+                continue
+            if ranges and ranges[-1][1] == start:
+                ranges[-1] = (ranges[-1][0], end)
+            else:
+                ranges.append((start, end))
+        return ranges
+
     @staticmethod
     def save_xml_tree(tree: ET.ElementTree, file_path: Path, create_backup: bool = True) -> None:
         """
@@ -267,7 +484,7 @@ class XMLHandler:
             create_backup (bool): Whether to create a backup of the original file
         """
         logger = XMLHandler.get_logger()
-        logger.debug(f"Saving XML tree to file: {file_path}")
+        logger.debug("Saving XML tree to file: %s", file_path)
         
         try:
             # Read original file
@@ -282,47 +499,11 @@ class XMLHandler:
                     with open(backup_path, 'wb') as dst:
                         dst.write(original_data)
 
-            # Find the XML section boundaries - very carefully
-            xml_start = -1
-            xml_end = -1
-            
-            for marker in [b'<Savegame', b'<SaveGame', b'<savegame']:
-                xml_start = original_data.find(marker)
-                if xml_start != -1:
-                    logger.debug(f"Found XML start marker at position {xml_start}")
-                    break
-            
-            if xml_start == -1:
-                raise ValueError("Could not find start of XML data in save file")
-                
-            for marker in [b'</Savegame>', b'</SaveGame>', b'</savegame>']:
-                xml_end = original_data.find(marker)
-                if xml_end != -1:
-                    xml_end += len(marker)
-                    logger.debug(f"Found XML end marker at position {xml_end}")
-                    break
-            
-            if xml_end == -1:
-                raise ValueError("Could not find end of XML data in save file")
-            
-            # Generate new XML content
-            xml_buffer = BytesIO()
-            tree.write(xml_buffer, encoding='utf-8', xml_declaration=False)
-            new_xml = xml_buffer.getvalue()
-            
-            logger.debug(f"Original XML section: {xml_start} to {xml_end}, length {xml_end - xml_start}")
-            logger.debug(f"New XML length: {len(new_xml)}")
-            
-            # Preserve everything outside the XML section
-            header = original_data[:xml_start]
-            footer = original_data[xml_end:]
-            
-            # Create updated data with preserved header and footer
-            updated_data = header + new_xml + footer
+            region_map = SaveRegionMap.scan(original_data, with_checksum=False)
+            updated_data = XMLHandler.build_output(tree, original_data, region_map)
             
             # Write the updated file - no checksum updates
-            with open(file_path, 'wb') as f:
-                f.write(updated_data)
+            XMLHandler.write_output(file_path, updated_data, original_data)
             
             logger.debug(f"Saved file with preserved binary header and footer")
             
@@ -332,32 +513,16 @@ class XMLHandler:
 
     # Keep all remaining Xbox 360 methods exactly as they are
     @staticmethod
-    def preserve_xml_structure(original_data: bytearray, new_xml: bytes) -> bytearray:
+    def preserve_xml_structure(original_data: bytearray, new_xml: bytes,
+                               region_map: Optional[SaveRegionMap] = None) -> bytearray:
         """
         Preserve the original file structure when writing new XML
         """
         logger = XMLHandler.get_logger()
         
         try:
-            # Find start and end positions
-            original_start = -1
-            original_end = -1
-            
-            # Look for XML start marker
-            for marker in [b'<Savegame', b'<SaveGame', b'<savegame']:
-                original_start = original_data.find(marker)
-                if original_start != -1:
-                    break
-            
-            # Look for XML end marker
-            for marker in [b'</Savegame>', b'</SaveGame>', b'</savegame>']:
-                original_end = original_data.rfind(marker)
-                if original_end != -1:
-                    original_end += len(marker)
-                    break
-
-            if original_start == -1 or original_end == -1:
-                raise ValueError("Could not find XML markers")
+            region_map = region_map or SaveRegionMap.scan(bytes(original_data), with_checksum=False)
+            original_start, original_end = region_map.xml_span
 
             # Create copy of original data
             updated_data = bytearray(original_data)
@@ -1,10 +1,12 @@
 import tkinter as tk
-from tkinter import ttk, font
+from tkinter import ttk, font, filedialog
 import xml.etree.ElementTree as ET
 from xml.dom import minidom
 from io import StringIO
 import os
 import logging
+from task_scheduler import TaskScheduler, run_task, populate_treeview
+from save_diff import diff_trees, parse_save_xml, count_changes
 from custom_messagebox import MessageBoxManager, show_info, show_error, show_warning, ask_question, ask_ok_cancel, show_success
 
 
@@ -25,6 +27,12 @@ class XMLViewerWindow:
             self.logger.error(f"Failed to set XML Viewer icon: {str(e)}")
         
         self.current_tree = None
+        self.item_elements = {}  # Treeview item ID -> ET.Element
+        self.element_items = {}  # id(ET.Element) -> Treeview item ID
+        self.diff_frame = None  # Compare pane, created on first compare
+        self.diff_changes = []  # Changes listed in the compare pane, in row order
+        self.scheduler = TaskScheduler(self.window)
+        self.window.bind("<Destroy>", self._on_destroy, add="+")
         self.search_var = tk.StringVar()
         self.search_matches = []  # Store all search match positions
         self.current_match_index = -1  # Current match being viewed
@@ -258,6 +266,7 @@ class XMLViewerWindow:
         """Create footer with action buttons"""
         footer_frame = ttk.Frame(self.main_container)
         footer_frame.pack(fill=tk.X, pady=(15, 0))
+        self.footer_frame = footer_frame
         
         # Left side - Info
         info_frame = ttk.Frame(footer_frame)
@@ -277,9 +286,89 @@ class XMLViewerWindow:
                   command=self.expand_all_sections).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(button_frame, text="📁 Collapse All", 
                   command=self.collapse_all_sections).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="⇄ Compare...", 
+                  command=self.compare_with_file).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="❌ Close", 
                   command=self.window.destroy).pack(side=tk.LEFT, padx=(5, 0))
 
+    def create_compare_pane(self):
+        """Create the differences list shown below the structure and content"""
+        self.diff_frame = ttk.LabelFrame(self.main_container, text="⇄ Differences", padding=10)
+        self.diff_frame.pack(fill=tk.X, pady=(15, 0), before=self.footer_frame)
+        
+        columns = ("change", "path", "old", "new")
+        self.diff_tree = ttk.Treeview(self.diff_frame, columns=columns, show="headings", height=8)
+        for column, heading, width in (("change", "Change", 90), ("path", "Path", 700),
+                                       ("old", "Current", 200), ("new", "Compared", 200)):
+            self.diff_tree.heading(column, text=heading)
+            self.diff_tree.column(column, width=width, minwidth=50)
+        diff_scroll = ttk.Scrollbar(self.diff_frame, orient="vertical", command=self.diff_tree.yview)
+        self.diff_tree.configure(yscrollcommand=diff_scroll.set)
+        self.diff_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        diff_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        self.diff_tree.bind("<Double-1>", self._on_diff_select)
+        
+        ttk.Button(self.diff_frame, text="✖", width=3, 
+                  command=self.close_compare_pane).pack(side=tk.RIGHT, anchor=tk.N, padx=(5, 0))
+
+    def close_compare_pane(self):
+        if self.diff_frame is not None:
+            self.scheduler.cancel("diff")
+            self.diff_frame.destroy()
+            self.diff_frame = None
+            self.diff_changes = []
+
+    def compare_with_file(self):
+        """Diff the viewed save against another save file and list the differences"""
+        if not self.current_tree:
+            show_error("Error", "No XML data loaded to compare.")
+            return
+        file_path = filedialog.askopenfilename(
+            parent=self.window, title="Compare with save",
+            filetypes=[("Save files", "*.sav SAVEDATA.000"), ("All files", "*.*")]
+        )
+        if not file_path:
+            return
+        
+        try:
+            with open(file_path, 'rb') as f:
+                other_root = parse_save_xml(f.read())
+            self.diff_changes = diff_trees(self.current_tree.getroot(), other_root)
+        except Exception as e:
+            self.logger.error(f"Error comparing with {file_path}: {str(e)}")
+            show_error("Error", f"Failed to compare saves: {str(e)}")
+            return
+        
+        if self.diff_frame is None:
+            self.create_compare_pane()
+        labels = {'attribute': "Attribute", 'text': "Text", 'added': "Added", 'removed': "Removed"}
+        rows = []
+        for change in self.diff_changes:
+            path = f"{change.path}/@{change.name}" if change.kind == 'attribute' else change.path
+            old = "" if change.old is None else change.old
+            new = "" if change.new is None else change.new
+            rows.append(((labels[change.kind], path, old, new), ()))
+        populate_treeview(self.scheduler, "diff", self.diff_tree, rows)
+        
+        counts = count_changes(self.diff_changes)
+        self.diff_frame.config(
+            text=f"⇄ Differences with {os.path.basename(file_path)}: {counts['attribute']} attributes, "
+                 f"{counts['text']} texts, {counts['added']} added, {counts['removed']} removed"
+        )
+
+    def _on_diff_select(self, event):
+        """Select the element a difference is at in the structure tree"""
+        item = self.diff_tree.focus()
+        if not item:
+            return
+        element = self.diff_changes[self.diff_tree.index(item)].element
+        tree_item = self.element_items.get(id(element))
+        if tree_item is None or self.item_elements.get(tree_item) is not element:
+            return
+        self._expand_to_item(tree_item)
+        self.sections_tree.selection_set(tree_item)
+        self.sections_tree.see(tree_item)
+
     def _configure_syntax_highlighting(self):
         """Configure comprehensive XML syntax highlighting like VS Code"""
         # Configure text tags for XML syntax highlighting with VS Code-like colors
@@ -299,6 +388,8 @@ class XMLViewerWindow:
         # Clear existing items
         for item in self.sections_tree.get_children():
             self.sections_tree.delete(item)
+        self.item_elements = {}
+        self.element_items = {}
         
         if not self.current_tree:
             self.stats_label.config(text="📊 No XML data loaded")
@@ -310,8 +401,13 @@ class XMLViewerWindow:
         # Update statistics
         self.stats_label.config(text=f"📊 Total Elements: {total_elements} | Root: {root.tag}")
         
-        # Populate tree structure
-        self._populate_xml_recursively(root)
+        # Populate tree structure in time-sliced chunks
+        run_task(self.scheduler, "sections", self._populate_xml_recursively(root))
+
+    def _on_destroy(self, event):
+        """Stop populating once the viewer window is closed"""
+        if event.widget is self.window:
+            self.scheduler.cancel_all()
 
     def _count_elements(self, element):
         """Count total number of elements in the XML tree"""
@@ -321,7 +417,7 @@ class XMLViewerWindow:
         return count
 
     def _populate_xml_recursively(self, element, parent_node=""):
-        """Recursively populate the sections tree with XML structure"""
+        """Recursively populate the sections tree with XML structure, yielding after each node"""
         # Generate element icon based on type
         element_icon = self._get_element_icon(element)
         
@@ -359,12 +455,13 @@ class XMLViewerWindow:
             node = self.sections_tree.insert("", "end", text=display_text, values=(details_str,))
         else:
             node = self.sections_tree.insert(parent_node, "end", text=display_text, values=(details_str,))
+        self.item_elements[node] = element
+        self.element_items[id(element)] = node
+        yield
         
         # Recursively process all child elements
         for child in element:
-            self._populate_xml_recursively(child, node)
-        
-        return node
+            yield from self._populate_xml_recursively(child, node)
 
     def _get_element_icon(self, element):
         """Get appropriate icon for XML element based on its characteristics"""
@@ -1031,45 +1128,7 @@ class XMLViewerWindow:
 
     def _get_element_by_tree_item(self, tree_item):
         """Get the XML element corresponding to a tree item"""
-        # Get the full details of the selected item
-        item_text = self.sections_tree.item(tree_item)["text"]
-        item_details = self.sections_tree.item(tree_item)["values"][0] if self.sections_tree.item(tree_item)["values"] else ""
-        
-        # Extract tag name from display text (remove icon)
-        tag_name = item_text.split(' ', 1)[-1] if ' ' in item_text else item_text
-        
-        def matches_element(element, text, details):
-            """Enhanced element matching"""
-            if element.tag != text:
-                return False
-            return True  # Simplified matching for now
-
-        # Build the path of items
-        path = []
-        current_item = tree_item
-        while current_item:
-            item_text = self.sections_tree.item(current_item)["text"]
-            tag_name = item_text.split(' ', 1)[-1] if ' ' in item_text else item_text
-            path.insert(0, tag_name)
-            current_item = self.sections_tree.parent(current_item)
-        
-        # Navigate to the selected element
-        current_elem = self.current_tree.getroot()
-        if len(path) == 1:  # Root element
-            return current_elem
-            
-        # Follow path to find the specific element
-        for tag in path[1:]:  # Skip root element
-            found = False
-            for child in current_elem:
-                if child.tag == tag:
-                    current_elem = child
-                    found = True
-                    break
-            if not found:
-                return None
-                
-        return current_elem
+        return self.item_elements.get(tree_item)
 
     def _on_search(self, event=None):
         """Legacy search method - now calls content search"""